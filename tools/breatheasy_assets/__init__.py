@@ -0,0 +1,9 @@
+"""
+BreathEasy icon asset pipeline
+Designs (heart, orb, app_icon), rasterizer backends, render cache and
+scheduler, PNG encoder, build graph, installer and the breatheasy-assets
+command line (cli). Modules import their heavy dependencies (NumPy,
+cairosvg, XML parsers) only inside the functions that need them.
+Design sources, caches and outputs are paths relative to the checkout root:
+the current directory, or the one given to breatheasy-assets --repo.
+"""
@@ -0,0 +1,5 @@
+"""python -m breatheasy_assets: the breatheasy-assets command line"""
+
+from .cli import run
+
+run()
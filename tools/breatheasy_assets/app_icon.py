@@ -0,0 +1,579 @@
+#!/usr/bin/env python3
+"""
+App Icon Generator for BreathEasy
+Generates all required iOS app icon sizes from SVG design
+"""
+
+import argparse
+import os
+import sys
+
+from .build import BuildGraph, source_hash, write_text
+from .encoder import add_encoder_arguments, settings_from_args
+from .rasterizers import BACKENDS
+from .sizes import APPICON_PATH, APPLE_ICON_SIZES, build_contents, select_sizes
+from .tracing import add_trace_arguments, stage, tracing
+
+LOTUS_PETAL = "M0,-80 C-30,-60 -30,-30 0,-20 C30,-30 30,-60 0,-80 Z"
+
+def _lotus(petals, fill):
+    """Petal paths of a lotus with the given number of evenly rotated petals"""
+    return ''.join(f'<path d="{LOTUS_PETAL}" fill="{fill}" transform="rotate({angle})" />'
+                   for angle in range(0, 360, 360 // petals))
+
+_PREVIEW_BACKGROUND = '''
+    <radialGradient id="bg" cx="50%" cy="30%" r="70%">
+        <stop offset="0%" style="stop-color:$softSkyBlue;stop-opacity:1" />
+        <stop offset="50%" style="stop-color:$oceanTeal;stop-opacity:1" />
+        <stop offset="100%" style="stop-color:$sageGreen;stop-opacity:1" />
+    </radialGradient>'''
+
+_PREVIEW_ORB = '''
+    <radialGradient id="orb" cx="50%" cy="50%" r="50%">
+        <stop offset="0%" style="stop-color:#FFFFFF;stop-opacity:0.9" />
+        <stop offset="30%" style="stop-color:$lavenderMist;stop-opacity:0.7" />
+        <stop offset="70%" style="stop-color:$softSkyBlue;stop-opacity:0.5" />
+        <stop offset="100%" style="stop-color:$oceanTeal;stop-opacity:0.3" />
+    </radialGradient>
+    <linearGradient id="lotus" x1="0%" y1="0%" x2="100%" y2="100%">
+        <stop offset="0%" style="stop-color:#FFFFFF;stop-opacity:0.95" />
+        <stop offset="50%" style="stop-color:$lavenderMist;stop-opacity:0.8" />
+        <stop offset="100%" style="stop-color:$softSkyBlue;stop-opacity:0.6" />
+    </linearGradient>'''
+
+# Preview designs at decreasing detail: (label, nominal size, tile px, SVG template)
+PREVIEW_DESIGNS = [
+    ('App Store', '1024×1024', 120, f'''<svg viewBox="0 0 1024 1024" xmlns="http://www.w3.org/2000/svg">
+<defs>{_PREVIEW_BACKGROUND}{_PREVIEW_ORB}</defs>
+<rect width="1024" height="1024" rx="180" ry="180" fill="url(#bg)" />
+<circle cx="512" cy="512" r="280" fill="url(#orb)" opacity="0.6" />
+<circle cx="512" cy="512" r="240" fill="url(#orb)" opacity="0.8" />
+<g transform="translate(512,512)">
+    {_lotus(8, 'url(#lotus)')}
+    <circle cx="0" cy="0" r="25" fill="#FFFFFF" opacity="0.9" />
+    <circle cx="0" cy="0" r="18" fill="url(#lotus)" opacity="0.8" />
+</g>
+<circle cx="512" cy="512" r="180" fill="none" stroke="#FFFFFF" stroke-width="3" opacity="0.3" />
+<circle cx="512" cy="512" r="140" fill="none" stroke="$lavenderMist" stroke-width="2" opacity="0.4" />
+<circle cx="512" cy="512" r="100" fill="none" stroke="$softSkyBlue" stroke-width="2" opacity="0.5" />
+<ellipse cx="512" cy="350" rx="200" ry="80" fill="#FFFFFF" opacity="0.15" />
+</svg>'''),
+    ('Home Screen', '60×60', 80, f'''<svg viewBox="0 0 1024 1024" xmlns="http://www.w3.org/2000/svg">
+<defs>{_PREVIEW_BACKGROUND}{_PREVIEW_ORB}</defs>
+<rect width="1024" height="1024" rx="180" ry="180" fill="url(#bg)" />
+<circle cx="512" cy="512" r="280" fill="url(#orb)" opacity="0.6" />
+<circle cx="512" cy="512" r="240" fill="url(#orb)" opacity="0.8" />
+<g transform="translate(512,512)">
+    {_lotus(6, 'url(#lotus)')}
+    <circle cx="0" cy="0" r="25" fill="#FFFFFF" opacity="0.9" />
+    <circle cx="0" cy="0" r="18" fill="url(#lotus)" opacity="0.8" />
+</g>
+<circle cx="512" cy="512" r="180" fill="none" stroke="#FFFFFF" stroke-width="6" opacity="0.3" />
+<circle cx="512" cy="512" r="140" fill="none" stroke="$lavenderMist" stroke-width="4" opacity="0.4" />
+</svg>'''),
+    ('Settings', '29×29', 60, f'''<svg viewBox="0 0 1024 1024" xmlns="http://www.w3.org/2000/svg">
+<defs>{_PREVIEW_BACKGROUND}
+    <radialGradient id="orb" cx="50%" cy="50%" r="50%">
+        <stop offset="0%" style="stop-color:#FFFFFF;stop-opacity:0.9" />
+        <stop offset="70%" style="stop-color:$softSkyBlue;stop-opacity:0.5" />
+        <stop offset="100%" style="stop-color:$oceanTeal;stop-opacity:0.3" />
+    </radialGradient>
+</defs>
+<rect width="1024" height="1024" rx="180" ry="180" fill="url(#bg)" />
+<circle cx="512" cy="512" r="280" fill="url(#orb)" opacity="0.8" />
+<g transform="translate(512,512)">
+    <circle cx="0" cy="0" r="120" fill="#FFFFFF" opacity="0.7" />
+    <circle cx="0" cy="0" r="80" fill="$lavenderMist" opacity="0.6" />
+    <circle cx="0" cy="0" r="40" fill="#FFFFFF" opacity="0.9" />
+</g>
+<circle cx="512" cy="512" r="200" fill="none" stroke="#FFFFFF" stroke-width="8" opacity="0.4" />
+</svg>'''),
+]
+
+def create_app_icon_html_preview(thumbnails=False, backend_name=None):
+    """Create an HTML file to preview the app icon design
+
+    The tiles share one sprite of gradients and symbols (or are cached PNG
+    thumbnails), so the page carries each definition once.
+    """
+    from string import Template
+
+    from .cache import RenderCache
+    from .preview import icon_tiles
+    from .tokens import resolve
+
+    svgs = [resolve(template) for _, _, _, template in PREVIEW_DESIGNS]
+    sizes = [tile for _, _, tile, _ in PREVIEW_DESIGNS]
+    labels = [label for label, _, _, _ in PREVIEW_DESIGNS]
+    sprite, tiles = icon_tiles(svgs, sizes, labels, thumbnails, backend_name,
+                               RenderCache() if thumbnails else None)
+    items = ''.join(f'''
+        <div class="icon-item">
+            <div class="icon-display" style="width: {tile}px; height: {tile}px;">{markup}</div>
+            <div class="icon-label">{label}</div>
+            <div class="icon-size">{size}</div>
+        </div>''' for (label, size, tile, _), markup in zip(PREVIEW_DESIGNS, tiles))
+
+    html_content = Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>BreathEasy App Icon Preview</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+            margin: 0;
+            padding: 40px;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+            min-height: 100vh;
+        }
+        
+        .header {
+            text-align: center;
+            margin-bottom: 40px;
+        }
+        
+        .header h1 {
+            color: #2C3E50;
+            font-size: 2.5rem;
+            margin-bottom: 10px;
+            font-weight: 300;
+        }
+        
+        .header p {
+            color: #5A6C7D;
+            font-size: 1.1rem;
+            margin: 0;
+        }
+        
+        .icon-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 30px;
+            max-width: 1200px;
+            width: 100%;
+        }
+        
+        .icon-item {
+            background: white;
+            border-radius: 20px;
+            padding: 30px;
+            text-align: center;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+            transition: transform 0.3s ease;
+        }
+        
+        .icon-item:hover {
+            transform: translateY(-5px);
+        }
+        
+        .icon-display {
+            width: 120px;
+            height: 120px;
+            margin: 0 auto 20px;
+            border-radius: 22px;
+            overflow: hidden;
+            box-shadow: 0 6px 20px rgba(0,0,0,0.15);
+        }
+        
+        .icon-display svg {
+            width: 100%;
+            height: 100%;
+        }
+        
+        .icon-label {
+            font-size: 1.1rem;
+            font-weight: 600;
+            color: #2C3E50;
+            margin-bottom: 5px;
+        }
+        
+        .icon-size {
+            font-size: 0.9rem;
+            color: #7F8C8D;
+        }
+        
+        .design-info {
+            background: white;
+            border-radius: 15px;
+            padding: 30px;
+            margin-top: 40px;
+            max-width: 800px;
+            width: 100%;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+        }
+        
+        .design-info h2 {
+            color: #2C3E50;
+            margin-top: 0;
+            margin-bottom: 20px;
+        }
+        
+        .design-features {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+            gap: 20px;
+            margin-top: 20px;
+        }
+        
+        .feature {
+            padding: 15px;
+            background: #F8F9FA;
+            border-radius: 10px;
+            border-left: 4px solid #A7C7E7;
+        }
+        
+        .feature h3 {
+            margin: 0 0 8px 0;
+            color: #2C3E50;
+            font-size: 1rem;
+        }
+        
+        .feature p {
+            margin: 0;
+            color: #5A6C7D;
+            font-size: 0.9rem;
+            line-height: 1.4;
+        }
+    </style>
+</head>
+<body>
+    $sprite
+    <div class="header">
+        <h1>🍃 BreathEasy App Icon</h1>
+        <p>Zen-inspired design with breathing symbolism</p>
+    </div>
+    
+    <div class="icon-grid">$tiles
+    </div>
+    
+    <div class="design-info">
+        <h2>🎨 Design Philosophy</h2>
+        <p>The BreathEasy app icon embodies the core principles of mindfulness and tranquility. Each element is carefully crafted to evoke a sense of calm and inspire breathing practice.</p>
+        
+        <div class="design-features">
+            <div class="feature">
+                <h3>🌸 Lotus Symbol</h3>
+                <p>Eight-petaled lotus represents spiritual awakening, purity, and the journey from chaos to enlightenment through breath.</p>
+            </div>
+            
+            <div class="feature">
+                <h3>🌊 Breathing Orb</h3>
+                <p>Central orb with radiating rings symbolizes the expansion and contraction of breath, creating visual rhythm.</p>
+            </div>
+            
+            <div class="feature">
+                <h3>🎨 Serenity Colors</h3>
+                <p>Nature-inspired gradient from soft sky blue to sage green promotes psychological calm and reduces stress.</p>
+            </div>
+            
+            <div class="feature">
+                <h3>✨ Zen Particles</h3>
+                <p>Floating elements create atmosphere of peace and mindfulness, suggesting the flow of vital energy.</p>
+            </div>
+            
+            <div class="feature">
+                <h3>🔮 Radial Harmony</h3>
+                <p>Circular composition with golden ratio proportions creates visual balance and natural aesthetic appeal.</p>
+            </div>
+            
+            <div class="feature">
+                <h3>🌟 Light & Shadow</h3>
+                <p>Subtle gradients and glows create depth while maintaining iOS design guidelines for clarity and recognition.</p>
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+    """).substitute(sprite=sprite, tiles=items)
+    
+    write_text('app-icon-preview.html', html_content)
+    
+    print("✅ Created app icon preview: app-icon-preview.html")
+
+def installed_contents(sizes=APPLE_ICON_SIZES, appicon_path=APPICON_PATH):
+    """Contents.json for the icon size table, listing only the images present in the icon set"""
+    contents = build_contents(sizes)
+    contents['images'] = [image for image in contents['images']
+                          if os.path.exists(os.path.join(appicon_path, image['filename']))]
+    return contents
+
+def update_app_icon_contents(sizes=APPLE_ICON_SIZES, appicon_path=APPICON_PATH):
+    """Update the Contents.json file for AppIcon.appiconset from the icons it holds"""
+    contents_json = installed_contents(sizes, appicon_path)
+    
+    import json
+    contents_path = os.path.join(appicon_path, "Contents.json")
+    
+    write_text(contents_path, json.dumps(contents_json, indent=2))
+    
+    print(f"✅ Updated AppIcon.appiconset/Contents.json ({len(contents_json['images'])} images)")
+
+def generate_icon_matrix(svg_file, sizes=APPLE_ICON_SIZES, appicon_path=APPICON_PATH,
+                         master_size=1024, backend_name=None, encoder_settings=None):
+    """Render the SVG once at master_size, downscale it to every icon size and
+    install the PNGs together with a matching Contents.json in one atomic swap
+    (encoder_settings runs the size-optimizing encode stage on every PNG)"""
+    from importlib.util import find_spec
+
+    from .rasterizers import RasterizerError, get_rasterizer
+    
+    if not os.path.exists(svg_file):
+        print(f"❌ SVG file not found: {svg_file}")
+        return False
+    
+    # Downscaling and encoding need numpy; without it or a rasterizer, fall back to
+    # the preview and instructions with a Contents.json for the icons already installed
+    try:
+        if find_spec('numpy') is None:
+            raise RasterizerError("numpy not installed")
+        backend = get_rasterizer(backend_name)
+    except RasterizerError as e:
+        if backend_name is not None:
+            print(f"❌ {e}")
+            return False
+        print(f"⚠️  Skipping the icon size matrix ({e}); see app-icon-instructions.md")
+        update_app_icon_contents(sizes, appicon_path)
+        return True
+    
+    from .install import install_appiconset
+    from .png import encode_png, flatten
+    from .sizes import downscale_chain
+    from .svg_optimize import optimize_svg
+    
+    with open(svg_file, 'rb') as f:
+        svg_data = f.read()
+    
+    try:
+        with stage('render master', size=master_size):
+            master = backend.render_rgba(optimize_svg(svg_data), master_size, master_size)
+    except (RasterizerError, ValueError) as e:
+        print(f"❌ {e}")
+        return False
+    print(f"✅ Rendered {svg_file} once at {master_size}×{master_size} ({backend.name})")
+    
+    with stage('downscale', sizes=len(sizes)):
+        scaled = downscale_chain(master, [size.pixels for size in sizes])
+        # The marketing images are flattened so they encode without an alpha channel
+        images = {size.filename: flatten(scaled[size.pixels]) if size.marketing else scaled[size.pixels]
+                  for size in sizes}
+    with stage('encode', optimize=encoder_settings is not None):
+        if encoder_settings is None:
+            files = {filename: encode_png(rgba) for filename, rgba in images.items()}
+        else:
+            from .encoder import ByteBudgetError, optimize_png
+            
+            files = {}
+            for size in sizes:
+                try:
+                    files[size.filename] = optimize_png(images[size.filename], encoder_settings).data
+                except ByteBudgetError as e:
+                    print(f"❌ {size.filename}: {e}")
+            if len(files) < len(sizes):
+                return False
+            print(f"🗜️  Optimized {len(files)} PNGs to {sum(map(len, files.values())):,} bytes")
+    try:
+        with stage('install', files=len(files)):
+            install_appiconset(appicon_path, files, contents=build_contents(sizes))
+    except OSError as e:
+        print(f"❌ Failed to install icons: {e}")
+        return False
+    print(f"✅ Installed {len(sizes)} icon sizes and Contents.json into AppIcon.appiconset "
+          f"({min(s.pixels for s in sizes)}–{max(s.pixels for s in sizes)} px)")
+    return True
+
+def create_icon_generation_instructions():
+    """Create instructions for generating icon files"""
+    instructions = """
+# BreathEasy App Icon Generation Instructions
+
+## Overview
+The app icon has been designed with zen-inspired elements perfect for a breathing/mindfulness app:
+
+🌸 **Lotus Symbol**: Eight-petaled lotus for spiritual awakening
+🌊 **Breathing Orb**: Central breathing visualization with rings
+🎨 **Serenity Colors**: Nature-inspired calming gradient
+✨ **Zen Particles**: Floating elements for peaceful atmosphere
+
+## Files Created
+- `app-icon-design.svg` - Master SVG design file
+- `app-icon-preview.html` - Visual preview of the design
+- Updated `Contents.json` for iOS requirements
+
+## Required Sizes for iOS
+The following PNG files need to be generated from the SVG:
+
+### App Store & Universal
+- `app-icon-1024.png` (1024×1024) - App Store
+- `app-icon-1024-dark.png` (1024×1024) - Dark mode variant
+- `app-icon-1024-tinted.png` (1024×1024) - Tinted variant
+
+## Generation Steps
+
+### Option 1: Using Online SVG to PNG Converter
+1. Open any SVG to PNG converter (e.g., cloudconvert.com, convertio.co)
+2. Upload `app-icon-design.svg`
+3. Set dimensions to 1024×1024 pixels
+4. Download as `app-icon-1024.png`
+5. Place in `BreathEasy/Assets.xcassets/AppIcon.appiconset/`
+
+### Option 2: Using macOS Preview
+1. Open `app-icon-design.svg` in Preview
+2. File → Export As → PNG
+3. Set size to 1024×1024 pixels
+4. Save as `app-icon-1024.png`
+
+### Option 3: Using Command Line (if you have rsvg-convert)
+```bash
+# Install rsvg-convert (if not installed)
+brew install librsvg
+
+# Generate 1024×1024 PNG
+rsvg-convert -w 1024 -h 1024 app-icon-design.svg -o app-icon-1024.png
+```
+
+### Option 4: Using Figma/Adobe Illustrator
+1. Import `app-icon-design.svg`
+2. Export as PNG at 1024×1024 resolution
+3. Ensure high quality (300 DPI minimum)
+
+## Dark & Tinted Variants
+For now, you can use the same image for all three variants:
+- Copy `app-icon-1024.png` to `app-icon-1024-dark.png`
+- Copy `app-icon-1024.png` to `app-icon-1024-tinted.png`
+
+## Design Notes
+- The icon follows iOS Human Interface Guidelines
+- Rounded corners (180px radius) for iOS 18 style
+- High contrast elements for visibility at small sizes
+- Zen-inspired color palette matches app's Serenity Design System
+- Symbolic elements relate directly to breathing and mindfulness
+
+## Verification
+1. Place generated PNG files in AppIcon.appiconset folder
+2. Build the project in Xcode
+3. Check icon appears correctly in simulator
+4. Verify icon displays properly on device home screen
+
+## Next Steps
+After generating the PNG files, the app icon will automatically appear in:
+- Xcode project navigator
+- iOS Simulator home screen
+- App Store Connect (when uploading)
+- Device home screen after installation
+"""
+
+    write_text('app-icon-instructions.md', instructions)
+    
+    print("✅ Created app icon generation instructions: app-icon-instructions.md")
+
+def add_catalog_arguments(parser, default_svg='app-icon-heart-standard.svg'):
+    """Register the size-matrix, encoder and tracing flags"""
+    parser.add_argument('--svg', default=default_svg,
+                        help="standard-appearance SVG to build the size matrix from")
+    parser.add_argument('--master-size', type=int, choices=[1024, 2048], default=1024,
+                        help="resolution of the single high-res render (default: 1024)")
+    parser.add_argument('--idioms', nargs='+', choices=['iphone', 'ipad', 'mac', 'watch'],
+                        help="icon families to generate (default: all)")
+    parser.add_argument('--backend', choices=sorted(BACKENDS),
+                        help="rasterizer backend (default: first available)")
+    parser.add_argument('--skip-matrix', action='store_true',
+                        help="only write Contents.json, preview and instructions")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="print which outputs are stale without building anything")
+    add_encoder_arguments(parser, optional=True)
+    add_trace_arguments(parser)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate BreathEasy app icon assets")
+    add_catalog_arguments(parser)
+    return parser.parse_args(argv)
+
+def add_document_nodes(graph, thumbnails=False, backend_name=None):
+    """Preview and instructions nodes"""
+    from .design import preview_inputs
+    from .tokens import resolve
+
+    # Preview and instructions are literal text in this file, so its hash is their input
+    generator = source_hash(__file__)
+    
+    svgs = [resolve(template) for _, _, _, template in PREVIEW_DESIGNS]
+    graph.add('preview', ['app-icon-preview.html'],
+              dict(preview_inputs(svgs, thumbnails, backend_name), generator=generator),
+              action=lambda: create_app_icon_html_preview(thumbnails, backend_name))
+    graph.add('instructions', ['app-icon-instructions.md'], {'generator': generator},
+              action=create_icon_generation_instructions)
+
+def build_graph(args, sizes):
+    """Describe every output of this script as a node of an incremental build graph"""
+    graph = BuildGraph('generate_app_icon')
+    add_document_nodes(graph)
+    
+    if args.skip_matrix:
+        graph.add('contents', [os.path.join(APPICON_PATH, 'Contents.json')],
+                  {'contents': installed_contents(sizes)},
+                  action=lambda: update_app_icon_contents(sizes))
+    else:
+        # PNGs and Contents.json are swapped into the icon set together
+        svg_data = b''
+        if os.path.exists(args.svg):
+            with open(args.svg, 'rb') as f:
+                svg_data = f.read()
+        outputs = [os.path.join(APPICON_PATH, name) for name in ['Contents.json'] + [s.filename for s in sizes]]
+        settings = settings_from_args(args)
+        from .design import resolved_backend
+
+        graph.add('appiconset', outputs,
+                  {'svg': svg_data, 'master_size': args.master_size,
+                   'contents': build_contents(sizes), 'backend': resolved_backend(args.backend),
+                   'encoder': settings and settings._asdict(), 'generator': source_hash(__file__)},
+                  action=lambda: generate_icon_matrix(args.svg, sizes, master_size=args.master_size,
+                                                      backend_name=args.backend,
+                                                      encoder_settings=settings))
+    return graph
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = select_sizes(args.idioms)
+    
+    print("🎨 Generating BreathEasy App Icon Assets...")
+    print()
+    
+    # Only stale outputs are rebuilt
+    from .tokens import TokenError
+
+    try:
+        with tracing(args, 'generate_app_icon'):
+            graph = build_graph(args, sizes)
+            ok = graph.run(dry_run=args.dry_run)
+    except TokenError as e:
+        print(f"❌ {e}")
+        return False
+    if not ok:
+        return False
+    if args.dry_run:
+        return True
+    
+    print()
+    print("📱 App Icon Assets Generated Successfully!")
+    print()
+    print("📋 Next Steps:")
+    print("1. Open app-icon-preview.html to see the design")
+    print("2. Follow app-icon-instructions.md to generate PNG files")
+    print("3. Place PNG files in Assets.xcassets/AppIcon.appiconset/")
+    print("4. Build project to see new icon")
+    print()
+    print("🎯 Design Highlights:")
+    print("   🌸 Lotus symbol for spiritual awakening")
+    print("   🌊 Breathing orb with radiating rings")
+    print("   🎨 Serenity color palette for calm")
+    print("   ✨ Zen particles for peaceful atmosphere")
+    return True
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
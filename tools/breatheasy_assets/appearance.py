@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Post-raster dark and tinted appearances for the BreathEasy icons
+Derives the dark and tinted PNGs from the standard render with NumPy instead
+of rasterizing their SVGs again. A design's palette pairs act as anchors:
+pixels on a source color, or on a blend of two, move with them and colors far
+from every anchor stay as they are. Tinted output then keeps only OKLab
+lightness (luminance-only).
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Bump when the derivation changes, so derived PNGs are rebuilt
+REVISION = 1
+
+# sRGB distance from the palette over which a color's shift fades out
+DEFAULT_RADIUS = 0.3
+
+# Anchors per color whose points and connecting segments are considered
+NEAREST_ANCHORS = 6
+
+APPEARANCES = ('dark', 'tinted')
+
+
+def palette_anchors(palette):
+    """(source sRGB (K, 3), target − source sRGB (K, 3)) floats of a PaletteMap's color pairs
+
+    Paint-property scopes ('stroke:#ffffff') cannot be told apart in a raster,
+    so scoped and unscoped pairs are anchors alike; a source mapped twice
+    moves to the mean of its targets.
+    """
+    import numpy as np
+
+    from .palette import normalize_color
+
+    def srgb(color):
+        return [int(color[i:i + 2], 16) / 255.0 for i in (1, 3, 5)]
+
+    targets = {}
+    for source, target in palette.table.items():
+        color = normalize_color(source.rpartition(':')[2])
+        targets.setdefault(color, []).append(srgb(normalize_color(target)))
+    sources = np.array([srgb(color) for color in targets], dtype=np.float32).reshape(-1, 3)
+    moved = np.array([np.mean(colors, axis=0) for colors in targets.values()], dtype=np.float32).reshape(-1, 3)
+    return sources, moved - sources
+
+
+def remap(rgb, sources, deltas, radius=DEFAULT_RADIUS, nearest=NEAREST_ANCHORS):
+    """Move sRGB colors (N, 3) in [0, 1] along with the palette anchors
+
+    Renderers blend gradient stops and anti-aliased edges in sRGB, so a blend
+    of two palette colors lies on the segment between them. Every color is
+    projected onto the closest of its nearest anchors or the segments between
+    them and takes the matching interpolated shift, faded out with its
+    distance from there so colors unrelated to the palette stay in place.
+    """
+    import numpy as np
+
+    if not len(sources):
+        return rgb
+    distance2 = ((rgb[:, None, :] - sources[None, :, :]) ** 2).sum(axis=-1)
+    count = min(nearest, len(sources))
+    near = np.argsort(distance2, axis=1)[:, :count]
+    rows = np.arange(len(rgb))[:, None]
+
+    # Candidates: the nearest anchors themselves, then every segment between two of them
+    best = distance2[rows, near].min(axis=1)
+    shift = deltas[near[:, 0]].copy()
+    for i in range(count):
+        for j in range(i + 1, count):
+            a, b = sources[near[:, i]], sources[near[:, j]]
+            edge = b - a
+            length2 = np.maximum((edge * edge).sum(axis=-1), 1e-9)
+            t = np.clip(((rgb - a) * edge).sum(axis=-1) / length2, 0.0, 1.0)[:, None]
+            segment2 = ((rgb - a - t * edge) ** 2).sum(axis=-1)
+            nearer = segment2 < best
+            best[nearer] = segment2[nearer]
+            delta_a, delta_b = deltas[near[:, i]], deltas[near[:, j]]
+            shift[nearer] = (delta_a + t * (delta_b - delta_a))[nearer]
+    return np.clip(rgb + shift * np.exp(-best / (radius * radius))[:, None], 0.0, 1.0)
+
+
+def derive_all(rgba, palettes, radius=DEFAULT_RADIUS):
+    """Return {appearance: RGBA} for {appearance: palette or None} from one standard render
+
+    Icons hold a few thousand distinct colors among a million pixels, so the
+    transform runs once per unique RGBA value, shared by every appearance,
+    and is gathered back per pixel. Alpha is kept.
+    """
+    import numpy as np
+
+    from .color import linear_to_oklab, linear_to_srgb, oklab_to_linear, srgb_to_linear
+    from .encoder import _unique_colors
+
+    colors, _, inverse = _unique_colors(rgba)
+    source = colors[:, :3].astype(np.float32) / 255.0
+    derived = {}
+    for appearance, palette in palettes.items():
+        if appearance not in APPEARANCES:
+            raise ValueError(f"Unknown appearance: {appearance}")
+        rgb = source if palette is None else remap(source, *palette_anchors(palette), radius=radius)
+        if appearance == 'tinted':
+            lab = linear_to_oklab(srgb_to_linear(rgb))
+            lab[:, 1:] = 0.0
+            rgb = linear_to_srgb(oklab_to_linear(lab))
+        mapped = colors.copy()
+        mapped[:, :3] = np.rint(rgb * 255.0)
+        derived[appearance] = mapped[inverse]
+    return derived
+
+
+def derive(rgba, appearance, palette=None, radius=DEFAULT_RADIUS):
+    """Return the dark or tinted RGBA of a standard render (alpha is kept)"""
+    return derive_all(rgba, {appearance: palette}, radius)[appearance]
+
+
+def difference(derived, rendered):
+    """Alpha-weighted OKLab distance ×100 (≈ ΔE) between two RGBA images: (mean, p99)"""
+    import numpy as np
+
+    from .color import rgba_to_oklab
+
+    distance = np.sqrt(((rgba_to_oklab(derived) - rgba_to_oklab(rendered)) ** 2).sum(axis=-1)) * 100
+    alpha = np.maximum(derived[..., 3], rendered[..., 3]).astype(np.float32) / 255.0
+    covered = alpha > 0
+    if not covered.any():
+        return 0.0, 0.0
+    mean = float((distance * alpha).sum() / alpha.sum())
+    return mean, float(np.percentile(distance[covered], 99))
+
+
+def derive_png_file(source_path, png_path, appearance, palette, encoder_settings=None):
+    """Derive one appearance PNG from the standard PNG; return True on success"""
+    from .build import replace_if_changed
+    from .png import PNGError, encode_png, read_png
+    from .scheduler import temporary_path
+
+    tmp_path = temporary_path(png_path)
+    try:
+        rgba = derive(read_png(source_path), appearance, palette)
+        if encoder_settings is None:
+            data = encode_png(rgba, level=6)
+        else:
+            from .encoder import ByteBudgetError, optimize_png
+
+            try:
+                data = optimize_png(rgba, encoder_settings).data
+            except ByteBudgetError as e:
+                raise ValueError(str(e)) from e
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        replace_if_changed(tmp_path, png_path)
+    except (OSError, ValueError, PNGError) as e:
+        print(f"❌ Could not derive {png_path}: {e}")
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    print(f"✅ Derived {appearance} {png_path} from {source_path}")
+    return True
+
+
+def measure(design, size, backend_name=None):
+    """Time one full render per appearance against one render plus derivation
+
+    Returns {'render': seconds for standard+dark+tinted renders,
+    'derived': seconds for the standard render plus both derivations,
+    appearance: (mean, p99) difference to the full re-render}.
+    """
+    from .rasterizers import get_rasterizer
+
+    backend = get_rasterizer(backend_name)
+    standard_svg, dark_svg, tinted_svg = design.variations()
+    palettes = {'dark': design.dark_palette, 'tinted': design.tinted_palette}
+
+    started = time.perf_counter()
+    standard = backend.render_rgba(standard_svg, size, size)
+    standard_time = time.perf_counter() - started
+    rendered = {}
+    started = time.perf_counter()
+    for appearance, svg in zip(APPEARANCES, (dark_svg, tinted_svg)):
+        rendered[appearance] = backend.render_rgba(svg, size, size)
+    render_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    derived = derive_all(standard, palettes)
+    derive_time = time.perf_counter() - started
+
+    result = {
+        'backend': backend.name,
+        'render': standard_time + render_time,
+        'derived': standard_time + derive_time,
+        'derive_only': derive_time,
+    }
+    for appearance in APPEARANCES:
+        result[appearance] = difference(derived[appearance], rendered[appearance])
+    return result
+
+
+def parse_args(argv=None):
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    parser = argparse.ArgumentParser(
+        description="Compare derived dark/tinted appearances with full re-renders")
+    parser.add_argument('--design', choices=['heart', 'orb'], default='heart',
+                        help="icon design to measure (default: heart)")
+    parser.add_argument('--size', type=int, default=1024, help="render size (default: 1024)")
+    parser.add_argument('--backend', choices=sorted(DEFAULT_BACKEND_ORDER),
+                        help="rasterizer backend (default: first available)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from .rasterizers import RasterizerError
+
+    args = parse_args(argv)
+    if args.design == 'heart':
+        from .heart import DESIGN
+    else:
+        from .orb import DESIGN
+
+    try:
+        result = measure(DESIGN, args.size, args.backend)
+    except RasterizerError as e:
+        print(f"❌ {e}")
+        return False
+    saved = 1 - result['derived'] / result['render']
+    print(f"🎨 {args.design} at {args.size}px with {result['backend']}:")
+    print(f"   Three full renders:           {result['render'] * 1000:.0f} ms")
+    print(f"   One render + two derivations: {result['derived'] * 1000:.0f} ms "
+          f"(derivation {result['derive_only'] * 1000:.0f} ms, {saved:.0%} saved)")
+    for appearance in APPEARANCES:
+        mean, p99 = result[appearance]
+        print(f"   {appearance}: ΔE vs full re-render mean {mean:.2f}, p99 {p99:.2f}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
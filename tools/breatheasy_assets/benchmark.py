@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the BreathEasy icon generators
+Times each pipeline stage (SVG variations, variant derivation, conversion,
+size matrix, install) per generator, backend and icon size with warm-up and
+repeated trials, writes JSON results and fails on regressions past a
+configurable percentage of a stored baseline. Cases are compared on their
+best time, each regression is confirmed by running the case again, and only
+a baseline recorded in the same environment can fail the run.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Tracked in git, unlike the render cache, so every checkout compares against the same run
+DEFAULT_BASELINE = os.path.join('benchmarks', 'baseline.json')
+DEFAULT_SIZES = [29, 58, 120, 180, 512, 1024, 2048]
+GENERATORS = ['png', 'heart', 'app']
+STAGES = ['variations', 'derive', 'convert', 'matrix', 'install']
+
+# Environment fields that must match the baseline's for a regression to fail the run
+COMPARED_ENVIRONMENT = ['python', 'machine', 'cpu_count', 'backends']
+
+
+def measure(func, warmup=1, repeats=5):
+    """Run func warmup + repeats times and return timing statistics for the repeats
+
+    Like timeit, the garbage collector is paused during each trial so a
+    collection triggered by earlier work does not land in one sample.
+    """
+    for _ in range(warmup):
+        func()
+    samples = []
+    for _ in range(repeats):
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - started)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return {
+        'median': statistics.median(samples),
+        'min': min(samples),
+        'mean': statistics.fmean(samples),
+        'stdev': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'repeats': repeats,
+    }
+
+
+def _generator(name):
+    """(module, variations function, dark palette, tinted palette) for a generator"""
+    if name == 'png':
+        from . import orb as module
+        return module, module.create_svg_variations, module.DARK_PALETTE, module.TINTED_PALETTE
+    if name == 'heart':
+        from . import heart as module
+        return (module, module.create_heart_pulse_svg_variations,
+                module.HEART_DARK_PALETTE, module.HEART_TINTED_PALETTE)
+    from . import app_icon as module
+    return module, None, None, None
+
+
+def _app_icon_svg():
+    with open('app-icon-heart-standard.svg', 'rb') as f:
+        return f.read()
+
+
+def _install_workspace(workdir):
+    """Recreate the files copy_to_appicon_folder() reads, hardlinked from the installed icons
+
+    The root-level renders are not committed, so the icon set is the copy every checkout has.
+    """
+    from .install import link_or_copy
+    from .sizes import APPICON_PATH
+
+    appicon = os.path.join(workdir, APPICON_PATH)
+    os.makedirs(appicon, exist_ok=True)
+    shutil.copyfile(os.path.join(APPICON_PATH, 'Contents.json'),
+                    os.path.join(appicon, 'Contents.json'))
+    for png_file in ('app-icon-1024.png', 'app-icon-1024-dark.png', 'app-icon-1024-tinted.png'):
+        link_or_copy(os.path.join(APPICON_PATH, png_file), os.path.join(workdir, png_file))
+    return appicon
+
+
+def build_cases(generators, stages, backends, sizes):
+    """Yield (key, description, callable) for every requested benchmark case
+
+    Keys look like 'convert/heart/cairosvg/1024' and identify a case across
+    runs, so they are what baselines are compared on.
+    """
+    from .scheduler import RenderJob, render_jobs
+
+    for name in generators:
+        module, variations, dark_palette, tinted_palette = _generator(name)
+
+        if 'variations' in stages and variations:
+            yield f'variations/{name}', f"{name}: SVG variations", variations
+
+        if 'derive' in stages and variations:
+            from .svg_document import SvgDocument
+
+            base_svg = variations()[0]
+
+            def derive(base_svg=base_svg, dark_palette=dark_palette, tinted_palette=tinted_palette):
+                document = SvgDocument(base_svg)
+                document.variant('dark', palette=dark_palette).serialize()
+                document.variant('tinted', palette=tinted_palette).serialize()
+
+            yield f'derive/{name}', f"{name}: dark + tinted derivation", derive
+
+        if 'convert' in stages:
+            if variations:
+                svgs = variations()
+                job_sets = {size: module.build_render_jobs([size], svgs) for size in sizes}
+            else:
+                svg_data = _app_icon_svg()
+                job_sets = {size: [RenderJob(f"app {size}px", svg_data, f'app-icon-{size}.png', size, size)]
+                            for size in sizes}
+            for backend in backends:
+                for size in sizes:
+                    # The generator's own conversion loop, run inline so the timing is per render
+                    def convert(jobs=job_sets[size], backend=backend):
+                        report = render_jobs(jobs, backend_name=backend, max_workers=1)
+                        if not report.ok:
+                            raise RuntimeError(report.failed[0].error)
+
+                    yield (f'convert/{name}/{backend}/{size}',
+                           f"{name}: convert {len(job_sets[size])}× {size}px with {backend}", convert)
+
+        if 'matrix' in stages and name == 'app':
+            from .png import encode_png, read_png
+            from .sizes import APPICON_PATH, APPLE_ICON_SIZES, downscale_chain
+
+            master = read_png(os.path.join(APPICON_PATH, 'app-icon-1024.png'))
+            pixel_sizes = [size.pixels for size in APPLE_ICON_SIZES]
+
+            def matrix(master=master, pixel_sizes=pixel_sizes):
+                for rgba in downscale_chain(master, pixel_sizes).values():
+                    encode_png(rgba)
+
+            yield 'matrix/app/1024', f"app: {len(pixel_sizes)}-size matrix from a 1024px master", matrix
+
+        if 'install' in stages:
+            if variations:
+                install = module.copy_to_appicon_folder
+            else:
+                def install(module=module):
+                    module.update_app_icon_contents()
+            yield f'install/{name}', f"{name}: install into AppIcon.appiconset", install
+
+
+def environment():
+    """Machine and tool versions recorded next to the timings"""
+    from .probe import probe_backends
+
+    versions = {name: info['version'] for name, info in probe_backends()['backends'].items()
+                if info['available']}
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'backends': versions,
+    }
+
+
+def run_benchmarks(cases, warmup=1, repeats=5):
+    """Measure every case inside its own scratch working directory; return {key: stats}
+
+    Cases are built and the design tokens indexed first, while the current
+    directory is still the checkout they read their inputs from. A fresh
+    directory per case keeps one case's outputs (say, renders with alpha)
+    from changing what a later one (install) has to do.
+    """
+    from .tokens import token_index
+
+    cases = list(cases)
+    token_index()
+    results = {}
+    cwd = os.getcwd()
+    for key, description, func in cases:
+        workdir = tempfile.mkdtemp(prefix='icon-benchmark.')
+        try:
+            _install_workspace(workdir)
+            os.chdir(workdir)
+            # The stages print progress; only the benchmark's own lines are shown
+            with contextlib.redirect_stdout(io.StringIO()):
+                try:
+                    stats = measure(func, warmup, repeats)
+                except Exception as e:
+                    stats = {'error': str(e)}
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(workdir, ignore_errors=True)
+        results[key] = dict(stats, description=description)
+        if 'error' in stats:
+            print(f"❌ {description}: {stats['error']}")
+        else:
+            print(f"⏱️  {description}: {stats['min'] * 1000:.1f} ms "
+                  f"(median {stats['median'] * 1000:.1f}, ±{stats['stdev'] * 1000:.1f})")
+    return results
+
+
+def compare(results, baseline, threshold=10.0, min_delta=0.001, verbose=True):
+    """Return the keys whose best time regressed more than threshold percent
+
+    The minimum of the repeats is compared, since noise only ever adds time.
+    Changes smaller than min_delta seconds are treated as noise, so very fast
+    stages cannot fail on timer jitter.
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous or 'min' not in previous or 'min' not in current:
+            continue
+        delta = current['min'] - previous['min']
+        change = delta / previous['min'] * 100 if previous['min'] else 0.0
+        if change > threshold and delta > min_delta:
+            regressions.append(key)
+            if verbose:
+                print(f"❌ {current['description']}: {change:+.1f}% "
+                      f"({previous['min'] * 1000:.1f} → {current['min'] * 1000:.1f} ms)")
+        elif change < -threshold and -delta > min_delta and verbose:
+            print(f"🚀 {current['description']}: {change:+.1f}%")
+    return regressions
+
+
+def environment_differences(recorded, current):
+    """Names of the compared environment fields that differ between two environment() blocks"""
+    return [field for field in COMPARED_ENVIRONMENT if recorded.get(field) != current.get(field)]
+
+
+def confirm_regressions(results, regressions, cases, warmup=1, repeats=5):
+    """Run the regressed cases again and keep each one's better run in results"""
+    print(f"🔁 Re-running {len(regressions)} regressed case(s) to confirm...")
+    rerun = run_benchmarks([case for case in cases if case[0] in regressions], warmup, repeats)
+    for key, stats in rerun.items():
+        if 'min' in stats and stats['min'] < results[key].get('min', float('inf')):
+            results[key] = stats
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_results(path, results):
+    from .build import write_text
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_text(path, json.dumps({'environment': environment(), 'results': results},
+                                indent=2, sort_keys=True))
+
+
+def parse_args(argv=None):
+    from .rasterizers import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Benchmark the BreathEasy icon pipeline stages")
+    parser.add_argument('--generators', nargs='+', choices=GENERATORS, default=GENERATORS,
+                        help="generators to benchmark (default: all)")
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=STAGES,
+                        help="stages to benchmark (default: all)")
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS),
+                        help="rasterizer backends for the convert stage (default: all available)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help="square sizes for the convert stage (default: 29 … 2048)")
+    parser.add_argument('--warmup', type=int, default=1, help="untimed runs per case (default: 1)")
+    parser.add_argument('--repeats', type=int, default=5, help="timed runs per case (default: 5)")
+    parser.add_argument('--output', help="also write this run's results to a JSON file")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help=f"baseline JSON to compare against (default: {DEFAULT_BASELINE})")
+    parser.add_argument('--update-baseline', action='store_true',
+                        help="store this run as the new baseline instead of comparing")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="fail when a stage's best time is this many percent slower (default: 10)")
+    parser.add_argument('--ci', action='store_true', default=bool(os.environ.get('CI')),
+                        help="fail when the baseline is missing (default: on when $CI is set)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from .probe import available_backends
+
+    args = parse_args(argv)
+    backends = args.backends or available_backends()
+    if 'convert' in args.stages and not backends:
+        print("⚠️  No rasterizer backend available; skipping the convert stage")
+
+    print("📊 Benchmarking BreathEasy icon pipeline...")
+    cases = build_cases(args.generators, args.stages, backends, args.sizes)
+    results = run_benchmarks(cases, args.warmup, args.repeats)
+    failed = [key for key, stats in results.items() if 'error' in stats]
+
+    if args.output:
+        save_results(args.output, results)
+        print(f"💾 Results written to {args.output}")
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f"💾 Baseline updated: {args.baseline}")
+        return not failed
+    if not os.path.exists(args.baseline):
+        if args.ci:
+            print(f"❌ No baseline at {args.baseline}: nothing to compare against in CI; "
+                  f"record one with --update-baseline and commit it")
+            return False
+        print(f"⚠️  No baseline at {args.baseline}; regressions were NOT checked. "
+              f"Run with --update-baseline to record one")
+        return not failed
+
+    stored = load_results(args.baseline)
+    differences = environment_differences(stored.get('environment', {}), environment())
+    if differences:
+        print(f"⚠️  {args.baseline} was recorded in a different environment ({', '.join(differences)}); "
+              f"regressions are reported but do not fail. Record a baseline on this machine with --update-baseline")
+        compare(results, stored['results'], args.threshold)
+        return not failed
+
+    regressions = compare(results, stored['results'], args.threshold, verbose=False)
+    if regressions:
+        cases = build_cases(args.generators, args.stages, backends, args.sizes)
+        confirm_regressions(results, regressions, cases, args.warmup, args.repeats)
+    regressions = compare(results, stored['results'], args.threshold)
+    if regressions:
+        print(f"❌ {len(regressions)} stage(s) regressed more than {args.threshold:g}%")
+    else:
+        print(f"✅ No stage regressed more than {args.threshold:g}% against {args.baseline}")
+    return not failed and not regressions
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Incremental build graph for the BreathEasy icon generators
+Every output records the fingerprint of its inputs (generator source, SVG
+content, settings) in a manifest; a run rebuilds only nodes whose inputs
+changed or whose outputs went missing, and --dry-run prints the plan
+"""
+
+import hashlib
+import json
+import os
+
+from .cache import DEFAULT_CACHE_DIR
+from .tracing import count, stage
+
+DEFAULT_MANIFEST = os.path.join(DEFAULT_CACHE_DIR, 'build-manifest.json')
+
+
+def source_hash(path):
+    """Hash a generator source file so code edits invalidate its outputs"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _hashable(value):
+    if isinstance(value, bytes):
+        return 'sha256:' + hashlib.sha256(value).hexdigest()
+    if isinstance(value, str) and len(value) > 64:
+        return 'sha256:' + hashlib.sha256(value.encode('utf-8')).hexdigest()
+    if isinstance(value, dict):
+        return {str(k): _hashable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_hashable(v) for v in value]
+    return value
+
+
+def fingerprint(inputs):
+    """Stable hex digest of an inputs dictionary (long strings/bytes are hashed first)"""
+    payload = json.dumps(_hashable(inputs), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def replace_if_changed(tmp_path, path):
+    """Swap a freshly written tmp_path into place unless path already holds the same bytes
+
+    An unchanged output keeps its inode, mtime and any hardlinks to it (the
+    installed icon set, deduplicated copies); tmp_path is then left for the
+    caller to remove. Returns True if path was replaced.
+    """
+    import filecmp
+
+    try:
+        if filecmp.cmp(tmp_path, path, shallow=False):
+            count('unchanged_outputs')
+            return False
+    except FileNotFoundError:
+        pass
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_text(path, text):
+    """Atomically write a text output"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+class BuildNode:
+    """One buildable step: outputs, the inputs they derive from, and how to build them"""
+
+    def __init__(self, name, outputs, inputs, action=None, batch=None, deps=(), payload=None):
+        self.name = name
+        self.outputs = list(outputs)
+        self.inputs = inputs
+        self.action = action
+        self.batch = batch
+        self.deps = list(deps)
+        self.payload = payload
+        self.fingerprint = None
+        self.reason = None
+
+
+class BuildGraph:
+    """Nodes in insertion order plus a manifest of the last successful build
+
+    A node is stale when it is new, its fingerprint (inputs plus the
+    fingerprints of its deps) changed, or an output is missing. Nodes that
+    share a batch key are built together by one batch action, which receives
+    the stale nodes and returns the names of those it built successfully.
+    """
+
+    def __init__(self, name, manifest_path=DEFAULT_MANIFEST):
+        self.name = name
+        self.manifest_path = manifest_path
+        self.nodes = {}
+        self.batches = {}
+        self._manifest = None
+
+    def add(self, name, outputs, inputs, action=None, batch=None, deps=(), payload=None):
+        if name in self.nodes:
+            raise ValueError(f"Duplicate build node: {name}")
+        for dep in deps:
+            if dep not in self.nodes:
+                raise ValueError(f"Build node {name} depends on unknown node {dep}")
+        node = BuildNode(name, outputs, inputs, action, batch, deps, payload)
+        self.nodes[name] = node
+        return node
+
+    def add_batch(self, key, action):
+        self.batches[key] = action
+
+    def select(self, keep):
+        """Drop every node except those where keep(name) is true and their dependencies
+
+        Manifest entries of dropped nodes are left alone, so a partial run
+        never invalidates the rest of the graph. Returns the graph.
+        """
+        needed = set()
+        # Dependencies are always added before their dependents
+        for name in reversed(list(self.nodes)):
+            if name in needed or keep(name):
+                needed.add(name)
+                needed.update(self.nodes[name].deps)
+        self.nodes = {name: node for name, node in self.nodes.items() if name in needed}
+        return self
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            try:
+                with open(self.manifest_path) as f:
+                    self._manifest = json.load(f)
+            except (FileNotFoundError, ValueError):
+                self._manifest = {}
+        return self._manifest.setdefault(self.name, {})
+
+    def _save_manifest(self):
+        directory = os.path.dirname(self.manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        write_text(self.manifest_path, json.dumps(self._manifest, indent=2, sort_keys=True))
+
+    def plan(self):
+        """Return the stale nodes in build order, each with a .reason"""
+        recorded = self._load_manifest()
+        stale = []
+        stale_names = set()
+        for node in self.nodes.values():
+            node.fingerprint = fingerprint({
+                'inputs': node.inputs,
+                'deps': [self.nodes[dep].fingerprint for dep in node.deps],
+            })
+            previous = recorded.get(node.name)
+            if previous is None:
+                node.reason = 'new'
+            elif previous != node.fingerprint:
+                node.reason = 'inputs changed'
+            elif any(not os.path.exists(path) for path in node.outputs):
+                node.reason = 'missing output'
+            elif any(dep in stale_names for dep in node.deps):
+                node.reason = 'dependency rebuilt'
+            else:
+                node.reason = None
+                continue
+            stale.append(node)
+            stale_names.add(node.name)
+        return stale
+
+    def print_plan(self, stale):
+        if not stale:
+            print(f"✨ {self.name}: everything up to date ({len(self.nodes)} outputs)")
+            return
+        print(f"📋 {self.name}: {len(stale)} of {len(self.nodes)} nodes to rebuild")
+        for node in stale:
+            if not node.outputs:
+                print(f"   • {node.name} ({node.reason})")
+                continue
+            outputs = ', '.join(node.outputs) if len(node.outputs) <= 3 else f"{len(node.outputs)} files"
+            print(f"   • {node.name} → {outputs} ({node.reason})")
+
+    def run(self, dry_run=False):
+        """Build every stale node; return True if nothing failed"""
+        with stage('plan', category=self.name):
+            stale = self.plan()
+            count('stale', len(stale))
+            count('up_to_date', len(self.nodes) - len(stale))
+        if dry_run or not stale:
+            self.print_plan(stale)
+            return True
+
+        recorded = self._load_manifest()
+        failed = set()
+        done_batches = set()
+        for node in stale:
+            if node.name in failed or (node.batch and node.batch in done_batches):
+                continue
+            if any(dep in failed for dep in node.deps):
+                print(f"⏭️  Skipping {node.name}: a dependency failed")
+                failed.add(node.name)
+                continue
+
+            if node.batch:
+                members = []
+                for member in stale:
+                    if member.batch != node.batch:
+                        continue
+                    if any(dep in failed for dep in member.deps):
+                        failed.add(member.name)
+                    else:
+                        members.append(member)
+                with stage(node.batch, category=self.name, nodes=len(members)):
+                    built = set(self.batches[node.batch](members) or ())
+                done_batches.add(node.batch)
+                for member in members:
+                    if member.name in built:
+                        recorded[member.name] = member.fingerprint
+                    else:
+                        failed.add(member.name)
+            else:
+                with stage(node.name, category=self.name, reason=node.reason):
+                    ok = node.action() is not False
+                if ok:
+                    recorded[node.name] = node.fingerprint
+                else:
+                    failed.add(node.name)
+
+        self._save_manifest()
+        return not failed
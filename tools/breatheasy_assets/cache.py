@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for rendered icon PNGs
+Entries are keyed on the SVG bytes, output size, backend name/version and
+encoder settings, and evicted least-recently-used once the cache grows past
+its size budget
+"""
+
+import hashlib
+import json
+import os
+import shutil
+
+from .install import link_or_copy
+
+DEFAULT_CACHE_DIR = '.icon-cache'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def render_key(svg_data, width, height, backend_name, backend_version, encoder_settings=None):
+    """Return the hex cache key for one render"""
+    if isinstance(svg_data, str):
+        svg_data = svg_data.encode('utf-8')
+    digest = hashlib.sha256(svg_data)
+    digest.update(json.dumps({
+        'width': width,
+        'height': height,
+        'backend': backend_name,
+        'backend_version': backend_version,
+        'encoder': encoder_settings or {},
+    }, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Size-bounded LRU cache of rendered PNG files
+
+    Entries live under <directory>/renders/<key[:2]>/<key>.png. The entry mtime
+    doubles as its last-use time, so a hit is a reflink/copy plus one utime
+    call. Entries are never hardlinked into outputs: a later in-place edit of
+    an output would silently change the cached render too.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = os.path.join(directory, 'renders')
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.png")
+
+    def fetch(self, key, dest):
+        """Place a copy (or reflink) of the cached render at dest; return False on a miss"""
+        entry = self.path_for(key)
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        link_or_copy(entry, dest, hardlink=False)
+        self.hits += 1
+        return True
+
+    def store(self, key, src):
+        """Add a freshly rendered file to the cache
+
+        The size budget is not enforced here, since that rescans the whole
+        cache: call evict() once after a batch of stores.
+        """
+        entry = self.path_for(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        link_or_copy(src, entry, hardlink=False)
+
+    def entries(self):
+        """Return (mtime, size, path) for every cache entry"""
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.png'):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, stat.st_size, entry.path))
+        return found
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_bytes"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Drop every cached render"""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+breatheasy-assets: one command line for the BreathEasy icon pipeline
+Subcommands render, preview, install and catalog reuse the design modules'
+build graphs (and their manifests), so running a subcommand or one of the
+generate_*.py scripts is interchangeable. Only argparse is loaded up front: each
+subcommand builds its own parser and imports the modules, and through
+them the rasterizer backends, it needs when it runs
+"""
+
+import argparse
+import os
+import sys
+
+# Design name → module providing DESIGN and build_graph()
+DESIGNS = {
+    'heart': 'breatheasy_assets.heart',
+    'orb': 'breatheasy_assets.orb',
+}
+DEFAULT_DESIGN = 'heart'
+
+# Standard SVG each design's size matrix is built from
+CATALOG_SVGS = {
+    'heart': 'app-icon-heart-standard.svg',
+    'orb': 'app-icon-standard.svg',
+}
+
+COLD_START_BUDGET_MS = 100
+
+# (label, arguments) of the runs the cold-start budget applies to
+COLD_START_COMMANDS = [
+    ('--help', ['--help']),
+    ('render --help', ['render', '--help']),
+    ('no-op render', ['render', '--dry-run']),
+    ('no-op catalog', ['catalog', '--dry-run']),
+]
+
+
+def _design_module(name):
+    import importlib
+
+    return importlib.import_module(DESIGNS[name])
+
+
+def _add_design_argument(parser):
+    parser.add_argument('--design', choices=sorted(DESIGNS), default=DEFAULT_DESIGN,
+                        help=f"icon design (default: {DEFAULT_DESIGN})")
+
+
+def _run_graph(args, name, build):
+    from .tracing import tracing
+
+    with tracing(args, name):
+        graph = build()
+        if not graph.nodes:
+            print(f"⚠️  Nothing to build for {name}")
+            return False
+        return graph.run(dry_run=args.dry_run)
+
+
+def render_parser(parser):
+    _add_design_argument(parser)
+    from .design import add_render_arguments
+
+    add_render_arguments(parser)
+
+
+def render(args):
+    """SVG variants and PNG renders of one design"""
+    from .design import render_cache
+
+    module = _design_module(args.design)
+    return _run_graph(args, f'render {args.design}', lambda: module.build_graph(
+        args, render_cache(args)).select(lambda name: name.startswith(('svg:', 'png:'))))
+
+
+def preview_parser(parser):
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    _add_design_argument(parser)
+    parser.add_argument('--thumbnails', action='store_true',
+                        help="embed cached PNG thumbnails instead of shared vector tiles")
+    parser.add_argument('--backend', choices=sorted(DEFAULT_BACKEND_ORDER),
+                        help="rasterizer for --thumbnails (default: fastest available)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="print which outputs are stale without building anything")
+    from .tracing import add_trace_arguments
+
+    add_trace_arguments(parser)
+
+
+def preview(args):
+    """HTML preview page of one design"""
+    from .build import BuildGraph
+
+    if args.design == 'heart':
+        from . import heart as module
+
+        graph = BuildGraph('generate_heart_pulse_icons')
+        module.add_preview_node(graph, args.thumbnails, args.backend)
+    else:
+        from . import app_icon as module
+
+        graph = BuildGraph('generate_app_icon')
+        module.add_document_nodes(graph, args.thumbnails, args.backend)
+        graph.select(lambda name: name == 'preview')
+    return _run_graph(args, f'preview {args.design}', lambda: graph)
+
+
+def serve_parser(parser):
+    _add_design_argument(parser)
+    from .live import add_live_arguments
+
+    add_live_arguments(parser)
+
+
+def serve(args):
+    """Live preview page re-rendered on every edit of the design"""
+    from .live import live_preview
+
+    return live_preview(args.design, DESIGNS[args.design], args)
+
+
+def sweep_parser(parser):
+    _add_design_argument(parser)
+    from .sweep import add_sweep_arguments
+
+    add_sweep_arguments(parser)
+
+
+def sweep(args):
+    """Contact sheet of every combination of a design's swept parameters"""
+    from .sweep import sweep_from_args
+
+    return sweep_from_args(_design_module(args.design), args.design, args)
+
+
+def optimize_parser(parser):
+    _add_design_argument(parser)
+    parser.add_argument('files', nargs='*',
+                        help="SVG files to optimize instead of the design's variants (e.g. app-icon-design.svg)")
+    from .svg_optimize import add_optimize_arguments
+
+    add_optimize_arguments(parser)
+
+
+def optimize(args):
+    """Byte and parse-time savings of the SVG optimizer on a design's variants or on SVG files"""
+    from .svg_optimize import optimize_files, print_report, savings
+
+    if args.files:
+        return optimize_files(args.files, args.precision, args.write)
+    if args.write:
+        print("⚠️  The design's variants are written optimized by render; --write applies to files")
+    design = _design_module(args.design).DESIGN
+    print_report([(svg_file, savings(raw, optimized)) for svg_file, raw, optimized in zip(
+        design.svg_files, design.variations(optimize=False), design.variations(precision=args.precision))])
+    return True
+
+
+def install_parser(parser):
+    render_parser(parser)
+
+
+def install(args):
+    """1024px renders of one design, atomically installed into AppIcon.appiconset"""
+    from .design import render_cache
+
+    if 1024 not in args.sizes:
+        print("❌ install needs the 1024px renders; add 1024 to --sizes")
+        return False
+    module = _design_module(args.design)
+    return _run_graph(args, f'install {args.design}', lambda: module.build_graph(
+        args, render_cache(args)).select(lambda name: name in ('install', 'dedupe')))
+
+
+def catalog_parser(parser):
+    _add_design_argument(parser)
+    from .app_icon import add_catalog_arguments
+
+    add_catalog_arguments(parser, default_svg=None)
+
+
+def catalog(args):
+    """Full Apple size matrix, Contents.json and generation instructions"""
+    from . import app_icon
+    from .sizes import select_sizes
+
+    args.svg = args.svg or CATALOG_SVGS[args.design]
+    sizes = select_sizes(args.idioms)
+    return _run_graph(args, f'catalog {args.design}', lambda: app_icon.build_graph(
+        args, sizes).select(lambda name: name != 'preview'))
+
+
+def backends_parser(parser):
+    from .probe import add_probe_arguments
+
+    add_probe_arguments(parser)
+
+
+def backends(args):
+    """Installed rasterizer backends, optionally calibrated for speed and correctness"""
+    from . import probe
+
+    return probe.main(['--size', str(args.size)] + ['--refresh'] * args.refresh
+                           + ['--calibrate'] * args.calibrate)
+
+
+def tokens_parser(parser):
+    from .tokens import DEFAULT_TOKEN_CACHE, DESIGN_SOURCES
+
+    parser.add_argument('sources', nargs='*', default=list(DESIGN_SOURCES),
+                        help=f"Swift files or directories to scan (default: {' '.join(DESIGN_SOURCES)})")
+    parser.add_argument('--cache', default=DEFAULT_TOKEN_CACHE,
+                        help=f"token index cache (default: {DEFAULT_TOKEN_CACHE})")
+
+
+def tokens(args):
+    """Design-system color tokens the generators' templates and palettes refer to"""
+    from . import tokens
+
+    return tokens.main([*args.sources, '--cache', args.cache])
+
+
+def validate_parser(parser):
+    from .validate import add_validate_arguments
+
+    add_validate_arguments(parser)
+
+
+def validate(args):
+    """Asset catalog images checked against Contents.json and the App Store icon rules"""
+    from . import validate
+
+    return validate.main([args.catalog] + ['--quiet'] * args.quiet + ['--strict'] * args.strict
+                              + ['--install-hook'] * args.install_hook)
+
+
+def dedupe_parser(parser):
+    parser.add_argument('--dry-run', action='store_true',
+                        help="report duplicates and reclaimable bytes without linking anything")
+
+
+def dedupe(args):
+    """Byte-identical generated PNGs hardlinked to one canonical copy"""
+    from .dedupe import dedupe_outputs
+
+    return dedupe_outputs(dry_run=args.dry_run)
+
+
+def startup_check_parser(parser):
+    parser.add_argument('--budget-ms', type=float, default=COLD_START_BUDGET_MS,
+                        help=f"allowed start-up overhead over a bare interpreter (default: {COLD_START_BUDGET_MS})")
+    parser.add_argument('--runs', type=int, default=5, help="timed runs per command (default: 5)")
+
+
+def cold_start_times(runs=5, commands=COLD_START_COMMANDS, cwd=None):
+    """(bare interpreter ms, [(label, ms)]): median wall time of each command over runs
+
+    The package is byte-compiled first. The budget is about the imports and
+    work a run does, which a pre-commit hook always pays warm; compiling every
+    module from source on the very first run costs another ~40 ms on its own.
+    """
+    import compileall
+    import statistics
+    import subprocess
+    import time
+
+    package_directory = os.path.dirname(os.path.abspath(__file__))
+    compileall.compile_dir(package_directory, quiet=1)
+    # The package runs with -m from wherever it was imported, like an installed console script
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [os.path.dirname(package_directory), os.environ.get('PYTHONPATH')])))
+
+    def median_ms(argv):
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, *argv], stdout=subprocess.DEVNULL, env=environment, cwd=cwd,
+                           check=True)
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
+
+    interpreter = median_ms(['-c', 'pass'])
+    return interpreter, [(label, median_ms(['-m', __package__, *argv])) for label, argv in commands]
+
+
+def startup_check(args):
+    """Fail if --help or a no-op run starts slower than the cold-start budget
+
+    The budget applies to the overhead over `python -c pass`, since bare
+    interpreter start-up alone varies several-fold between machines.
+    """
+    interpreter, times = cold_start_times(args.runs)
+    print(f"🐍 Bare interpreter start-up: {interpreter:.0f} ms")
+    ok = True
+    for label, total in times:
+        overhead = total - interpreter
+        within = overhead <= args.budget_ms
+        ok = ok and within
+        print(f"{'✅' if within else '❌'} {label}: {total:.0f} ms "
+              f"({overhead:+.0f} ms over the interpreter, budget {args.budget_ms:g} ms)")
+    return ok
+
+
+# name → (one-line help, parser setup, action)
+COMMANDS = {
+    'render': ("render a design's SVG variants and PNGs", render_parser, render),
+    'preview': ("write a design's HTML preview page", preview_parser, preview),
+    'serve': ("serve a live preview page that re-renders on every edit", serve_parser, serve),
+    'sweep': ("render a design's parameter combinations into one contact sheet", sweep_parser, sweep),
+    'optimize': ("report (or apply) the SVG optimizer's byte and parse-time savings",
+                 optimize_parser, optimize),
+    'install': ("render and install the 1024px icons into AppIcon.appiconset", install_parser, install),
+    'catalog': ("build the full Apple size matrix and Contents.json", catalog_parser, catalog),
+    'backends': ("detect (and optionally calibrate) the rasterizer backends", backends_parser, backends),
+    'tokens': ("list the design-system color tokens used by the icon templates", tokens_parser, tokens),
+    'dedupe': ("hardlink byte-identical generated PNGs and report the bytes reclaimed",
+               dedupe_parser, dedupe),
+    'validate': ("check the asset catalog's PNGs against Contents.json (pre-commit friendly)",
+                 validate_parser, validate),
+    'startup-check': ("check --help and no-op runs against the cold-start budget",
+                      startup_check_parser, startup_check),
+}
+
+
+def parse_args(argv=None):
+    """Two-stage parse: the subcommand first, then only that subcommand's flags"""
+    commands = '\n'.join(f"  {name:<14} {summary}" for name, (summary, _, _) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='breatheasy-assets',
+        description="Build the BreathEasy app icon assets",
+        epilog=f"commands:\n{commands}\n\nRun 'breatheasy-assets COMMAND --help' for a command's options.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--repo', metavar='PATH',
+                        help="checkout root that sources, caches and outputs are relative to "
+                             "(default: current directory)")
+    parser.add_argument('command', choices=COMMANDS, metavar='COMMAND', help="one of the commands below")
+    parser.add_argument('arguments', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    top = parser.parse_args(argv)
+
+    summary, setup, action = COMMANDS[top.command]
+    command_parser = argparse.ArgumentParser(prog=f'breatheasy-assets {top.command}',
+                                             description=summary[0].upper() + summary[1:])
+    setup(command_parser)
+    args = command_parser.parse_args(top.arguments)
+    args.action = action
+    args.repo = top.repo
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.repo:
+        try:
+            os.chdir(args.repo)
+        except OSError as e:
+            print(f"❌ Cannot use {args.repo} as the checkout root: {e.strerror}")
+            return False
+    from .tokens import TokenError
+
+    try:
+        return args.action(args)
+    except TokenError as e:
+        print(f"❌ {e}")
+        return False
+
+
+def run():
+    """Console script entry point: exit status 0 when the command succeeded"""
+    sys.exit(0 if main() else 1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Vectorized color-space helpers for the BreathEasy icon pipeline
+sRGB ↔ linear conversions and premultiplied-alpha packing used by the
+gamma-correct resampling and post-raster stages
+"""
+
+import numpy as np
+
+
+def srgb_to_linear(values):
+    """Convert sRGB-encoded floats in [0, 1] to linear light"""
+    values = np.asarray(values, dtype=np.float32)
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(values):
+    """Convert linear-light floats in [0, 1] to sRGB encoding"""
+    values = np.clip(np.asarray(values, dtype=np.float32), 0.0, 1.0)
+    return np.where(values <= 0.0031308, values * 12.92, 1.055 * values ** (1 / 2.4) - 0.055)
+
+
+def to_linear_premultiplied(rgba):
+    """RGBA uint8 → float32 array of premultiplied linear RGB plus alpha"""
+    rgba = np.asarray(rgba)
+    out = np.empty(rgba.shape, dtype=np.float32)
+    alpha = rgba[..., 3].astype(np.float32) / 255.0
+    out[..., :3] = srgb_to_linear(rgba[..., :3].astype(np.float32) / 255.0) * alpha[..., None]
+    out[..., 3] = alpha
+    return out
+
+
+def from_linear_premultiplied(pixels):
+    """Inverse of to_linear_premultiplied, rounding back to RGBA uint8"""
+    alpha = np.clip(pixels[..., 3], 0.0, 1.0)
+    safe_alpha = np.where(alpha > 0, alpha, 1.0)[..., None]
+    rgb = linear_to_srgb(pixels[..., :3] / safe_alpha)
+    out = np.empty(pixels.shape, dtype=np.uint8)
+    out[..., :3] = np.rint(rgb * 255.0)
+    out[..., 3] = np.rint(alpha * 255.0)
+    return out
+
+
+def linear_to_oklab(rgb):
+    """Convert linear sRGB (..., 3) to OKLab (..., 3) with L in [0, 1]"""
+    rgb = np.asarray(rgb, dtype=np.float32)
+    lms = rgb @ np.array([
+        [0.4122214708, 0.2119034982, 0.0883024619],
+        [0.5363325363, 0.6806995451, 0.2817188376],
+        [0.0514459929, 0.1073969566, 0.6299787005],
+    ], dtype=np.float32)
+    lms = np.cbrt(np.maximum(lms, 0.0))
+    return lms @ np.array([
+        [0.2104542553, 1.9779984951, 0.0259040371],
+        [0.7936177850, -2.4285922050, 0.7827717662],
+        [-0.0040720468, 0.4505937099, -0.8086757660],
+    ], dtype=np.float32)
+
+
+def oklab_to_linear(lab):
+    """Convert OKLab (..., 3) back to linear sRGB (..., 3), unclipped"""
+    lab = np.asarray(lab, dtype=np.float32)
+    lms = lab @ np.array([
+        [1.0, 1.0, 1.0],
+        [0.3963377774, -0.1055613458, -0.0894841775],
+        [0.2158037573, -0.0638541728, -1.2914855480],
+    ], dtype=np.float32)
+    lms = lms ** 3
+    return lms @ np.array([
+        [4.0767416621, -1.2684380046, -0.0041960863],
+        [-3.3077115913, 2.6097574011, -0.7034186147],
+        [0.2309699292, -0.3413193965, 1.7076147010],
+    ], dtype=np.float32)
+
+
+def rgba_to_oklab(rgba):
+    """RGBA uint8 (..., 4) → OKLab float32 (..., 3), ignoring alpha"""
+    return linear_to_oklab(srgb_to_linear(np.asarray(rgba)[..., :3].astype(np.float32) / 255.0))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Content-hash deduplication of the generated icon binaries
+Groups byte-identical outputs (the root-level app-icon-*.png renders and the
+icons in AppIcon.appiconset) by SHA-256, keeps one canonical file per group
+and hardlinks (or reflinks) the others to it, then reports the disk space
+reclaimed. Only files of equal size are ever hashed. The root-level renders
+are not committed (see .gitignore), so linking only saves working-tree space.
+"""
+
+import fnmatch
+import hashlib
+import os
+import sys
+
+# Generated binaries: (directory, filename pattern); directories are not recursed.
+# Only generator outputs match, never committed fixtures like test-heart-conversion.png
+DEFAULT_LOCATIONS = [
+    ('.', 'app-icon-*.png'),
+    ('BreathEasy/Assets.xcassets/AppIcon.appiconset', '*.png'),
+]
+
+_CHUNK = 1024 * 1024
+
+
+def candidate_files(locations=DEFAULT_LOCATIONS):
+    """Every regular file matching one of the (directory, pattern) locations, sorted"""
+    files = set()
+    for directory, pattern in locations:
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.is_file(follow_symlinks=False) and fnmatch.fnmatch(entry.name, pattern):
+                files.add(os.path.normpath(entry.path))
+    return sorted(files)
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_CHUNK), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def duplicate_groups(paths):
+    """[[path, ...]] of byte-identical files, each group sorted, canonical first
+
+    Files are bucketed by size first, so a file with a unique size is never
+    read. The canonical file is the one with the most hardlinks already
+    (ties: shortest path, then name), so installed links are kept.
+    """
+    by_size = {}
+    for path in paths:
+        by_size.setdefault(os.stat(path).st_size, []).append(path)
+
+    groups = []
+    for size, same_size in sorted(by_size.items()):
+        if len(same_size) < 2 or size == 0:
+            continue
+        by_digest = {}
+        for path in same_size:
+            by_digest.setdefault(file_digest(path), []).append(path)
+        for group in by_digest.values():
+            if len(group) > 1:
+                group.sort(key=lambda path: (-os.stat(path).st_nlink, len(path), path))
+                groups.append(group)
+    return groups
+
+
+def _same_file(a, b):
+    a, b = os.stat(a), os.stat(b)
+    return (a.st_dev, a.st_ino) == (b.st_dev, b.st_ino)
+
+
+def dedupe(paths, dry_run=False):
+    """Link every duplicate in paths to its group's canonical file
+
+    Returns a report {'groups': [[canonical, duplicate, ...]], 'linked':
+    [(duplicate, canonical, method)], 'reclaimed': bytes, 'already': bytes}.
+    Files already sharing an inode count as 'already' reclaimed. A
+    duplicate that could only be copied (no hardlink or reflink support)
+    reclaims nothing.
+    """
+    from .install import link_or_copy
+
+    report = {'groups': [], 'linked': [], 'reclaimed': 0, 'already': 0}
+    for group in duplicate_groups(paths):
+        canonical = group[0]
+        size = os.stat(canonical).st_size
+        report['groups'].append(group)
+        for duplicate in group[1:]:
+            if _same_file(canonical, duplicate):
+                report['already'] += size
+                continue
+            method = 'link' if dry_run else link_or_copy(canonical, duplicate)
+            report['linked'].append((duplicate, canonical, method))
+            if method != 'copy':
+                report['reclaimed'] += size
+    return report
+
+
+def print_report(report, dry_run=False):
+    verb = "Would link" if dry_run else "Linked"
+    for duplicate, canonical, method in report['linked']:
+        print(f"🔗 {verb} {duplicate} → {canonical}" + ('' if dry_run else f" ({method})"))
+    duplicates = sum(len(group) - 1 for group in report['groups'])
+    print(f"♻️  {len(report['groups'])} duplicate group(s), {duplicates} redundant copies: "
+          f"{report['reclaimed'] / 1024:,.0f} KiB {'reclaimable' if dry_run else 'reclaimed'}, "
+          f"{report['already'] / 1024:,.0f} KiB already shared")
+
+
+def dedupe_outputs(locations=DEFAULT_LOCATIONS, dry_run=False):
+    """Build action: dedupe the generated binaries and print the report"""
+    try:
+        report = dedupe(candidate_files(locations), dry_run)
+    except OSError as e:
+        print(f"❌ Dedupe failed: {e}")
+        return False
+    print_report(report, dry_run)
+    return True
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Hardlink byte-identical generated icon binaries")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="report duplicates and reclaimable bytes without linking anything")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return dedupe_outputs(dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
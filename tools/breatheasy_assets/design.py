@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Shared pipeline for the BreathEasy icon designs
+One IconDesign (base SVG plus dark/tinted palettes) drives SVG variants,
+render jobs, AppIcon.appiconset installs and the build-graph nodes that the
+generator scripts and the breatheasy-assets CLI are assembled from
+"""
+
+import os
+
+from .sizes import APPICON_PATH
+
+# The preview tile builder; pages hash it as an input instead of importing it (XML parser start-up)
+PREVIEW_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'preview.py')
+
+# Package modules whose code shapes the SVG variants, the PNG renders and the derived
+# appearances; their source hashes are node inputs, so editing one rebuilds what it made
+SVG_HELPERS = ['design.py', 'palette.py', 'svg_builder.py', 'svg_document.py', 'svg_optimize.py', 'tokens.py']
+RENDER_HELPERS = ['encoder.py', 'png.py', 'processes.py', 'raster.py', 'rasterizers.py', 'scheduler.py',
+                  'tiles.py']
+DERIVE_HELPERS = ['appearance.py', 'color.py', 'encoder.py', 'png.py']
+
+# (variant, PNG suffix) in the order returned by IconDesign.variations()
+VARIANTS = [
+    ('standard', ''),
+    ('dark', '-dark'),
+    ('tinted', '-tinted')
+]
+
+INSTALLED_PNG_FILES = [
+    'app-icon-1024.png',
+    'app-icon-1024-dark.png',
+    'app-icon-1024-tinted.png'
+]
+
+# The standard appearance is the App Store marketing icon, which must have no alpha
+MARKETING_PNG_FILES = ['app-icon-1024.png']
+
+
+class IconDesign:
+    """A base SVG and the palettes that derive its dark and tinted variants
+
+    label_prefix is prepended to render job labels ('heart standard 1024px');
+    svg_files are the variant SVGs written next to the scripts. base_svg may be
+    the template function instead of its markup: it is then called on first
+    use, so importing a design does not resolve its design tokens.
+    """
+
+    def __init__(self, name, base_svg, dark_palette, tinted_palette, svg_files, label_prefix=''):
+        self.name = name
+        self._base_svg = base_svg
+        self.dark_palette = dark_palette
+        self.tinted_palette = tinted_palette
+        self.svg_files = svg_files
+        self.label_prefix = label_prefix
+
+    @property
+    def base_svg(self):
+        if callable(self._base_svg):
+            self._base_svg = self._base_svg()
+        return self._base_svg
+
+    def variations(self, optimize=True, precision=None):
+        """Return the (standard, dark, tinted) SVG text
+
+        The variants are optimized (precision decimals, default
+        DEFAULT_PRECISION) unless optimize is False, so the renders and the
+        written SVG files share the same compact markup.
+        """
+        from .svg_document import SvgDocument
+        from .svg_optimize import DEFAULT_PRECISION, optimize_svg
+
+        # Parse the base design once; dark and tinted are palette overlays on the shared tree
+        document = SvgDocument(self.base_svg)
+        dark_svg = document.variant('dark', palette=self.dark_palette).serialize()
+        tinted_svg = document.variant('tinted', palette=self.tinted_palette).serialize()
+        svgs = self.base_svg, dark_svg, tinted_svg
+        if not optimize:
+            return svgs
+        precision = DEFAULT_PRECISION if precision is None else precision
+        return tuple(optimize_svg(svg_data, precision) for svg_data in svgs)
+
+    def render_jobs(self, sizes=(1024,), svgs=None):
+        """Build one independent render job per (variant, size) pair"""
+        from .scheduler import RenderJob
+
+        jobs = []
+        for (variant, suffix), svg_data in zip(VARIANTS, svgs or self.variations()):
+            for size in sizes:
+                jobs.append(RenderJob(f"{self.label_prefix}{variant} {size}px", svg_data,
+                                      f'app-icon-{size}{suffix}.png', size, size))
+        return jobs
+
+
+def render_design(design, backend=None, jobs=None, sizes=(1024,), cache=None):
+    """Render every variation and size of a design; return True if all succeeded"""
+    from .rasterizers import RasterizerError
+    from .scheduler import render_jobs
+
+    try:
+        report = render_jobs(design.render_jobs(sizes), backend_name=backend, max_workers=jobs, cache=cache)
+    except RasterizerError as e:
+        print(f"❌ {e}")
+        return False
+
+    report.print_summary()
+    return report.ok
+
+
+def opaque_source(png_file):
+    """png_file itself if it is opaque, else its PNG bytes flattened onto the marketing background"""
+    from .validate import read_png_header
+
+    if not read_png_header(png_file).has_alpha:
+        return png_file
+    from .png import encode_png, flatten, read_png
+
+    print(f"🎨 Flattening {png_file} onto an opaque background for the App Store")
+    return encode_png(flatten(read_png(png_file)))
+
+
+def copy_to_appicon_folder(files=INSTALLED_PNG_FILES, appicon_path=APPICON_PATH):
+    """Install PNG files into the AppIcon.appiconset folder as one atomic swap"""
+    from .install import install_appiconset
+
+    missing = [png_file for png_file in files if not os.path.exists(png_file)]
+    for png_file in missing:
+        print(f"❌ PNG file not found: {png_file}")
+    if missing:
+        return False
+
+    try:
+        # Hardlinks (or reflinks) of the root-level PNGs; only a marketing icon with alpha is re-encoded
+        methods = install_appiconset(appicon_path, {png_file: opaque_source(png_file)
+                                                    if png_file in MARKETING_PNG_FILES else png_file
+                                                    for png_file in files})
+    except (OSError, ValueError) as e:
+        print(f"❌ Failed to install icons: {e}")
+        return False
+
+    for png_file in files:
+        print(f"✅ Installed {png_file} to AppIcon.appiconset ({methods[png_file]})")
+    return True
+
+
+def render_nodes(nodes, args, cache, heading=None, on_failure=None):
+    """Build action for stale PNG nodes: render them in one scheduler run
+
+    on_failure is called when no backend could be set up at all.
+    """
+    from .encoder import settings_from_args
+    from .rasterizers import RasterizerError
+    from .scheduler import render_jobs
+
+    if heading:
+        print(heading)
+    try:
+        report = render_jobs([node.payload for node in nodes], backend_name=args.backend,
+                             max_workers=args.jobs, cache=cache,
+                             encoder_settings=settings_from_args(args),
+                             timeout=args.timeout, retries=args.retries, verbose=args.verbose,
+                             tile_size=args.tile_size)
+    except RasterizerError as e:
+        print(f"❌ {e}")
+        if on_failure:
+            on_failure()
+        return []
+
+    report.print_summary()
+    if report.ok:
+        print("\n📱 PNG files generated successfully!")
+    return [node.name for node, result in zip(nodes, report.results) if result.ok]
+
+
+def helper_hashes(names):
+    """{module: source hash} of package modules, as a build node input"""
+    from .build import source_hash
+
+    package = os.path.dirname(os.path.abspath(__file__))
+    return {name: source_hash(os.path.join(package, name)) for name in names}
+
+
+def preview_inputs(svgs, thumbnails=False, backend_name=None):
+    """Build node inputs of a preview page drawing svgs (its generator's hash is added by the caller)
+
+    Thumbnails are rendered, so they also depend on the backend and the render helpers.
+    """
+    from .build import source_hash
+
+    helpers = SVG_HELPERS + RENDER_HELPERS if thumbnails else SVG_HELPERS
+    return {'svgs': list(svgs), 'preview': source_hash(PREVIEW_SOURCE), 'helpers': helper_hashes(helpers),
+            'thumbnails': thumbnails and resolved_backend(backend_name)}
+
+
+def resolved_backend(name=None):
+    """[name, version] of the backend a render would use, from the cached probe (None if none is available)"""
+    from .rasterizers import RasterizerError, get_rasterizer
+
+    try:
+        backend = get_rasterizer(name)
+    except RasterizerError:
+        return None
+    return [backend.name, backend.version()]
+
+
+def add_design_nodes(graph, design, args, cache, save_svg, install,
+                     render_heading=None, on_render_failure=None, svgs=None, generator=None):
+    """Add the SVG, PNG, install and dedupe nodes of a design to a build graph
+
+    save_svg(svg_file, svg_data), install() and on_render_failure() are the
+    scripts' own actions, so each keeps its messages. The install node only
+    exists when the 1024px renders it copies are part of the graph.
+    generator is the design module's source file, hashed into every node.
+    """
+    from .build import source_hash
+    from .encoder import settings_from_args
+
+    svgs = svgs or design.variations(precision=args.precision)
+    generator = generator and source_hash(generator)
+    svg_helpers = helper_hashes(SVG_HELPERS)
+    for (variant, _), svg_file, svg_data in zip(VARIANTS, design.svg_files, svgs):
+        graph.add(f'svg:{variant}', [svg_file], {'svg': svg_data, 'generator': generator, 'helpers': svg_helpers},
+                  action=lambda svg_file=svg_file, svg_data=svg_data: save_svg(svg_file, svg_data))
+
+    # PNG renders, built together by one scheduler run
+    settings = settings_from_args(args)
+    jobs = design.render_jobs(args.sizes, svgs)
+    render_helpers = dict(svg_helpers, **helper_hashes(RENDER_HELPERS))
+    backend = resolved_backend(args.backend)
+    derived = []
+    for index, job in enumerate(jobs):
+        variant = VARIANTS[index // len(args.sizes)][0]
+        if args.derive_appearances and variant != 'standard':
+            # Added after the renders so the batch has run by the time they build
+            derived.append((variant, job, jobs[index % len(args.sizes)]))
+            continue
+        graph.add(f'png:{job.label}', [job.png_path],
+                  {'svg': job.svg_data, 'size': [job.width, job.height], 'backend': backend,
+                   'encoder': settings and settings._asdict(), 'generator': generator,
+                   'helpers': render_helpers},
+                  batch='render', payload=job)
+    graph.add_batch('render', lambda nodes: render_nodes(nodes, args, cache,
+                                                      render_heading, on_render_failure))
+    for variant, job, standard in derived:
+        add_derived_node(graph, design, variant, job, standard, settings, generator)
+
+    installed = [f'png:{design.label_prefix}{variant} 1024px' for variant, _ in VARIANTS]
+    if all(name in graph.nodes for name in installed):
+        graph.add('install', [os.path.join(APPICON_PATH, f) for f in INSTALLED_PNG_FILES],
+                  {'files': INSTALLED_PNG_FILES, 'opaque': MARKETING_PNG_FILES}, action=install, deps=installed)
+
+    # Runs whenever a render or the install changed: links byte-identical copies together
+    from .dedupe import DEFAULT_LOCATIONS, dedupe_outputs
+
+    deps = [name for name in graph.nodes if name.startswith('png:') or name == 'install']
+    graph.add('dedupe', [], {'locations': DEFAULT_LOCATIONS}, action=dedupe_outputs, deps=deps)
+    return graph
+
+
+def add_derived_node(graph, design, appearance, job, standard, settings, generator=None):
+    """Add a node deriving a dark/tinted PNG from the standard render of the same size"""
+    from .appearance import REVISION, derive_png_file
+
+    palette = design.dark_palette if appearance == 'dark' else design.tinted_palette
+    graph.add(f'png:{job.label}', [job.png_path],
+              {'derived': appearance, 'palette': palette.table, 'revision': REVISION,
+               'size': [job.width, job.height], 'encoder': settings and settings._asdict(),
+               'generator': generator, 'helpers': helper_hashes(DERIVE_HELPERS)},
+              action=lambda: derive_png_file(standard.png_path, job.png_path, appearance, palette, settings),
+              deps=[f'png:{standard.label}'])
+
+
+def add_render_arguments(parser):
+    """Register the render, cache, encoder and tracing flags shared by every generator"""
+    from .cache import DEFAULT_CACHE_DIR
+    from .encoder import add_encoder_arguments
+    from .rasterizers import DEFAULT_BACKEND_ORDER, DEFAULT_RETRIES, DEFAULT_TIMEOUT
+    from .svg_optimize import DEFAULT_PRECISION
+    from .tracing import add_trace_arguments
+
+    parser.add_argument('--jobs', '-j', type=int,
+                        help="number of parallel render processes (default: CPU count)")
+    parser.add_argument('--backend', choices=sorted(DEFAULT_BACKEND_ORDER),
+                        help="rasterizer backend (default: first available)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f"kill a command line conversion after this many seconds (default: {DEFAULT_TIMEOUT:g})")
+    parser.add_argument('--retries', type=int, default=DEFAULT_RETRIES,
+                        help=f"retries for timed out or transiently failing conversions (default: {DEFAULT_RETRIES})")
+    parser.add_argument('--verbose', '-v', action='store_true',
+                        help="stream the command line tools' stderr while they run")
+    parser.add_argument('--tile-size', type=int, metavar='PIXELS',
+                        help="split renders larger than this into tiles rendered in parallel "
+                             "(e.g. 512 for 2048–4096px marketing renders)")
+    parser.add_argument('--derive-appearances', action='store_true',
+                        help="derive the dark and tinted PNGs from the standard render in OKLab "
+                             "instead of rasterizing their SVGs")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1024],
+                        help="square PNG sizes to render for every variant (default: 1024)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"render cache location (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always re-render instead of reusing cached PNGs")
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION,
+                        help=f"decimals the SVG optimizer keeps in coordinates and opacities "
+                             f"(default: {DEFAULT_PRECISION})")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="print which outputs are stale without building anything")
+    add_encoder_arguments(parser, optional=True)
+    add_trace_arguments(parser)
+
+
+def render_cache(args):
+    """The RenderCache selected by --cache-dir/--no-cache"""
+    if args.no_cache:
+        return None
+    from .cache import RenderCache
+
+    return RenderCache(args.cache_dir)
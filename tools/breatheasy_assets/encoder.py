@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Size-optimizing PNG encode stage for the BreathEasy icon pipeline
+Runs after rasterization: tries every PNG filter strategy and zlib level in
+parallel, switches to an indexed palette when the perceptual error stays
+under a threshold, writes critical chunks only and enforces a byte budget
+"""
+
+import os
+import zlib
+from collections import namedtuple
+
+# PNG filter type per strategy; None = choose per row. NumPy and png are
+# imported inside the functions so the generators' CLI can register the
+# encoder flags without paying for NumPy on no-op runs.
+FILTER_STRATEGIES = {
+    'none': 0,
+    'sub': 1,
+    'up': 2,
+    'average': 3,
+    'paeth': 4,
+    'adaptive': None,
+}
+
+
+class EncoderSettings(namedtuple('EncoderSettings',
+                                 'levels strategies quantize max_error max_p99_error max_bytes finalists')):
+    """How hard to search for the smallest PNG
+
+    max_error / max_p99_error bound the mean and 99th-percentile ΔE (OKLab×100,
+    alpha-weighted) a quantized palette may introduce; max_bytes is the
+    per-asset budget (None = unlimited); finalists is how many of the
+    fastest-level candidates are retried at the stronger zlib levels.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, levels=(6, 9), strategies=tuple(FILTER_STRATEGIES), quantize=True,
+                max_error=0.5, max_p99_error=2.0, max_bytes=None, finalists=3):
+        return super().__new__(cls, tuple(levels), tuple(strategies), quantize,
+                               max_error, max_p99_error, max_bytes, finalists)
+
+
+EncodeResult = namedtuple('EncodeResult', 'data layout strategy level mean_error p99_error')
+
+
+class ByteBudgetError(Exception):
+    """Raised when the smallest encoding of an asset is still over its byte budget"""
+
+
+def _perceptual(rgba):
+    """Map RGBA colors to an alpha-weighted OKLab space scaled so 1.0 ≈ one ΔE unit
+
+    Color coordinates are multiplied by alpha, so fully transparent pixels
+    compare equal whatever RGB they carry.
+    """
+    import numpy as np
+    from .color import rgba_to_oklab
+
+    alpha = rgba[..., 3:4].astype(np.float32) / 255.0
+    out = np.empty(rgba.shape, dtype=np.float32)
+    out[..., :3] = rgba_to_oklab(rgba) * alpha * 100.0
+    out[..., 3] = alpha[..., 0] * 100.0
+    return out
+
+
+def _unique_colors(rgba):
+    """Return (colors (n, 4) uint8, counts (n,), inverse index per pixel)"""
+    import numpy as np
+
+    packed = np.ascontiguousarray(rgba).view(np.uint32).reshape(-1)
+    values, inverse, counts = np.unique(packed, return_inverse=True, return_counts=True)
+    colors = values.view(np.uint8).reshape(-1, 4)
+    return colors, counts, inverse.reshape(rgba.shape[:2])
+
+
+def _nearest(points, palette_points, chunk=4096):
+    """Index of the nearest palette point for every point, chunked to bound memory"""
+    import numpy as np
+
+    nearest = np.empty(len(points), dtype=np.intp)
+    for start in range(0, len(points), chunk):
+        block = points[start:start + chunk]
+        distances = ((block[:, None, :] - palette_points[None, :, :]) ** 2).sum(axis=2)
+        nearest[start:start + chunk] = distances.argmin(axis=1)
+    return nearest
+
+
+def _weighted_percentile(values, weights, percentile):
+    import numpy as np
+
+    order = np.argsort(values)
+    cumulative = np.cumsum(weights[order])
+    cutoff = percentile / 100.0 * cumulative[-1]
+    return float(values[order][np.searchsorted(cumulative, cutoff)])
+
+
+def _median_cut(colors, points, counts, size):
+    """Split the color set into at most size boxes by weighted median cuts
+
+    Each step splits the box with the widest spread (in perceptual space,
+    weighted by pixel count) along that axis. Returns the palette as the
+    count-weighted mean RGBA of each box.
+    """
+    import numpy as np
+
+    boxes = [np.arange(len(colors))]
+    while len(boxes) < size:
+        spreads = []
+        for members in boxes:
+            if len(members) < 2:
+                spreads.append(-1.0)
+                continue
+            box = points[members]
+            spreads.append(float(((box.max(axis=0) - box.min(axis=0)) ** 2).max()
+                                 * np.log1p(counts[members].sum())))
+        widest = int(np.argmax(spreads))
+        if spreads[widest] <= 0:
+            break
+        members = boxes.pop(widest)
+        box = points[members]
+        axis = int(np.argmax(box.max(axis=0) - box.min(axis=0)))
+        order = members[np.argsort(box[:, axis], kind='stable')]
+        cumulative = np.cumsum(counts[order])
+        split = int(np.searchsorted(cumulative, cumulative[-1] / 2.0)) + 1
+        split = min(max(split, 1), len(order) - 1)
+        boxes.extend([order[:split], order[split:]])
+
+    palette = np.empty((len(boxes), 4), dtype=np.float64)
+    for i, members in enumerate(boxes):
+        weights = counts[members].astype(np.float64)
+        palette[i] = (colors[members] * weights[:, None]).sum(axis=0) / weights.sum()
+    return np.rint(palette).astype(np.uint8)
+
+
+def quantize(rgba, max_colors=256, refine=2):
+    """Reduce an RGBA image to an indexed palette
+
+    Returns (palette (n, 4) uint8, indices (h, w) uint8, mean ΔE, p99 ΔE).
+    Images that already use max_colors or fewer colors are indexed exactly.
+    """
+    import numpy as np
+
+    colors, counts, inverse = _unique_colors(rgba)
+    if len(colors) <= max_colors:
+        return colors, inverse.astype(np.uint8), 0.0, 0.0
+
+    points = _perceptual(colors)
+    palette = _median_cut(colors, points, counts, max_colors)
+    for _ in range(refine + 1):
+        assignment = _nearest(points, _perceptual(palette))
+        if _ == refine:
+            break
+        # One k-means step: move each entry to the weighted mean of its colors
+        weights = counts.astype(np.float64)
+        totals = np.zeros((len(palette), 4))
+        np.add.at(totals, assignment, colors * weights[:, None])
+        used = np.bincount(assignment, weights=weights, minlength=len(palette))
+        keep = used > 0
+        palette = np.rint(totals[keep] / used[keep][:, None]).astype(np.uint8)
+
+    errors = np.sqrt(((points - _perceptual(palette)[assignment]) ** 2).sum(axis=1))
+    mean_error = float((errors * counts).sum() / counts.sum())
+    p99_error = _weighted_percentile(errors, counts, 99)
+    return palette, assignment[inverse].astype(np.uint8), mean_error, p99_error
+
+
+def _pack_indices(indices, bit_depth):
+    """Pack (h, w) palette indices into (h, stride) bytes at 1/2/4/8 bits per pixel"""
+    import numpy as np
+
+    if bit_depth == 8:
+        return indices
+    height, width = indices.shape
+    per_byte = 8 // bit_depth
+    padded = np.zeros((height, -(-width // per_byte) * per_byte), dtype=np.uint8)
+    padded[:, :width] = indices
+    groups = padded.reshape(height, -1, per_byte)
+    shifts = np.arange(8 - bit_depth, -1, -bit_depth, dtype=np.uint8)
+    return np.bitwise_or.reduce(groups << shifts, axis=2).astype(np.uint8)
+
+
+def _filtered_scanlines(rows, strategy, bpp):
+    """Filter every row and prepend its filter-type byte
+
+    'adaptive' picks, per row, the filter with the smallest sum of absolute
+    signed residuals (the heuristic recommended by the PNG specification).
+    """
+    import numpy as np
+    from .png import filter_rows
+
+    height, stride = rows.shape
+    raw = np.empty((height, stride + 1), dtype=np.uint8)
+    filter_type = FILTER_STRATEGIES[strategy]
+    if filter_type is not None:
+        raw[:, 0] = filter_type
+        raw[:, 1:] = filter_rows(rows, filter_type, bpp)
+        return raw.tobytes()
+    candidates = np.stack([filter_rows(rows, f, bpp) for f in range(5)])
+    scores = np.abs(candidates.view(np.int8).astype(np.int32)).sum(axis=2)
+    best = scores.argmin(axis=0)
+    raw[:, 0] = best
+    raw[:, 1:] = candidates[best, np.arange(height)]
+    return raw.tobytes()
+
+
+def _layouts(rgba, settings):
+    """Yield (name, rows, bpp, bit_depth, color_type, palette, transparency, mean, p99)"""
+    import numpy as np
+
+    height, width = rgba.shape[:2]
+    if (rgba[..., 3] == 255).all():
+        yield ('rgb', rgba[..., :3].reshape(height, width * 3), 3, 8, 2, None, None, 0.0, 0.0)
+    else:
+        yield ('rgba', rgba.reshape(height, width * 4), 4, 8, 6, None, None, 0.0, 0.0)
+
+    if not settings.quantize:
+        return
+    palette, indices, mean_error, p99_error = quantize(rgba)
+    if mean_error > settings.max_error or p99_error > settings.max_p99_error:
+        return
+    # Translucent entries first, so tRNS can stop after the last one
+    order = np.argsort(palette[:, 3] == 255, kind='stable')
+    palette = palette[order]
+    indices = np.argsort(order).astype(np.uint8)[indices]
+    translucent = int((palette[:, 3] < 255).sum())
+    bit_depth = next(bits for bits in (1, 2, 4, 8) if len(palette) <= 1 << bits)
+    yield ('indexed', _pack_indices(indices, bit_depth), 1, bit_depth, 3,
+           palette[:, :3].tobytes(), palette[:translucent, 3].tobytes() or None,
+           mean_error, p99_error)
+
+
+def optimize_png(rgba, settings=None, max_workers=None):
+    """Encode an (h, w, 4) RGBA uint8 array as the smallest PNG found
+
+    Every layout (truecolor, plus an indexed palette when quantizing stays
+    within the error bounds) is filtered with every strategy and compressed
+    on a thread pool (zlib releases the GIL). Raises ByteBudgetError when
+    even the smallest candidate exceeds settings.max_bytes.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    import numpy as np
+    from .png import build_png
+
+    settings = settings or EncoderSettings()
+    rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+    height, width = rgba.shape[:2]
+
+    def compress(layout, strategy, level):
+        name, rows, bpp, bit_depth, color_type, palette, transparency, mean, p99 = layout
+        scanlines = _filtered_scanlines(rows, strategy, bpp)
+        data = build_png(width, height, bit_depth, color_type,
+                         zlib.compress(scanlines, level), palette, transparency)
+        return EncodeResult(data, name, strategy, level, mean, p99)
+
+    # Round one ranks every layout × filter at the fastest level; only the
+    # most promising few are re-compressed at the slower, stronger levels
+    fastest, *stronger = sorted(settings.levels)
+    layouts = {layout[0]: layout for layout in _layouts(rgba, settings)}
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as pool:
+        results = list(pool.map(lambda trial: compress(*trial), [
+            (layout, strategy, fastest)
+            for layout in layouts.values()
+            for strategy in settings.strategies
+        ]))
+        finalists = sorted(results, key=lambda result: len(result.data))[:settings.finalists]
+        results += pool.map(lambda trial: compress(*trial), [
+            (layouts[result.layout], result.strategy, level)
+            for result in finalists
+            for level in stronger
+        ])
+    best = min(results, key=lambda result: len(result.data))
+
+    if settings.max_bytes is not None and len(best.data) > settings.max_bytes:
+        raise ByteBudgetError(f"{len(best.data):,} bytes exceeds the {settings.max_bytes:,}-byte budget")
+    return best
+
+
+def optimize_png_file(path, settings=None, output_path=None):
+    """Re-encode a PNG file in place (or to output_path); return (old size, EncodeResult)"""
+    from .png import decode_png
+
+    with open(path, 'rb') as f:
+        original = f.read()
+    result = optimize_png(decode_png(original), settings)
+    output_path = output_path or path
+    if output_path == path and len(result.data) >= len(original):
+        return len(original), result._replace(data=original, layout='original')
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(result.data)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(original), result
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Shrink PNG assets losslessly or within a ΔE bound")
+    parser.add_argument('paths', nargs='+', help="PNG files to re-encode in place")
+    add_encoder_arguments(parser)
+    parser.add_argument('--check', action='store_true',
+                        help="Only report achievable sizes; do not rewrite files")
+    return parser.parse_args(argv)
+
+
+def add_encoder_arguments(parser, optional=False):
+    """Register the encoder flags on a generator's argument parser"""
+    if optional:
+        parser.add_argument('--optimize', action='store_true',
+                            help="Run the size-optimizing PNG encode stage after rendering")
+    parser.add_argument('--levels', type=int, nargs='+', default=[6, 9],
+                        help="zlib levels to try (default: 6 9)")
+    parser.add_argument('--lossless', action='store_true',
+                        help="Never quantize to a palette unless it is exact")
+    parser.add_argument('--max-error', type=float, default=0.5,
+                        help="Largest mean ΔE (OKLab×100) palette quantization may add (default: 0.5)")
+    parser.add_argument('--max-bytes', type=int,
+                        help="Fail any asset whose smallest encoding is larger than this")
+
+
+def settings_from_args(args):
+    """EncoderSettings for parsed add_encoder_arguments() flags, or None when not optimizing"""
+    if not getattr(args, 'optimize', True):
+        return None
+    return EncoderSettings(levels=args.levels,
+                           max_error=0.0 if args.lossless else args.max_error,
+                           max_p99_error=0.0 if args.lossless else max(2.0, 4 * args.max_error),
+                           max_bytes=args.max_bytes)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    settings = settings_from_args(args)
+    ok = True
+    total_before = total_after = 0
+    for path in args.paths:
+        try:
+            if args.check:
+                from .png import read_png
+
+                before = os.path.getsize(path)
+                result = optimize_png(read_png(path), settings)
+            else:
+                before, result = optimize_png_file(path, settings)
+        except ByteBudgetError as e:
+            print(f"❌ {path}: {e}")
+            ok = False
+            continue
+        after = len(result.data)
+        total_before += before
+        total_after += after
+        print(f"🗜️  {path}: {before:,} → {after:,} bytes ({result.layout}, {result.strategy} "
+              f"filter, zlib {result.level}, mean ΔE {result.mean_error:.2f})")
+    if total_before:
+        saved = total_before - total_after
+        print(f"📦 Saved {saved:,} bytes ({saved / total_before:.0%}) across {len(args.paths)} file(s)")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Generate BreathEasy App Icons with Heart + Pulse Design
+Creates standard, dark, and tinted variations for iOS
+"""
+
+import argparse
+import sys
+
+from .build import BuildGraph, source_hash, write_text
+from .design import (VARIANTS, IconDesign, add_design_nodes, add_render_arguments, copy_to_appicon_folder,
+                     preview_inputs, render_cache, render_design)
+from .svg_builder import (Element, SvgBuilder, circle, group, linear_gradient, path, polyline_path,
+                               radial_gradient, stop)
+from .tokens import TokenError, palette, resolve
+from .tracing import tracing
+
+# Dark version - adjust colors for dark appearance
+HEART_DARK_PALETTE = palette({
+    '#E3F2FD': '$midnight',
+    '$softSkyBlue': '#16213E',
+    '$sageGreen': '#1B2F1B',
+    '$oceanTeal': '#0E3A5F',
+    '#FF6B8A': '#8B2635',
+    '#FF8FA3': '#A53448',
+    '#FFB3C1': '#B8485B',
+    '#4CAF50': '#2E7D32',
+    '#66BB6A': '#388E3C',
+    '#81C784': '#43A047',
+    '#A5D6A7': '#4CAF50',
+    'stroke:#ffffff': '#CCCCCC',
+    'fill:#ffffff': '#CCCCCC',
+})
+
+# Tinted version - more monochrome for tinted appearance
+HEART_TINTED_PALETTE = palette({
+    '#E3F2FD': '#F5F5F5',
+    '$softSkyBlue': '#E0E0E0',
+    '$sageGreen': '#EEEEEE',
+    '$oceanTeal': '#BDBDBD',
+    '#FF6B8A': '#757575',
+    '#FF8FA3': '#8E8E8E',
+    '#FFB3C1': '#A7A7A7',
+    '#4CAF50': '#666666',
+    '#66BB6A': '#777777',
+    '#81C784': '#888888',
+    '#A5D6A7': '#999999',
+})
+
+HEART_PATH = "M 0,40 C -40,0 -80,0 -80,40 C -80,80 -40,120 0,160 C 40,120 80,80 80,40 C 80,0 40,0 0,40 Z"
+
+# EKG-style pulse wave through these points, relative to the wave's baseline center
+PULSE_POINTS = [(-200, 0), (-150, 0), (-130, -30), (-110, 60), (-90, -80), (-70, 40), (-50, 0),
+                (0, 0), (20, -20), (40, 40), (60, -60), (80, 30), (100, 0), (200, 0)]
+
+# Breathing ripples, outermost first: (radius, opacity)
+RIPPLES = [(350, 0.3), (300, 0.4), (250, 0.5)]
+
+# Breathing indicator dots: (x, y, radius, color, opacity)
+BREATHING_INDICATORS = [
+    (300, 300, 6, '#4CAF50', 0.8), (724, 300, 6, '#4CAF50', 0.6),
+    (300, 724, 6, '#66BB6A', 0.7), (724, 724, 6, '#66BB6A', 0.5),
+    (250, 400, 4, '#81C784', 0.6), (774, 400, 4, '#81C784', 0.4),
+    (400, 250, 4, '#A5D6A7', 0.5), (624, 774, 4, '#A5D6A7', 0.4),
+]
+
+# Air flow curve above the heart; the one below is its mirror image
+AIR_FLOW_PATH = "M 350,200 Q 400,150 450,200 Q 500,250 550,200 Q 600,150 650,200"
+
+def heart_pulse_svg():
+    """The heart + pulse design's SVG (standard version)"""
+    svg = SvgBuilder()
+    svg.define(radial_gradient('backgroundGradient', [
+        stop('0%', '#E3F2FD'), stop('40%', '$softSkyBlue'), stop('80%', '$sageGreen'), stop('100%', '$oceanTeal'),
+    ], cx='50%', cy='50%', r='70%'))
+    svg.define(linear_gradient('heartGradient', [
+        stop('0%', '#FF6B8A'), stop('50%', '#FF8FA3'), stop('100%', '#FFB3C1'),
+    ], x1='0%', y1='0%', x2='100%', y2='100%'))
+    svg.define(linear_gradient('pulseGradient', [
+        stop('0%', '#4CAF50', 0.8), stop('50%', '#66BB6A'), stop('100%', '#81C784', 0.6),
+    ], x1='0%', y1='0%', x2='100%', y2='0%'))
+    svg.define(radial_gradient('rippleGradient', [
+        stop('0%', '#ffffff', 0.3), stop('70%', '$softSkyBlue', 0.2), stop('100%', '$oceanTeal', 0.1),
+    ], cx='50%', cy='50%', r='50%'))
+    svg.define(Element('filter', Element('feGaussianBlur', stdDeviation=3, result='coloredBlur'),
+                       Element('feMerge', Element('feMergeNode', in_='coloredBlur'),
+                               Element('feMergeNode', in_='SourceGraphic')), id='glow'))
+    svg.define(Element('filter', Element('feDropShadow', dx=2, dy=4, stdDeviation=3, flood_color='#000000',
+                                         flood_opacity=0.2),
+                       id='dropshadow', x='-50%', y='-50%', width='200%', height='200%'))
+
+    svg.add(circle(512, 512, 512, fill='url(#backgroundGradient)'))
+    for radius, opacity in RIPPLES:
+        svg.add(circle(512, 512, radius, fill='none', stroke='url(#rippleGradient)', stroke_width=2,
+                       opacity=opacity))
+    svg.add(group(path(HEART_PATH, fill='url(#heartGradient)', filter='url(#glow)'),
+                  transform='translate(512,400)', filter='url(#dropshadow)'))
+    svg.add(group(path(polyline_path(PULSE_POINTS), fill='none', stroke='url(#pulseGradient)', stroke_width=4,
+                       stroke_linecap='round', stroke_linejoin='round', filter='url(#glow)'),
+                  transform='translate(512,600)', opacity=0.9))
+    # One dot per radius, instanced at each of its positions in that position's color
+    placements = {}
+    for x, y, radius, color, opacity in BREATHING_INDICATORS:
+        placements.setdefault(radius, []).append({'x': x, 'y': y, 'fill': color, 'opacity': opacity})
+    svg.add(group(*(instance for radius, spots in placements.items()
+                    for instance in svg.repeat(circle(0, 0, radius), spots, f'indicator{radius}')), opacity=0.7))
+    svg.add(circle(512, 512, 25, fill='none', stroke='#ffffff', stroke_width=2, opacity=0.6))
+    svg.add(circle(512, 512, 15, fill='#ffffff', opacity=0.4))
+    air_flow = path(AIR_FLOW_PATH, fill='none', stroke='#ffffff', stroke_width=2, stroke_linecap='round')
+    svg.add(group(*svg.repeat(air_flow, [None, 'matrix(1,0,0,-1,0,1024)'], 'airFlow'), opacity=0.3))
+    return resolve(svg.markup())
+
+HEART_SVG_FILES = ['app-icon-heart-standard.svg', 'app-icon-heart-dark.svg', 'app-icon-heart-tinted.svg']
+
+DESIGN = IconDesign('heart', heart_pulse_svg, HEART_DARK_PALETTE, HEART_TINTED_PALETTE, HEART_SVG_FILES,
+                    label_prefix='heart ')
+
+# Heart path center in its group's coordinates, the fixed point of heart_scale
+HEART_CENTER_Y = 80
+
+def set_ripple_radii(variant, radii):
+    """Overlay the breathing ripple radii, outermost first"""
+    ripples = [circle for circle in variant.document.iter('circle') if circle.get('stroke') == 'url(#rippleGradient)']
+    for ripple, radius in zip(ripples, radii):
+        variant.set(ripple, 'r', f'{radius:g}')
+
+def set_heart_scale(variant, scale):
+    """Overlay a heart scaled about its center"""
+    heart = next(g for g in variant.document.iter('g') if g.get('filter') == 'url(#dropshadow)')
+    if scale != 1:
+        variant.set(heart, 'transform',
+                    f"translate(512,{400 + HEART_CENTER_Y}) scale({scale:g}) translate(0,{-HEART_CENTER_Y})")
+
+def set_pulse_amplitude(variant, amplitude):
+    """Overlay the pulse wave with its peaks scaled vertically (whitespace kept)"""
+    import re
+
+    pulse = next(path for path in variant.document.iter('path') if path.get('stroke') == 'url(#pulseGradient)')
+    variant.set(pulse, 'd', re.sub(r'(-?[\d.]+),(-?[\d.]+)',
+                                   lambda point: f"{point.group(1)},{float(point.group(2)) * amplitude:g}",
+                                   pulse.get('d')))
+
+def sweep_parameters():
+    """Design parameters `breatheasy-assets sweep` can vary"""
+    from .sweep import Parameter, radii
+
+    return [
+        Parameter('heart_scale', 1.0, float, set_heart_scale, help="heart size factor"),
+        Parameter('pulse_amplitude', 1.0, float, set_pulse_amplitude, help="pulse wave peak height factor"),
+        Parameter('ripples', (350, 300, 250), radii, set_ripple_radii,
+                  help="breathing ripple radii, outermost first"),
+    ]
+
+def create_heart_pulse_svg_variations():
+    """Create heart + pulse SVG variations for different appearances"""
+    return DESIGN.variations()
+
+def save_heart_pulse_svg_file(svg_file, svg_data):
+    """Save one heart + pulse SVG variation"""
+    write_text(svg_file, svg_data)
+    print(f"✅ Heart + Pulse SVG variation created: {svg_file}")
+
+def save_heart_pulse_svg_files():
+    """Save heart + pulse SVG variations to files"""
+    for svg_file, svg_data in zip(HEART_SVG_FILES, create_heart_pulse_svg_variations()):
+        write_text(svg_file, svg_data)
+    
+    print("✅ Heart + Pulse SVG variations created:")
+    print("   🫀 app-icon-heart-standard.svg")
+    print("   🌙 app-icon-heart-dark.svg") 
+    print("   🎨 app-icon-heart-tinted.svg")
+
+def build_render_jobs(sizes=(1024,), svgs=None):
+    """Build one independent render job per (variant, size) pair"""
+    return DESIGN.render_jobs(sizes, svgs)
+
+def convert_variants(backend=None, jobs=None, sizes=(1024,), cache=None):
+    """Render the standard, dark and tinted variations at every size with one backend
+
+    backend is any rasterizer name; None picks the fastest calibrated one.
+    """
+    return render_design(DESIGN, backend, jobs, sizes, cache)
+
+def create_preview_html(thumbnails=False, backend_name=None):
+    """Create an HTML preview of the new heart + pulse icon
+
+    The standard, dark and tinted tiles draw the design's own variations
+    from one shared sprite (or cached PNG thumbnails).
+    """
+    from string import Template
+
+    from .cache import RenderCache
+    from .preview import icon_tiles
+
+    # Tiles fill the 180px .icon-container boxes
+    sprite, tiles = icon_tiles(DESIGN.variations(), [180] * len(VARIANTS), ['Standard', 'Dark Mode', 'Tinted'],
+                               thumbnails, backend_name, RenderCache() if thumbnails else None)
+    html_content = Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>BreathEasy Heart + Pulse App Icon Preview</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            margin: 0;
+            padding: 20px;
+            min-height: 100vh;
+            display: flex;
+            flex-direction: column;
+            align-items: center;
+        }
+        
+        .container {
+            background: rgba(255, 255, 255, 0.95);
+            border-radius: 20px;
+            padding: 40px;
+            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
+            text-align: center;
+            max-width: 800px;
+        }
+        
+        h1 {
+            color: #2c3e50;
+            margin-bottom: 30px;
+            font-size: 2.5em;
+        }
+        
+        .icon-showcase {
+            display: flex;
+            justify-content: center;
+            gap: 30px;
+            margin: 40px 0;
+            flex-wrap: wrap;
+        }
+        
+        .icon-item {
+            text-align: center;
+        }
+        
+        .icon-container {
+            width: 180px;
+            height: 180px;
+            border-radius: 40px;
+            overflow: hidden;
+            box-shadow: 0 10px 25px rgba(0,0,0,0.15);
+            margin-bottom: 15px;
+            transition: transform 0.3s ease;
+        }
+        
+        .icon-container:hover {
+            transform: scale(1.05);
+        }
+        
+        .icon-container.dark {
+            background: #2c3e50;
+        }
+        
+        .icon-container.tinted {
+            background: #95a5a6;
+        }
+        
+        .icon-container svg {
+            width: 100%;
+            height: 100%;
+        }
+        
+        .icon-label {
+            font-weight: 600;
+            color: #34495e;
+            font-size: 1.1em;
+        }
+        
+        .features {
+            text-align: left;
+            background: #f8f9fa;
+            padding: 30px;
+            border-radius: 15px;
+            margin: 30px 0;
+        }
+        
+        .features h3 {
+            color: #2c3e50;
+            margin-bottom: 20px;
+            font-size: 1.5em;
+        }
+        
+        .features ul {
+            list-style: none;
+            padding: 0;
+        }
+        
+        .features li {
+            padding: 8px 0;
+            display: flex;
+            align-items: center;
+        }
+        
+        .features li::before {
+            content: "🫀";
+            margin-right: 10px;
+            font-size: 1.2em;
+        }
+        
+        .color-palette {
+            display: flex;
+            justify-content: center;
+            gap: 15px;
+            margin: 20px 0;
+            flex-wrap: wrap;
+        }
+        
+        .color-swatch {
+            width: 60px;
+            height: 60px;
+            border-radius: 50%;
+            border: 3px solid white;
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        }
+        
+        .pulse-demo {
+            background: #2c3e50;
+            color: white;
+            padding: 20px;
+            border-radius: 15px;
+            margin: 20px 0;
+        }
+    </style>
+</head>
+<body>
+    $sprite
+    <div class="container">
+        <h1>🫀 BreathEasy Heart + Pulse Icon</h1>
+        
+        <div class="icon-showcase">
+            <div class="icon-item">
+                <div class="icon-container">$standard</div>
+                <div class="icon-label">Standard</div>
+            </div>
+            
+            <div class="icon-item">
+                <div class="icon-container dark">$dark</div>
+                <div class="icon-label">Dark Mode</div>
+            </div>
+            
+            <div class="icon-item">
+                <div class="icon-container tinted">$tinted</div>
+                <div class="icon-label">Tinted</div>
+            </div>
+        </div>
+        
+        <div class="features">
+            <h3>🎯 Design Features</h3>
+            <ul>
+                <li>Heart symbol representing life and wellness</li>
+                <li>Pulse wave showing heart rate monitoring</li>
+                <li>Breathing ripples for meditation guidance</li>
+                <li>Calming color palette for relaxation</li>
+                <li>Central focus point for breathing exercises</li>
+                <li>Air flow curves suggesting natural breathing</li>
+                <li>Glow effects for premium feel</li>
+                <li>Perfect for health and wellness apps</li>
+            </ul>
+        </div>
+        
+        <div class="pulse-demo">
+            <h3>💗 Heart + Breathing Integration</h3>
+            <p>This icon perfectly represents the BreathEasy app's core functionality:</p>
+            <p><strong>❤️ Heart Health:</strong> Central heart symbol for cardiovascular wellness</p>
+            <p><strong>📊 Pulse Monitoring:</strong> EKG-style wave for heart rate tracking</p>
+            <p><strong>🫁 Breathing Focus:</strong> Ripples and flow lines for breath awareness</p>
+        </div>
+        
+        <div>
+            <h3>🎨 Color Palette</h3>
+            <div class="color-palette">
+                <div class="color-swatch" style="background: #FF6B8A;" title="Heart Pink"></div>
+                <div class="color-swatch" style="background: #4CAF50;" title="Health Green"></div>
+                <div class="color-swatch" style="background: #A7C7E7;" title="Calm Blue"></div>
+                <div class="color-swatch" style="background: #B2D8B2;" title="Serenity Green"></div>
+                <div class="color-swatch" style="background: #87CEEB;" title="Sky Blue"></div>
+            </div>
+        </div>
+    </div>
+</body>
+</html>''').substitute(
+        sprite=sprite, **{name: tile for (name, _), tile in zip(VARIANTS, tiles)})
+    
+    write_text('heart-pulse-icon-preview.html', html_content)
+    
+    print("✅ Created heart-pulse-icon-preview.html")
+
+def conversion_failed():
+    """Fallback when no rasterizer backend is available"""
+    print("\n⚠️  PNG conversion failed - please use manual conversion")
+    print("📝 Check heart-pulse-icon-preview.html for design preview")
+
+def install_icons():
+    """Build action for the AppIcon.appiconset copies"""
+    if copy_to_appicon_folder():
+        print("\n✅ Heart + Pulse icons installed successfully!")
+        print("🚀 You can now build your app in Xcode to see the new heart + pulse icon")
+        return True
+    print("\n⚠️  Please manually copy PNG files to AppIcon.appiconset folder")
+    return False
+
+def add_preview_node(graph, thumbnails=False, backend_name=None):
+    """Preview page node: its markup lives in this file and its tiles draw the design's variations"""
+    graph.add('preview', ['heart-pulse-icon-preview.html'],
+              dict(preview_inputs(DESIGN.variations(), thumbnails, backend_name), generator=source_hash(__file__)),
+              action=lambda: create_preview_html(thumbnails, backend_name))
+
+def build_graph(args, cache=None):
+    """Describe every output of this script as a node of an incremental build graph"""
+    graph = BuildGraph('generate_heart_pulse_icons')
+    svgs = DESIGN.variations(precision=args.precision)
+    add_preview_node(graph)
+    
+    # SVG variations, PNG renders and the AppIcon.appiconset install
+    return add_design_nodes(graph, DESIGN, args, cache, save_heart_pulse_svg_file, install_icons,
+                            render_heading="\n🔄 Converting SVG to PNG...",
+                            on_render_failure=conversion_failed, svgs=svgs, generator=__file__)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate BreathEasy heart + pulse app icon PNGs")
+    add_render_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("🫀 Generating BreathEasy Heart + Pulse App Icons...")
+    
+    # Only stale outputs are rebuilt; the manifest lives next to the render cache
+    cache = render_cache(args)
+    try:
+        with tracing(args, 'generate_heart_pulse_icons'):
+            graph = build_graph(args, cache)
+            return graph.run(dry_run=args.dry_run)
+    except TokenError as e:
+        print(f"❌ {e}")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
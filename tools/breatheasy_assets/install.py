@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Atomic install of generated icons into AppIcon.appiconset
+A complete copy of the icon set is staged next to the asset catalog (files
+are hardlinked or reflinked, never forked through `cp`) and swapped in with
+one directory exchange, so Xcode never sees a half-updated set
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+# Linux FICLONE ioctl: share extents copy-on-write (btrfs, XFS)
+_FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    """Try a copy-on-write clone of src to dst; return False if unsupported"""
+    if not sys.platform.startswith('linux'):
+        return False
+    import fcntl
+
+    with open(src, 'rb') as source, open(dst, 'wb') as target:
+        try:
+            fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+        except OSError:
+            return False
+    return True
+
+
+def link_or_copy(src, dst, hardlink=True):
+    """Place src at dst through a temp name and os.replace
+
+    Prefers a hardlink, then a reflink, and only copies bytes as a last resort.
+    With hardlink=False dst never shares src's inode, so writing to one cannot
+    change the other. Returns the method used ('link', 'reflink' or 'copy').
+    """
+    tmp_path = os.path.join(os.path.dirname(os.path.abspath(dst)),
+                            f".{os.path.basename(dst)}.{os.getpid()}.tmp")
+    try:
+        try:
+            if not hardlink:
+                raise OSError("hardlink not allowed")
+            os.link(src, tmp_path)
+            method = 'link'
+        except OSError:
+            if _reflink(src, tmp_path):
+                method = 'reflink'
+            else:
+                shutil.copyfile(src, tmp_path)
+                method = 'copy'
+        os.replace(tmp_path, dst)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return method
+
+
+def _exchange(a, b):
+    """Atomically swap two paths; return False where the OS offers no swap call"""
+    import ctypes
+    import ctypes.util
+
+    libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+    if sys.platform.startswith('linux') and hasattr(libc, 'renameat2'):
+        at_fdcwd, rename_exchange = -100, 2
+        result = libc.renameat2(at_fdcwd, os.fsencode(a), at_fdcwd, os.fsencode(b), rename_exchange)
+    elif sys.platform == 'darwin' and hasattr(libc, 'renamex_np'):
+        rename_swap = 0x2
+        result = libc.renamex_np(os.fsencode(a), os.fsencode(b), rename_swap)
+    else:
+        return False
+    if result != 0:
+        errno = ctypes.get_errno()
+        if errno in (22, 38, 45, 95):  # EINVAL, ENOSYS, ENOTSUP/EOPNOTSUPP: no swap here
+            return False
+        raise OSError(errno, os.strerror(errno), a)
+    return True
+
+
+def _backup_path(target):
+    parent, name = os.path.split(os.path.abspath(target))
+    return os.path.join(os.path.dirname(parent), f".{name}.previous")
+
+
+def recover_interrupted_install(target):
+    """Restore the previous icon set if an earlier non-atomic swap was interrupted"""
+    backup = _backup_path(target)
+    if os.path.isdir(backup):
+        if not os.path.exists(target):
+            os.rename(backup, target)
+            print(f"♻️  Restored {os.path.basename(target)} from an interrupted install")
+        else:
+            shutil.rmtree(backup)
+
+
+def swap_in(staging, target):
+    """Replace the target directory with staging as one step"""
+    if os.path.exists(target) and _exchange(staging, target):
+        # staging now holds the old set
+        shutil.rmtree(staging)
+        return
+    # Fallback: two renames; recover_interrupted_install() repairs a crash in between
+    backup = _backup_path(target)
+    if os.path.exists(target):
+        os.rename(target, backup)
+    os.rename(staging, target)
+    if os.path.exists(backup):
+        shutil.rmtree(backup)
+
+
+def install_appiconset(appicon_path, files, contents=None):
+    """Atomically install files into an .appiconset directory
+
+    files maps a filename inside the set to either a source path (linked into
+    place) or PNG bytes. contents, if given, replaces Contents.json. Every other
+    file of the current set is carried over. The staging directory sits next
+    to the asset catalog, outside it, so Xcode never indexes it.
+    Returns {filename: method} for the installed files.
+    """
+    appicon_path = os.path.abspath(appicon_path)
+    recover_interrupted_install(appicon_path)
+    if not os.path.isdir(appicon_path):
+        raise FileNotFoundError(f"AppIcon folder not found: {appicon_path}")
+
+    catalog_parent = os.path.dirname(os.path.dirname(appicon_path))
+    staging = tempfile.mkdtemp(prefix=f".{os.path.basename(appicon_path)}.", suffix='.staging',
+                               dir=catalog_parent)
+    methods = {}
+    try:
+        replaced = set(files)
+        if contents is not None:
+            replaced.add('Contents.json')
+        for entry in os.scandir(appicon_path):
+            if entry.is_file() and entry.name not in replaced:
+                link_or_copy(entry.path, os.path.join(staging, entry.name))
+
+        for filename, source in files.items():
+            destination = os.path.join(staging, filename)
+            if isinstance(source, bytes):
+                with open(destination, 'wb') as f:
+                    f.write(source)
+                methods[filename] = 'write'
+            else:
+                methods[filename] = link_or_copy(source, destination)
+
+        if contents is not None:
+            with open(os.path.join(staging, 'Contents.json'), 'w') as f:
+                json.dump(contents, f, indent=2)
+
+        os.chmod(staging, os.stat(appicon_path).st_mode & 0o7777)
+        swap_in(staging, appicon_path)
+    finally:
+        if os.path.exists(staging):
+            shutil.rmtree(staging)
+    return methods
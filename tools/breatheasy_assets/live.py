@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Live preview server for the BreathEasy icon designs
+Serves a page with every variant of one design at a few sizes and watches
+the design's generator module, the design-token Swift sources and an
+optional standalone SVG (inotify where the kernel has it, polling
+otherwise). After an edit only the variants whose SVG text changed are
+re-rendered, through the render cache, and the open page is told over
+Server-Sent Events which tiles to swap. Editing any other module of the
+package restarts the server, since imported modules cannot be reloaded safely.
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8765
+
+# Large preview, 60pt@2x home screen and 29pt@2x settings
+DEFAULT_SIZES = (256, 120, 58)
+
+# Editors save in bursts (write, rename, chmod); changes this close together are one edit
+DEBOUNCE_SECONDS = 0.03
+
+POLL_INTERVAL = 0.2
+
+# Seconds between SSE comments that keep idle connections open
+KEEPALIVE_SECONDS = 15
+
+# Fast zlib level: live renders are viewed once, not shipped
+LIVE_ENCODER = {'live': 1, 'level': 1}
+
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+class InotifyWatcher:
+    """Directory watcher on Linux inotify through ctypes (no third-party package)"""
+
+    def __init__(self, directories):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories = {}
+        for directory in directories:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self._directories[wd] = directory
+
+    def _read(self, timeout):
+        import select
+        import struct
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self._fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = struct.unpack_from('iIII', data, offset)
+            name = data[offset + 16:offset + 16 + length].rstrip(b'\0')
+            offset += 16 + length
+            if name and wd in self._directories:
+                changed.add(os.path.join(self._directories[wd], os.fsdecode(name)))
+        return changed
+
+    def changes(self):
+        """Block until files change; return their paths (one editor save is one batch)"""
+        changed = set()
+        while not changed:
+            changed = self._read(None)
+        while True:
+            more = self._read(DEBOUNCE_SECONDS)
+            if not more:
+                return changed
+            changed |= more
+
+
+class PollingWatcher:
+    """Portable fallback: compares (mtime, size) of the watched directories' files"""
+
+    def __init__(self, directories, interval=POLL_INTERVAL):
+        self.directories = list(directories)
+        self.interval = interval
+        self._state = self._snapshot()
+
+    def _snapshot(self):
+        state = {}
+        for directory in self.directories:
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    stat = entry.stat()
+                    state[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def changes(self):
+        while True:
+            time.sleep(self.interval)
+            state = self._snapshot()
+            changed = {path for path in state.keys() | self._state.keys()
+                       if state.get(path) != self._state.get(path)}
+            self._state = state
+            if changed:
+                return changed
+
+
+def file_watcher(directories):
+    """inotify on Linux, polling anywhere else or when inotify is out of watches"""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify unavailable ({e}); polling every {POLL_INTERVAL:g}s")
+    return PollingWatcher(directories)
+
+
+class LivePreview:
+    """Current renders of one design and the event queues of the open pages
+
+    tiles maps (variant, size) to the cache key of its PNG; a reload renders
+    only variants whose SVG text changed and whose key the cache lacks.
+    """
+
+    def __init__(self, design_name, module_name, backend, cache, sizes=DEFAULT_SIZES, svg_path=None):
+        import importlib.util
+
+        self.design_name = design_name
+        self.module_name = module_name
+        self.module_path = os.path.abspath(importlib.util.find_spec(module_name).origin)
+        self.backend = backend
+        self.cache = cache
+        self.sizes = list(sizes)
+        self.svg_path = svg_path
+        self.svgs = {}
+        self.tiles = {}
+        self.status = "Starting"
+        self.error = None
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def load_design(self):
+        """Execute the generator module afresh and return its IconDesign"""
+        import runpy
+
+        from .design import IconDesign
+
+        design = runpy.run_module(self.module_name, run_name='__live__')['DESIGN']
+        if self.svg_path:
+            with open(self.svg_path) as f:
+                design = IconDesign(design.name, f.read(), design.dark_palette, design.tinted_palette,
+                                    design.svg_files, design.label_prefix)
+        return design
+
+    def _render(self, svg, size):
+        import tempfile
+
+        from .cache import render_key
+        from .png import encode_png
+
+        key = render_key(svg, size, size, self.backend.name, self.backend.version(), LIVE_ENCODER)
+        if os.path.exists(self.cache.path_for(key)):
+            return key, False
+        fd, tmp_path = tempfile.mkstemp(suffix='.png')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(encode_png(self.backend.render_rgba(svg, size, size), level=LIVE_ENCODER['level']))
+            self.cache.store(key, tmp_path)
+        finally:
+            os.remove(tmp_path)
+        return key, True
+
+    def reload(self, reason="start"):
+        """Re-render what changed and notify the pages; keep the last good tiles on errors"""
+        from .design import VARIANTS
+
+        started = time.perf_counter()
+        changed_tiles = {}
+        rendered = 0
+        try:
+            svgs = dict(zip((variant for variant, _ in VARIANTS), self.load_design().variations()))
+            for variant, svg in svgs.items():
+                if self.svgs.get(variant) == svg:
+                    continue
+                for size in self.sizes:
+                    key, fresh = self._render(svg, size)
+                    rendered += fresh
+                    if self.tiles.get((variant, size)) != key:
+                        changed_tiles[(variant, size)] = key
+            if rendered:
+                self.cache.evict()
+            self.svgs = svgs
+            self.error = None
+        except Exception as e:  # a half-typed edit must not stop the server
+            self.error = f"{type(e).__name__}: {e}"
+        elapsed = (time.perf_counter() - started) * 1000
+
+        with self._lock:
+            self.tiles.update(changed_tiles)
+            if self.error:
+                self.status = f"❌ {reason}: {self.error}"
+            else:
+                self.status = (f"✅ {reason}: {len(changed_tiles)} tile(s) updated, "
+                               f"{rendered} rendered in {elapsed:.0f} ms")
+            self._broadcast(self._message(changed_tiles))
+        print(self.status)
+
+    def _message(self, tiles):
+        return {'status': self.status, 'error': self.error,
+                'tiles': {f'{variant}-{size}': f'/png/{key}.png' for (variant, size), key in tiles.items()}}
+
+    def _broadcast(self, message):
+        for listener in self._listeners:
+            listener.put(message)
+
+    def subscribe(self):
+        """A queue receiving every update, starting with the full current state"""
+        listener = queue.Queue()
+        with self._lock:
+            listener.put(self._message(self.tiles))
+            self._listeners.append(listener)
+        return listener
+
+    def unsubscribe(self, listener):
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def page(self):
+        from .design import VARIANTS
+
+        rows = []
+        for variant, _ in VARIANTS:
+            images = ''.join(f'<figure><img id="{variant}-{size}" width="{min(size, 180)}" alt=""'
+                             f' src="/png/{self.tiles[(variant, size)]}.png"><figcaption>{size}px</figcaption>'
+                             f'</figure>' if (variant, size) in self.tiles else ''
+                             for size in self.sizes)
+            rows.append(f'<section class="{variant}"><h2>{variant.title()}</h2>{images}</section>')
+        return LIVE_PAGE.format(design=self.design_name, rows=''.join(rows), status=self.status)
+
+
+LIVE_PAGE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>BreathEasy live preview: {design}</title>
+<style>
+    body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', system-ui, sans-serif;
+           background: #f5f7fa; color: #2C3E50; margin: 0; padding: 24px; }}
+    section {{ display: flex; align-items: flex-end; gap: 24px; padding: 16px; border-radius: 16px;
+              margin-bottom: 16px; background: white; }}
+    section.dark {{ background: #2c3e50; color: white; }}
+    section.tinted {{ background: #95a5a6; }}
+    h2 {{ width: 90px; font-weight: 500; font-size: 1rem; margin: 0; align-self: center; }}
+    figure {{ margin: 0; text-align: center; font-size: 0.8rem; }}
+    img {{ display: block; border-radius: 22%; height: auto; }}
+    #status {{ font-family: ui-monospace, monospace; font-size: 0.85rem; }}
+    #status.error {{ color: #c0392b; }}
+</style>
+</head>
+<body>
+<h1>🫀 {design} <small>live</small></h1>
+<p id="status">{status}</p>
+{rows}
+<script>
+    const status = document.getElementById('status');
+    const events = new EventSource('/events');
+    events.onmessage = (event) => {{
+        const update = JSON.parse(event.data);
+        for (const [id, src] of Object.entries(update.tiles)) {{
+            const image = document.getElementById(id);
+            if (image) image.src = src; else location.reload();
+        }}
+        status.textContent = update.status;
+        status.className = update.error ? 'error' : '';
+    }};
+    events.onerror = () => {{ status.textContent = '⏳ Reconnecting…'; }};
+</script>
+</body>
+</html>
+'''
+
+
+class LiveRequestHandler(BaseHTTPRequestHandler):
+    """/ is the page, /events the SSE stream, /png/<key>.png a cached render"""
+
+    live = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, content_type, cache_control='no-cache'):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', cache_control)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = self.path.split('?', 1)[0]
+        if path == '/':
+            self._send(self.live.page().encode('utf-8'), 'text/html; charset=utf-8')
+        elif path == '/events':
+            self._stream_events()
+        elif path.startswith('/png/') and path.endswith('.png'):
+            key = path[len('/png/'):-len('.png')]
+            if not key.isalnum():
+                self.send_error(404)
+                return
+            try:
+                with open(self.live.cache.path_for(key), 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                self.send_error(404, "Evicted from the render cache")
+                return
+            # A key names one exact render, so the browser may keep it forever
+            self._send(data, 'image/png', 'max-age=31536000, immutable')
+        else:
+            self.send_error(404)
+
+    def _stream_events(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        listener = self.live.subscribe()
+        try:
+            while True:
+                try:
+                    message = f"data: {json.dumps(listener.get(timeout=KEEPALIVE_SECONDS))}\n\n"
+                except queue.Empty:
+                    message = ": keepalive\n\n"
+                self.wfile.write(message.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.live.unsubscribe(listener)
+
+
+def classify(path, live, helper_directory):
+    """'design' for inputs of the previewed design, 'restart' for shared helper modules, else None"""
+    path = os.path.abspath(path)
+    name = os.path.basename(path)
+    if path in (live.module_path, live.svg_path):
+        return 'design'
+    if name.endswith('.swift'):
+        return 'tokens'
+    if os.path.dirname(path) == helper_directory and name.endswith('.py'):
+        return 'restart'
+    return None
+
+
+def watch(live, helper_directory, token_directories):
+    """Watcher loop (run on a thread): reload the design or restart the process on edits"""
+    from . import tokens
+
+    directories = {helper_directory, os.path.dirname(live.module_path), *token_directories}
+    if live.svg_path:
+        directories.add(os.path.dirname(live.svg_path))
+    watcher = file_watcher(sorted(directories))
+    while True:
+        changed = watcher.changes()
+        kinds = {path: classify(path, live, helper_directory) for path in changed}
+        if 'restart' in kinds.values():
+            helpers = ', '.join(sorted(os.path.basename(p) for p, kind in kinds.items() if kind == 'restart'))
+            print(f"♻️  {helpers} changed; restarting")
+            os.execv(sys.executable, sys.orig_argv)
+        relevant = sorted(os.path.basename(p) for p, kind in kinds.items() if kind)
+        if not relevant:
+            continue
+        if 'tokens' in kinds.values():
+            tokens.forget_index()
+        live.reload(', '.join(relevant) + " changed")
+
+
+def serve(live, port=DEFAULT_PORT, host='127.0.0.1'):
+    """Render once, start the watcher thread and serve until interrupted"""
+    from .tokens import DESIGN_SOURCES, swift_files
+
+    helper_directory = os.path.dirname(os.path.abspath(__file__))
+    token_directories = {os.path.dirname(os.path.abspath(path)) for path in swift_files(DESIGN_SOURCES)}
+    live.reload()
+    threading.Thread(target=watch, args=(live, helper_directory, token_directories), daemon=True).start()
+
+    handler = type('Handler', (LiveRequestHandler,), {'live': live})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    print(f"👀 Live preview of {live.design_name} on http://{host}:{port}/ (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.server_close()
+    return True
+
+
+def add_live_arguments(parser):
+    from .cache import DEFAULT_CACHE_DIR
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"HTTP port (default: {DEFAULT_PORT})")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help=f"pixel sizes shown per variant (default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--svg', help="preview this standalone SVG file as the standard variant "
+                                      "(dark and tinted use the design's palettes)")
+    parser.add_argument('--backend', choices=sorted(DEFAULT_BACKEND_ORDER),
+                        help="rasterizer backend (default: fastest available)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"render cache location (default: {DEFAULT_CACHE_DIR})")
+
+
+def live_preview(design_name, module_name, args):
+    """Build the LivePreview for a design module (e.g. breatheasy_assets.heart) and serve it"""
+    from .cache import RenderCache
+    from .rasterizers import RasterizerError, get_rasterizer
+    from .tokens import TokenError, token_index
+
+    try:
+        # Edits are reported on the page, but a checkout without the design sources is fatal
+        token_index()
+        backend = get_rasterizer(args.backend)
+    except (RasterizerError, TokenError) as e:
+        print(f"❌ {e}")
+        return False
+    svg_path = os.path.abspath(args.svg) if args.svg else None
+    live = LivePreview(design_name, module_name, backend, RenderCache(args.cache_dir), args.sizes, svg_path)
+    return serve(live, args.port, args.host)
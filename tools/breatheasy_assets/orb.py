@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Generate PNG app icons from SVG design for iOS app
+Creates standard, dark, and tinted variations
+"""
+
+import argparse
+import sys
+
+from .build import BuildGraph, write_text
+from .design import (IconDesign, add_design_nodes, add_render_arguments, copy_to_appicon_folder,
+                            render_cache, render_design)
+from .svg_builder import (SvgBuilder, circle, ellipse, group, linear_gradient, radial_gradient,
+                               rotations, stop)
+from .tokens import TokenError, palette, resolve
+from .tracing import tracing
+
+# Dark version - adjust colors for dark appearance
+DARK_PALETTE = palette({
+    'stop-color:$oceanTeal': '#1e3a5f',
+    'stop-color:$softSkyBlue': '#2d4f73',
+    'stop-color:$sageGreen': '#2d4a2d',
+    'stop-color:$lavenderMist': '#4a2d4a',
+    'stroke:#ffffff': '#cccccc',
+    'fill:#ffffff': '#cccccc',
+})
+
+# Tinted version - more monochrome for tinted appearance
+TINTED_PALETTE = palette({
+    '$oceanTeal': '#888888',
+    '$softSkyBlue': '#999999',
+    '$sageGreen': '#aaaaaa',
+    '$lavenderMist': '#bbbbbb',
+})
+
+# Zen particles: (x, y, radius, color, opacity)
+ZEN_PARTICLES = [
+    (350, 280, 4, '#ffffff', 0.6),
+    (680, 320, 3, '$softSkyBlue', 0.5),
+    (400, 750, 5, '$sageGreen', 0.4),
+    (720, 680, 3, '$lavenderMist', 0.5),
+    (280, 600, 4, '$oceanTeal', 0.6),
+    (780, 450, 3, '#ffffff', 0.4),
+]
+
+# Breathing rings, innermost first: (radius, color, opacity)
+BREATHING_RINGS = [(120, '#ffffff', 0.4), (150, '$softSkyBlue', 0.3), (180, '$sageGreen', 0.2)]
+
+def orb_svg(petals=8):
+    """The orb design's SVG (standard version) with a ring of evenly spaced lotus petals"""
+    svg = SvgBuilder()
+    svg.define(radial_gradient('serenityGradient', [
+        stop('0%', '$oceanTeal'), stop('30%', '$softSkyBlue'), stop('70%', '$sageGreen'),
+        stop('100%', '$lavenderMist'),
+    ], cx='50%', cy='50%', r='50%'))
+    svg.define(radial_gradient('orbGradient', [
+        stop('0%', '#ffffff', 0.9), stop('50%', '$softSkyBlue', 0.7), stop('100%', '$oceanTeal', 0.5),
+    ], cx='50%', cy='50%', r='40%'))
+    svg.define(linear_gradient('petalGradient', [
+        stop('0%', '$lavenderMist', 0.8), stop('100%', '$sageGreen', 0.6),
+    ], x1='0%', y1='0%', x2='100%', y2='100%'))
+
+    svg.add(circle(512, 512, 512, fill='url(#serenityGradient)'))
+    # Lotus petals, one shape instanced around the center
+    petal = ellipse(0, -180, 40, 80, fill='url(#petalGradient)', opacity=0.7)
+    svg.add(group(*svg.repeat(petal, rotations(petals), 'petal'), transform='translate(512,512)'))
+    for radius, color, opacity in BREATHING_RINGS:
+        svg.add(circle(512, 512, radius, fill='none', stroke=color, stroke_width=2, opacity=opacity))
+    svg.add(circle(512, 512, 80, fill='url(#orbGradient)'))
+    for x, y, radius, color, opacity in ZEN_PARTICLES:
+        svg.add(circle(x, y, radius, fill=color, opacity=opacity))
+    return resolve(svg.markup())
+
+SVG_FILES = ['app-icon-standard.svg', 'app-icon-dark.svg', 'app-icon-tinted.svg']
+
+DESIGN = IconDesign('orb', orb_svg, DARK_PALETTE, TINTED_PALETTE, SVG_FILES)
+
+# Structural sweep parameters (petals) are arguments of this template
+SWEEP_TEMPLATE = orb_svg
+
+def set_ring_radii(variant, radii):
+    """Overlay the breathing ring radii, innermost first"""
+    rings = [circle for circle in variant.document.iter('circle') if circle.get('fill') == 'none']
+    for ring, radius in zip(rings, radii):
+        variant.set(ring, 'r', f'{radius:g}')
+
+def sweep_parameters():
+    """Design parameters `breatheasy-assets sweep` can vary"""
+    from .sweep import Parameter, radii
+
+    return [
+        Parameter('petals', 8, int, help="lotus petal count"),
+        Parameter('rings', (120, 150, 180), radii, set_ring_radii, help="breathing ring radii, innermost first"),
+    ]
+
+def create_svg_variations():
+    """Create SVG variations for different appearances"""
+    return DESIGN.variations()
+
+def save_svg_file(svg_file, svg_data):
+    """Save one SVG variation"""
+    write_text(svg_file, svg_data)
+    print(f"✅ SVG variation created: {svg_file}")
+
+def save_svg_files():
+    """Save SVG variations to files"""
+    for svg_file, svg_data in zip(SVG_FILES, create_svg_variations()):
+        write_text(svg_file, svg_data)
+    
+    print("✅ SVG variations created: app-icon-standard.svg, app-icon-dark.svg, app-icon-tinted.svg")
+
+def build_render_jobs(sizes=(1024,), svgs=None):
+    """Build one independent render job per (variant, size) pair"""
+    return DESIGN.render_jobs(sizes, svgs)
+
+def convert_with_backend(name=None, jobs=None, sizes=(1024,), cache=None):
+    """Render all variations and sizes with one backend (auto-selected if name is None)"""
+    return render_design(DESIGN, name, jobs, sizes, cache)
+
+def convert_with_imagemagick():
+    """Try to convert using ImageMagick"""
+    return convert_with_backend('imagemagick')
+
+def convert_with_rsvg():
+    """Try to convert using rsvg-convert"""
+    return convert_with_backend('rsvg')
+
+def create_manual_instructions():
+    """Create instructions for manual conversion"""
+    instructions = """
+🎨 Manual PNG Generation Instructions
+
+Since automatic conversion tools aren't available, please use one of these methods:
+
+METHOD 1: Online SVG to PNG Converter
+1. Go to: https://convertio.co/svg-png/ or https://cloudconvert.com/svg-to-png
+2. Upload: app-icon-standard.svg → Convert to PNG (1024×1024)
+3. Upload: app-icon-dark.svg → Convert to PNG (1024×1024) 
+4. Upload: app-icon-tinted.svg → Convert to PNG (1024×1024)
+5. Rename files to:
+   - app-icon-1024.png
+   - app-icon-1024-dark.png
+   - app-icon-1024-tinted.png
+
+METHOD 2: Preview App (macOS)
+1. Open each SVG file in Preview
+2. File → Export → Format: PNG → Resolution: 1024×1024
+3. Save with correct filenames
+
+METHOD 3: Install ImageMagick
+1. brew install imagemagick
+2. Run this script again
+
+📁 Final Step:
+Copy all three PNG files to: BreathEasy/Assets.xcassets/AppIcon.appiconset/
+
+🎯 The Contents.json file is already configured correctly!
+"""
+    
+    with open('manual-conversion-instructions.txt', 'w') as f:
+        f.write(instructions)
+    
+    print("📝 Created manual-conversion-instructions.txt")
+
+def conversion_failed():
+    """Fallback when no rasterizer backend is available"""
+    print("\n⚠️  Automatic conversion failed")
+    create_manual_instructions()
+    print("\n📋 Please follow the manual conversion instructions")
+
+def install_icons():
+    """Build action for the AppIcon.appiconset copies"""
+    if copy_to_appicon_folder():
+        print("\n✅ App icons installed successfully!")
+        print("🚀 You can now build your app in Xcode to see the new icon")
+        return True
+    print("\n⚠️  Please manually copy PNG files to AppIcon.appiconset folder")
+    return False
+
+def build_graph(args, cache=None):
+    """Describe every output of this script as a node of an incremental build graph"""
+    graph = BuildGraph('generate_png_icons')
+    return add_design_nodes(graph, DESIGN, args, cache, save_svg_file, install_icons,
+                            render_heading="\n🔄 Attempting automatic PNG conversion...",
+                            on_render_failure=conversion_failed, generator=__file__)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate BreathEasy app icon PNGs")
+    add_render_arguments(parser)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("🎨 Generating BreathEasy App Icons...")
+    
+    # Only stale outputs are rebuilt; the manifest lives next to the render cache
+    cache = render_cache(args)
+    try:
+        with tracing(args, 'generate_png_icons'):
+            graph = build_graph(args, cache)
+            return graph.run(dry_run=args.dry_run)
+    except TokenError as e:
+        print(f"❌ {e}")
+        return False
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Single-pass palette remapping for the BreathEasy icon SVGs
+A PaletteMap applies a whole {source_color: target_color} table in one regex
+scan, so mappings never see each other's output and their order is irrelevant
+"""
+
+import re
+
+# Paint properties whose hex colors can be remapped, in both the attribute
+# (fill="#fff") and style declaration (stop-color:#fff) forms
+PAINT_PROPERTIES = ('stop-color', 'flood-color', 'fill', 'stroke')
+
+_PAINT_RE = re.compile(
+    r'(?<![\w-])(?P<prop>' + '|'.join(re.escape(p) for p in PAINT_PROPERTIES) + r')'
+    r'(?P<sep>\s*:\s*|\s*=\s*["\'])'
+    r'(?P<color>#(?:[0-9A-Fa-f]{6}|[0-9A-Fa-f]{3})(?![0-9A-Fa-f]))'
+)
+
+
+def normalize_color(color):
+    """Return a lowercase 6-digit hex color (#ABC → #aabbcc)"""
+    color = color.strip().lower()
+    if len(color) == 4 and color.startswith('#'):
+        color = '#' + ''.join(c * 2 for c in color[1:])
+    return color
+
+
+class PaletteMap:
+    """Declarative color table applied to SVG text in one pass
+
+    Keys are source colors, optionally scoped to one paint property:
+
+        PaletteMap({
+            '#87CEEB': '#888888',          # any fill/stroke/stop-color/flood-color
+            'stroke:#ffffff': '#cccccc',   # only stroke="#ffffff"
+        })
+
+    Source colors match case-insensitively and in 3- or 6-digit form; targets
+    are written exactly as given. A scoped key wins over an unscoped one.
+    """
+
+    def __init__(self, table):
+        self.table = dict(table)
+        self._any = {}
+        self._scoped = {prop: {} for prop in PAINT_PROPERTIES}
+        for source, target in self.table.items():
+            prop, _, color = source.rpartition(':')
+            if not prop:
+                self._any[normalize_color(color)] = target
+            elif prop in self._scoped:
+                self._scoped[prop][normalize_color(color)] = target
+            else:
+                raise ValueError(f"Unsupported paint property in palette key: {source}")
+
+    def __len__(self):
+        return len(self.table)
+
+    def lookup(self, prop, color):
+        """Return the target color for a paint property, or None if unmapped"""
+        color = normalize_color(color)
+        target = self._scoped.get(prop, {}).get(color)
+        if target is None:
+            target = self._any.get(color)
+        return target
+
+    def _replace(self, match):
+        target = self.lookup(match.group('prop'), match.group('color'))
+        if target is None:
+            return match.group(0)
+        return match.group('prop') + match.group('sep') + target
+
+    def apply(self, svg_data):
+        """Return svg_data with every mapped paint color replaced"""
+        return _PAINT_RE.sub(self._replace, svg_data)
+
+    def remap_attribute(self, name, value):
+        """Return one attribute value remapped (paint properties and style strings)"""
+        if name == 'style':
+            return self.apply(value)
+        if name in PAINT_PROPERTIES and value.startswith('#'):
+            target = self.lookup(name, value)
+            if target is not None:
+                return target
+        return value
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Minimal NumPy PNG reader/writer for the BreathEasy icon pipeline
+Decodes non-interlaced PNGs of any color type into RGBA uint8 arrays and
+writes RGBA arrays back out, without Pillow or other native dependencies
+"""
+
+import os
+import struct
+import zlib
+
+import numpy as np
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color types → channels per pixel
+_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+
+FILTER_NONE, FILTER_SUB, FILTER_UP, FILTER_AVERAGE, FILTER_PAETH = range(5)
+
+# App Store marketing icons must be opaque; transparency is composited onto
+# black, the same background App Store Connect would flatten them onto
+MARKETING_BACKGROUND = (0, 0, 0)
+
+
+class PNGError(Exception):
+    """Raised for PNG data this module cannot decode"""
+
+
+def iter_chunks(data):
+    """Yield (chunk_type, payload) for every chunk after the signature"""
+    if data[:8] != PNG_SIGNATURE:
+        raise PNGError("Not a PNG file")
+    offset = 8
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack('>I4s', data[offset:offset + 8])
+        payload = data[offset + 8:offset + 8 + length]
+        yield chunk_type, payload
+        offset += 12 + length
+        if chunk_type == b'IEND':
+            break
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa = np.abs(p - a)
+    pb = np.abs(p - b)
+    pc = np.abs(p - c)
+    return np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+
+
+def _unfilter(raw, height, stride, bpp):
+    """Undo per-row PNG filters and return the (height, stride) byte array
+
+    Reconstruction walks anti-diagonals of (row, pixel): every pixel on one
+    diagonal only depends on the previous two, so each step is one vectorized
+    operation and Average/Paeth rows cost O(height + width) NumPy calls.
+    """
+    rows = np.frombuffer(raw, dtype=np.uint8)[:height * (stride + 1)].reshape(height, stride + 1)
+    filters = rows[:, 0]
+    data = rows[:, 1:]
+    if not filters.any():
+        return data.copy()
+    if stride % bpp:
+        raise PNGError("Row length is not a whole number of pixels")
+
+    width = stride // bpp
+    data = data.reshape(height, width, bpp).astype(np.int16)
+    # One row/column of zero padding stands in for the "outside the image" bytes
+    recon = np.zeros((height + 1, width + 1, bpp), dtype=np.int16)
+    row_filters = filters.astype(np.int16)
+
+    if not np.isin(filters, (FILTER_AVERAGE, FILTER_PAETH)).any():
+        # Sub and Up only: one cumulative sum per row is enough
+        for y in range(height):
+            row = data[y]
+            if filters[y] == FILTER_SUB:
+                row = np.cumsum(row, axis=0)
+            elif filters[y] == FILTER_UP:
+                row = row + recon[y, 1:]
+            recon[y + 1, 1:] = row & 0xFF
+        return recon[1:, 1:].astype(np.uint8).reshape(height, stride)
+
+    for diagonal in range(height + width - 1):
+        ys = np.arange(max(0, diagonal - width + 1), min(height - 1, diagonal) + 1)
+        xs = diagonal - ys
+        left = recon[ys + 1, xs]
+        up = recon[ys, xs + 1]
+        up_left = recon[ys, xs]
+        kind = row_filters[ys][:, None]
+        prediction = np.select(
+            [kind == FILTER_SUB, kind == FILTER_UP, kind == FILTER_AVERAGE, kind == FILTER_PAETH],
+            [left, up, (left + up) >> 1, _paeth(left, up, up_left)],
+            0,
+        )
+        recon[ys + 1, xs + 1] = (data[ys, xs] + prediction) & 0xFF
+    return recon[1:, 1:].astype(np.uint8).reshape(height, stride)
+
+
+def _unpack_bits(rows, width, bit_depth):
+    """Expand 1/2/4-bit samples to one uint8 per sample"""
+    if bit_depth == 8:
+        return rows[:, :width]
+    shifts = np.arange(8 - bit_depth, -1, -bit_depth, dtype=np.uint8)
+    samples = (rows[:, :, None] >> shifts) & ((1 << bit_depth) - 1)
+    return samples.reshape(rows.shape[0], -1)[:, :width]
+
+
+def decode_png(data):
+    """Decode PNG bytes into an (height, width, 4) RGBA uint8 array"""
+    header = None
+    palette = None
+    transparency = None
+    idat = []
+    for chunk_type, payload in iter_chunks(data):
+        if chunk_type == b'IHDR':
+            header = struct.unpack('>IIBBBBB', payload)
+        elif chunk_type == b'PLTE':
+            palette = np.frombuffer(payload, dtype=np.uint8).reshape(-1, 3)
+        elif chunk_type == b'tRNS':
+            transparency = payload
+        elif chunk_type == b'IDAT':
+            idat.append(payload)
+    if header is None:
+        raise PNGError("Missing IHDR chunk")
+
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if interlace:
+        raise PNGError("Interlaced PNGs are not supported")
+    if color_type not in _CHANNELS:
+        raise PNGError(f"Unknown PNG color type {color_type}")
+    channels = _CHANNELS[color_type]
+    bits_per_pixel = channels * bit_depth
+    stride = (width * bits_per_pixel + 7) // 8
+    bpp = max(1, bits_per_pixel // 8)
+
+    rows = _unfilter(zlib.decompress(b''.join(idat)), height, stride, bpp)
+    if bit_depth == 16:
+        # Keep the most significant byte of every sample
+        samples = rows.reshape(height, width, channels, 2)[..., 0]
+    else:
+        samples = _unpack_bits(rows, width * channels, bit_depth).reshape(height, width, channels)
+
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    if color_type == 3:
+        if palette is None:
+            raise PNGError("Palette image without PLTE chunk")
+        indices = samples[..., 0]
+        alpha = np.full(256, 255, dtype=np.uint8)
+        if transparency:
+            alpha[:len(transparency)] = np.frombuffer(transparency, dtype=np.uint8)
+        full_palette = np.zeros((256, 3), dtype=np.uint8)
+        full_palette[:len(palette)] = palette
+        rgba[..., :3] = full_palette[indices]
+        rgba[..., 3] = alpha[indices]
+        return rgba
+
+    if color_type in (0, 4):
+        gray = samples[..., 0]
+        if bit_depth < 8:
+            gray = (gray.astype(np.uint16) * 255 // ((1 << bit_depth) - 1)).astype(np.uint8)
+        rgba[..., :3] = gray[..., None]
+    else:
+        rgba[..., :3] = samples[..., :3]
+    if color_type in (4, 6):
+        rgba[..., 3] = samples[..., -1]
+    else:
+        rgba[..., 3] = 255
+    return rgba
+
+
+def read_png(path):
+    """Read a PNG file into an (height, width, 4) RGBA uint8 array"""
+    with open(path, 'rb') as f:
+        return decode_png(f.read())
+
+
+def flatten(rgba, background=MARKETING_BACKGROUND):
+    """Composite an RGBA array onto an opaque background color; the result has alpha 255"""
+    rgba = np.asarray(rgba, dtype=np.uint8)
+    alpha = rgba[..., 3:].astype(np.uint16)
+    rgb = (rgba[..., :3] * alpha + np.asarray(background, dtype=np.uint16) * (255 - alpha) + 127) // 255
+    flat = np.empty_like(rgba)
+    flat[..., :3] = rgb
+    flat[..., 3] = 255
+    return flat
+
+
+def filter_rows(pixels, filter_type, bpp):
+    """Apply one PNG filter to every row of an (height, stride) uint8 array"""
+    current = pixels.astype(np.int16)
+    left = np.zeros_like(current)
+    left[:, bpp:] = current[:, :-bpp]
+    up = np.zeros_like(current)
+    up[1:] = current[:-1]
+    if filter_type == FILTER_NONE:
+        prediction = 0
+    elif filter_type == FILTER_SUB:
+        prediction = left
+    elif filter_type == FILTER_UP:
+        prediction = up
+    elif filter_type == FILTER_AVERAGE:
+        prediction = (left + up) >> 1
+    else:
+        up_left = np.zeros_like(current)
+        up_left[1:, bpp:] = current[:-1, :-bpp]
+        prediction = _paeth(left, up, up_left)
+    return ((current - prediction) & 0xFF).astype(np.uint8)
+
+
+def _chunk(chunk_type, payload):
+    return (struct.pack('>I', len(payload)) + chunk_type + payload
+            + struct.pack('>I', zlib.crc32(chunk_type + payload) & 0xFFFFFFFF))
+
+
+def build_png(width, height, bit_depth, color_type, compressed, palette=None, transparency=None):
+    """Assemble PNG bytes from critical chunks only (no ancillary metadata)"""
+    chunks = [
+        PNG_SIGNATURE,
+        _chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, bit_depth, color_type, 0, 0, 0)),
+    ]
+    if palette is not None:
+        chunks.append(_chunk(b'PLTE', bytes(palette)))
+    if transparency:
+        chunks.append(_chunk(b'tRNS', bytes(transparency)))
+    chunks.append(_chunk(b'IDAT', compressed))
+    chunks.append(_chunk(b'IEND', b''))
+    return b''.join(chunks)
+
+
+def encode_png(rgba, level=9, filter_type=FILTER_PAETH):
+    """Encode an (height, width, 4) RGBA uint8 array as PNG bytes
+
+    Fully opaque images are written as RGB (color type 2) without alpha.
+    """
+    rgba = np.ascontiguousarray(rgba, dtype=np.uint8)
+    height, width = rgba.shape[:2]
+    if (rgba[..., 3] == 255).all():
+        pixels, color_type = rgba[..., :3], 2
+    else:
+        pixels, color_type = rgba, 6
+    bpp = pixels.shape[2]
+    rows = filter_rows(pixels.reshape(height, width * bpp), filter_type, bpp)
+    raw = np.empty((height, width * bpp + 1), dtype=np.uint8)
+    raw[:, 0] = filter_type
+    raw[:, 1:] = rows
+    return build_png(width, height, 8, color_type, zlib.compress(raw.tobytes(), level))
+
+
+def write_png(path, rgba, level=9, filter_type=FILTER_PAETH):
+    """Atomically write an RGBA array to path as PNG"""
+    data = encode_png(rgba, level, filter_type)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return len(data)
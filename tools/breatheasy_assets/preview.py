@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Compact HTML preview tiles for the BreathEasy icon designs
+A PreviewBuilder turns any number of standalone icon SVGs into one hidden
+sprite: every id is namespaced per icon automatically, identical gradients
+and filters are emitted once, shapes repeated with only a different transform
+(lotus petals) become one shape plus <use> references, and each tile is a
+two-element <svg><use/></svg>. Alternatively a tile can embed a small raster
+thumbnail rendered once and kept in the render cache.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+
+# A leaf shape repeated at least this often in one icon is hoisted into the shared defs
+MIN_REPEATS = 3
+
+THUMBNAIL_SCALE = 2
+
+_URL_RE = re.compile(r'url\(\s*#([^)\s]+)\s*\)')
+
+
+def _strip_namespaces(element):
+    """Drop the SVG namespace from tags and turn xlink:href into plain href"""
+    for node in element.iter():
+        if isinstance(node.tag, str) and node.tag.startswith('{'):
+            node.tag = node.tag.split('}', 1)[1]
+        href = node.attrib.pop(f'{{{XLINK_NS}}}href', None)
+        if href is not None:
+            node.set('href', href)
+        node.text = node.text.strip() or None if node.text else None
+        node.tail = None
+
+
+def _rewrite_references(element, mapping):
+    """Point url(#id) and href="#id" references of an element tree at mapping[id]"""
+    def replace(match):
+        return f'url(#{mapping.get(match.group(1), match.group(1))})'
+
+    for node in element.iter():
+        for name, value in node.attrib.items():
+            if name == 'href' and value.startswith('#'):
+                node.set(name, '#' + mapping.get(value[1:], value[1:]))
+            elif 'url(' in value:
+                node.set(name, _URL_RE.sub(replace, value))
+
+
+def _markup(element):
+    return ET.tostring(element, encoding='unicode', short_empty_elements=True)
+
+
+def _key(element, skip=('id',)):
+    """Serialization of an element without some attributes, for content comparison"""
+    saved = {name: element.attrib.pop(name) for name in skip if name in element.attrib}
+    key = _markup(element)
+    element.attrib.update(saved)
+    return key
+
+
+class PreviewBuilder:
+    """Collects icon SVGs into one sprite of shared defs and per-icon symbols"""
+
+    def __init__(self, prefix='icon', min_repeats=MIN_REPEATS):
+        self.prefix = prefix
+        self.min_repeats = min_repeats
+        self.defs = []
+        self.symbols = []
+        self._shared = {}
+
+    def _share(self, element, wanted_id):
+        """Add element to the shared defs unless an identical one exists; return its id"""
+        key = _key(element)
+        shared_id = self._shared.get(key)
+        if shared_id is None:
+            shared_id = wanted_id
+            element.set('id', shared_id)
+            self._shared[key] = shared_id
+            self.defs.append(element)
+        return shared_id
+
+    def add(self, svg_data):
+        """Add one standalone icon SVG; return the symbol id a tile refers to"""
+        if isinstance(svg_data, bytes):
+            svg_data = svg_data.decode('utf-8')
+        root = ET.fromstring(svg_data)
+        _strip_namespaces(root)
+        namespace = f'{self.prefix}{len(self.symbols)}'
+
+        mapping = {}
+        body = []
+        for child in list(root):
+            if child.tag != 'defs':
+                body.append(child)
+                continue
+            # Definitions come first, so references between them resolve in order
+            for definition in list(child):
+                _rewrite_references(definition, mapping)
+                old_id = definition.get('id')
+                if old_id is None:
+                    continue
+                mapping[old_id] = self._share(definition, f'{namespace}-{old_id}')
+
+        for element in body:
+            for node in element.iter():
+                if node.get('id'):
+                    mapping.setdefault(node.get('id'), f"{namespace}-{node.get('id')}")
+                    node.set('id', mapping[node.get('id')])
+            _rewrite_references(element, mapping)
+        body = [self._hoist_repeats(element, namespace) for element in body]
+
+        symbol = ET.Element('symbol', {'id': namespace})
+        view_box = root.get('viewBox') or f"0 0 {root.get('width', '1024')} {root.get('height', '1024')}"
+        symbol.set('viewBox', view_box)
+        if root.get('preserveAspectRatio'):
+            symbol.set('preserveAspectRatio', root.get('preserveAspectRatio'))
+        symbol.extend(body)
+        self.symbols.append(symbol)
+        return namespace
+
+    def _hoist_repeats(self, element, namespace):
+        """Replace leaf shapes repeated min_repeats times (transform aside) by <use>"""
+        groups = {}
+        for parent in element.iter():
+            for child in parent:
+                if len(child) == 0 and 'id' not in child.attrib and child.tag != 'use':
+                    groups.setdefault(_key(child, ('transform',)), []).append((parent, child))
+        for repeats in groups.values():
+            if len(repeats) < self.min_repeats:
+                continue
+            shape = ET.Element(repeats[0][1].tag, {name: value for name, value in repeats[0][1].attrib.items()
+                                                   if name != 'transform'})
+            shape_id = self._share(shape, f'{namespace}-shape{len(self.defs)}')
+            for parent, child in repeats:
+                use = ET.Element('use', {'href': f'#{shape_id}'})
+                if child.get('transform'):
+                    use.set('transform', child.get('transform'))
+                parent[list(parent).index(child)] = use
+        return element
+
+    def sprite(self):
+        """The hidden <svg> holding every shared definition and symbol (place it once per page)
+
+        Hidden by size rather than display:none, which would disable its gradients.
+        """
+        defs = ''.join(_markup(definition) for definition in self.defs)
+        symbols = ''.join(_markup(symbol) for symbol in self.symbols)
+        return (f'<svg xmlns="{SVG_NS}" width="0" height="0" style="position:absolute" aria-hidden="true">'
+                f'<defs>{defs}</defs>{symbols}</svg>')
+
+    @staticmethod
+    def tile(symbol_id, size=None, label=None):
+        """Markup of one tile drawing a symbol (size in CSS pixels; None fills the container)"""
+        dimensions = f' width="{size}" height="{size}"' if size else ''
+        title = f'<title>{label}</title>' if label else ''
+        return f'<svg{dimensions} role="img">{title}<use href="#{symbol_id}"/></svg>'
+
+
+def thumbnail(svg_data, size, backend_name=None, cache=None, scale=THUMBNAIL_SCALE, label=''):
+    """<img> tag embedding a PNG thumbnail of svg_data rendered at size × scale pixels
+
+    The PNG comes from the render cache when it holds one for the same SVG,
+    size and backend, so unchanged candidates are never re-rendered.
+    """
+    import base64
+    import os
+    import tempfile
+
+    from .cache import render_key
+    from .encoder import optimize_png
+    from .rasterizers import get_rasterizer
+
+    backend = get_rasterizer(backend_name)
+    pixels = size * scale
+    key = render_key(svg_data, pixels, pixels, backend.name, backend.version(), {'preview_thumbnail': 1})
+    with tempfile.TemporaryDirectory() as scratch:
+        png_path = os.path.join(scratch, 'thumbnail.png')
+        if cache is None or not cache.fetch(key, png_path):
+            with open(png_path, 'wb') as f:
+                f.write(optimize_png(backend.render_rgba(svg_data, pixels, pixels)).data)
+            if cache is not None:
+                cache.store(key, png_path)
+        with open(png_path, 'rb') as f:
+            data = base64.b64encode(f.read()).decode('ascii')
+    return (f'<img src="data:image/png;base64,{data}" width="{size}" height="{size}" '
+            f'alt="{label}" decoding="async">')
+
+
+def icon_tiles(svgs, sizes, labels=None, thumbnails=False, backend_name=None, cache=None):
+    """(sprite markup or '', [tile markup]) for parallel lists of SVGs and tile sizes
+
+    With thumbnails, every tile is a cached PNG instead (falling back to
+    shared vectors when no rasterizer is available).
+    """
+    labels = labels or [''] * len(svgs)
+    if thumbnails:
+        from .rasterizers import RasterizerError
+
+        try:
+            tiles = [thumbnail(svg, size, backend_name, cache, label=label)
+                     for svg, size, label in zip(svgs, sizes, labels)]
+            if cache is not None:
+                cache.evict()
+            return '', tiles
+        except RasterizerError as e:
+            print(f"⚠️  No thumbnails ({e}); using shared vector tiles")
+    builder = PreviewBuilder()
+    symbols = [builder.add(svg) for svg in svgs]
+    return builder.sprite(), [builder.tile(symbol, size, label)
+                              for symbol, size, label in zip(symbols, sizes, labels)]
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Cached capability probe for the rasterizer backends
+Finds installed backends and their versions without rendering anything:
+executables are resolved on PATH and cairosvg is located without being
+imported. Results are cached keyed on PATH and the tools' mtimes, and an
+optional one-time calibration renders a reference SVG with every backend to
+pick the fastest one that draws it correctly on this machine
+"""
+
+import json
+import os
+import sys
+
+from .cache import DEFAULT_CACHE_DIR
+
+DEFAULT_PROBE_CACHE = os.path.join(DEFAULT_CACHE_DIR, 'backends.json')
+
+# Small reference drawing: opaque fill, translucent fill, gradient, transparent corner
+REFERENCE_SVG = '''<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">
+  <defs>
+    <linearGradient id="ramp" x1="0" y1="0" x2="1" y2="0">
+      <stop offset="0" stop-color="#000000" />
+      <stop offset="1" stop-color="#ffffff" />
+    </linearGradient>
+  </defs>
+  <rect x="0" y="0" width="50" height="50" fill="#ff0000" />
+  <circle cx="75" cy="25" r="20" fill="#0000ff" opacity="0.5" />
+  <rect x="0" y="60" width="100" height="40" fill="url(#ramp)" />
+</svg>'''
+
+# (x, y) as fractions of the output size → expected RGBA; None = any value
+REFERENCE_SAMPLES = [
+    ((0.25, 0.25), (255, 0, 0, 255)),
+    ((0.75, 0.25), (0, 0, 255, 128)),
+    ((0.98, 0.02), (None, None, None, 0)),
+    ((0.50, 0.80), (128, 128, 128, 255)),
+]
+REFERENCE_TOLERANCE = 16
+
+_probe = None
+
+
+def _executable_fingerprint(executable):
+    """(resolved path, mtime_ns, size) of an executable on PATH, or None"""
+    import shutil
+
+    path = shutil.which(executable)
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return [os.path.realpath(path), stat.st_mtime_ns, stat.st_size]
+
+
+def _module_location(module):
+    """Path of an in-process backend's package without importing it (cairosvg loads cairo)"""
+    import importlib.util
+
+    try:
+        spec = importlib.util.find_spec(module)
+    except (ImportError, ValueError):
+        return None
+    return spec.origin if spec and spec.origin else None
+
+
+def environment_key():
+    """Everything a probe result depends on: PATH, the interpreter and each tool's mtime"""
+    from .rasterizers import BACKENDS, SubprocessRasterizer
+
+    tools = {}
+    for name, backend_class in BACKENDS.items():
+        if issubclass(backend_class, SubprocessRasterizer):
+            tools[name] = _executable_fingerprint(backend_class.executable)
+        else:
+            location = _module_location(backend_class.module)
+            tools[name] = location and [location, os.stat(location).st_mtime_ns,
+                                        getattr(backend_class, 'revision', None)]
+    return {
+        'path': os.environ.get('PATH', ''),
+        'python': sys.executable,
+        'tools': tools,
+    }
+
+
+def _probe_cairosvg():
+    """Availability and version of cairosvg from package metadata and the cairo library"""
+    import ctypes.util
+    import importlib.util
+    from importlib import metadata
+
+    if _module_location('cairosvg') is None:
+        return {'available': False, 'reason': 'cairosvg not installed'}
+    if importlib.util.find_spec('cairocffi') is None:
+        return {'available': False, 'reason': 'cairocffi not installed'}
+    library = ctypes.util.find_library('cairo') or ctypes.util.find_library('cairo-2')
+    if library is None:
+        return {'available': False, 'reason': 'libcairo not found'}
+    try:
+        version = metadata.version('cairosvg')
+    except metadata.PackageNotFoundError:
+        version = 'unknown'
+    return {'available': True, 'version': version, 'library': library}
+
+
+def _probe_version(backend):
+    """Availability and version of a backend from its version query alone (never a render)"""
+    from .rasterizers import RasterizerError
+
+    try:
+        return {'available': True, 'version': backend.version()}
+    except RasterizerError as e:
+        return {'available': False, 'reason': str(e)}
+
+
+def probe_backends(refresh=False, cache_path=DEFAULT_PROBE_CACHE):
+    """Return {'key', 'backends': {name: info}, 'calibration'} for this machine
+
+    The result is memoized per process and cached on disk; it is recomputed
+    only when PATH, the interpreter or one of the tools changed (or refresh).
+    """
+    global _probe
+    key = environment_key()
+    if not refresh and _probe is not None and _probe['key'] == key:
+        return _probe
+
+    if not refresh:
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+        except (FileNotFoundError, ValueError):
+            cached = None
+        if cached and cached.get('key') == key:
+            _probe = cached
+            return _probe
+
+    from .rasterizers import BACKENDS, CairoSVGRasterizer
+
+    backends = {}
+    for name, backend_class in BACKENDS.items():
+        if backend_class is CairoSVGRasterizer:
+            backends[name] = _probe_cairosvg()
+        else:
+            backends[name] = _probe_version(backend_class())
+    _probe = {'key': key, 'backends': backends, 'calibration': None}
+    _save(cache_path)
+    return _probe
+
+
+def _save(cache_path):
+    from .build import write_text
+
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_text(cache_path, json.dumps(_probe, indent=2, sort_keys=True))
+
+
+def available_backends(order=None):
+    """Names of the backends the probe found, in order (default: DEFAULT_BACKEND_ORDER)"""
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    backends = probe_backends()['backends']
+    return [name for name in order or DEFAULT_BACKEND_ORDER if backends.get(name, {}).get('available')]
+
+
+def preferred_order():
+    """DEFAULT_BACKEND_ORDER with the calibrated fastest correct backend moved to the front"""
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    calibration = probe_backends().get('calibration')
+    fastest = calibration and calibration.get('fastest')
+    if not fastest:
+        return DEFAULT_BACKEND_ORDER
+    return (fastest,) + tuple(name for name in DEFAULT_BACKEND_ORDER if name != fastest)
+
+
+def check_reference(rgba):
+    """Return the list of reference samples a render got wrong"""
+    size = rgba.shape[0]
+    wrong = []
+    for (fx, fy), expected in REFERENCE_SAMPLES:
+        pixel = rgba[min(int(fy * size), size - 1), min(int(fx * size), size - 1)]
+        if any(e is not None and abs(int(p) - e) > REFERENCE_TOLERANCE for p, e in zip(pixel, expected)):
+            wrong.append(f"({fx:g}, {fy:g}) is {tuple(int(p) for p in pixel)}, expected {expected}")
+    return wrong
+
+
+def calibrate(size=512, repeats=3, cache_path=DEFAULT_PROBE_CACHE):
+    """Render REFERENCE_SVG with every available backend and record the fastest correct one"""
+    import statistics
+    import time
+
+    from .rasterizers import BACKENDS, RasterizerError
+
+    probe_backends(cache_path=cache_path)
+    results = {}
+    for name in available_backends():
+        backend = BACKENDS[name]()
+        try:
+            rgba = backend.render_rgba(REFERENCE_SVG, size, size)
+            samples = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                backend.render_rgba(REFERENCE_SVG, size, size)
+                samples.append(time.perf_counter() - started)
+        except RasterizerError as e:
+            results[name] = {'correct': False, 'errors': [str(e)]}
+            continue
+        wrong = check_reference(rgba)
+        results[name] = {'correct': not wrong, 'errors': wrong, 'seconds': statistics.median(samples)}
+
+    correct = [name for name, result in results.items() if result['correct']]
+    fastest = min(correct, key=lambda name: results[name]['seconds'], default=None)
+    _probe['calibration'] = {'size': size, 'results': results, 'fastest': fastest}
+    _save(cache_path)
+    return _probe['calibration']
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show (and optionally calibrate) the rasterizer backends")
+    add_probe_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def add_probe_arguments(parser):
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore the cached probe and detect the backends again")
+    parser.add_argument('--calibrate', action='store_true',
+                        help="render a reference SVG with each backend and prefer the fastest correct one")
+    parser.add_argument('--size', type=int, default=512,
+                        help="calibration render size (default: 512)")
+
+
+def main(argv=None):
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    args = parse_args(argv)
+    probe = probe_backends(refresh=args.refresh)
+    for name in DEFAULT_BACKEND_ORDER:
+        info = probe['backends'][name]
+        if info['available']:
+            print(f"✅ {name}: {info['version']}")
+        else:
+            print(f"❌ {name}: {info['reason']}")
+
+    if args.calibrate:
+        calibration = calibrate(size=args.size)
+    else:
+        calibration = probe.get('calibration')
+    if calibration:
+        print(f"\n⏱️  Calibration at {calibration['size']}px:")
+        for name, result in calibration['results'].items():
+            if result['correct']:
+                print(f"   ✅ {name}: {result['seconds'] * 1000:.1f} ms")
+            else:
+                print(f"   ❌ {name}: {'; '.join(result['errors'])}")
+        if calibration['fastest']:
+            print(f"🏁 Preferred backend: {calibration['fastest']}")
+        else:
+            print("⚠️  No backend rendered the reference correctly")
+            return False
+    return any(info['available'] for info in probe['backends'].values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Asyncio driver for the command line rasterizer backends
+Runs rsvg-convert/ImageMagick conversions as overlapping subprocesses under a
+concurrency limit. Every attempt has a timeout after which the tool is
+killed, transient failures are retried with exponential backoff, and stderr
+is streamed line by line while the tool runs. A run therefore finishes within
+worst_case_seconds() even if a delegate hangs.
+"""
+
+import asyncio
+import os
+import signal
+import time
+from collections import deque
+
+from .rasterizers import DEFAULT_RETRIES, DEFAULT_TIMEOUT, RasterizerError
+
+DEFAULT_BACKOFF = 0.5
+
+# Lines of stderr kept for the error message of a failed conversion
+STDERR_TAIL = 20
+
+# stderr fragments that mark a failure as worth retrying (resource pressure, not a bad SVG)
+TRANSIENT_MARKERS = (
+    'resource temporarily unavailable',
+    'cache resources exhausted',
+    'cannot allocate memory',
+    'too many open files',
+)
+
+
+class ConversionTimeout(RasterizerError):
+    """A conversion ran past its timeout and was killed"""
+
+
+class TransientError(RasterizerError):
+    """A conversion failed in a way that may succeed when retried"""
+
+
+def worst_case_seconds(job_count, concurrency, timeout=DEFAULT_TIMEOUT,
+                       retries=DEFAULT_RETRIES, backoff=DEFAULT_BACKOFF):
+    """Upper bound on the wall time of a run, ignoring process start-up"""
+    rounds = -(-job_count // max(1, concurrency))
+    backoff_total = sum(backoff * 2 ** attempt for attempt in range(retries))
+    return rounds * ((retries + 1) * timeout + backoff_total)
+
+
+async def _stream_lines(stream, tail, on_line):
+    while True:
+        line = await stream.readline()
+        if not line:
+            return
+        text = line.decode('utf-8', 'replace').rstrip()
+        tail.append(text)
+        if on_line:
+            on_line(text)
+
+
+async def _feed(stdin, data):
+    try:
+        stdin.write(data)
+        await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # The tool exited without reading everything; its exit status tells why
+        pass
+    finally:
+        stdin.close()
+
+
+def _kill(process):
+    """Kill a tool together with any delegates it started (ImageMagick runs its own)"""
+    if os.name == 'posix':
+        try:
+            # The tool leads its own session, so its process group holds the delegates too;
+            # a delegate left holding stderr open would otherwise keep wait() from returning
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+        except ProcessLookupError:
+            pass
+    process.kill()
+
+
+async def run_command(argv, input_data=b'', timeout=DEFAULT_TIMEOUT, on_stderr=None):
+    """Run argv with input_data on stdin; raise RasterizerError on failure
+
+    on_stderr(line) is called for every stderr line as it arrives. The
+    process is killed and ConversionTimeout raised after timeout seconds.
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *argv, stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE,
+            start_new_session=os.name == 'posix'
+        )
+    except FileNotFoundError:
+        raise RasterizerError(f"{argv[0]} not found")
+    except (BlockingIOError, InterruptedError, MemoryError) as e:
+        # fork/exec ran out of processes or memory
+        raise TransientError(f"could not start {argv[0]}: {e}")
+
+    tail = deque(maxlen=STDERR_TAIL)
+    try:
+        await asyncio.wait_for(asyncio.gather(
+            _feed(process.stdin, input_data),
+            _stream_lines(process.stderr, tail, on_stderr),
+            process.wait(),
+        ), timeout)
+    except asyncio.TimeoutError:
+        raise ConversionTimeout(f"{argv[0]} timed out after {timeout:g}s and was killed")
+    finally:
+        # Also reached when the run is cancelled: never leave a tool running
+        if process.returncode is None:
+            _kill(process)
+            await process.wait()
+
+    if process.returncode == 0:
+        return
+    stderr = '\n'.join(tail)
+    if process.returncode < 0:
+        raise TransientError(f"{argv[0]} was killed by signal {-process.returncode}: {stderr}")
+    if any(marker in stderr.lower() for marker in TRANSIENT_MARKERS):
+        raise TransientError(f"{argv[0]} failed: {stderr}")
+    raise RasterizerError(f"{argv[0]} failed: {stderr}")
+
+
+async def run_with_retries(argv, input_data=b'', timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                           backoff=DEFAULT_BACKOFF, on_stderr=None):
+    """run_command, retrying timeouts and transient failures with exponential backoff"""
+    for attempt in range(retries + 1):
+        try:
+            return await run_command(argv, input_data, timeout, on_stderr)
+        except (ConversionTimeout, TransientError):
+            if attempt == retries:
+                raise
+        await asyncio.sleep(backoff * 2 ** attempt)
+
+
+async def _convert(backend, job, semaphore, timeout, retries, backoff, encoder_settings, verbose):
+    from .build import replace_if_changed
+    from .scheduler import JobResult, temporary_path
+
+    async with semaphore:
+        started = time.perf_counter()
+        tmp_path = temporary_path(job.png_path)
+        svg_data = job.svg_data.encode('utf-8') if isinstance(job.svg_data, str) else job.svg_data
+        on_stderr = (lambda line: print(f"   {job.label}: {line}")) if verbose else None
+        try:
+            await run_with_retries(backend.command(tmp_path, job.width, job.height), svg_data,
+                                   timeout, retries, backoff, on_stderr)
+            if encoder_settings is not None:
+                # Re-encoding is CPU-bound; keep the event loop free to start other tools
+                await asyncio.to_thread(_optimize_file, tmp_path, encoder_settings)
+            replace_if_changed(tmp_path, job.png_path)
+        except (RasterizerError, OSError) as e:
+            return JobResult(job, False, str(e), time.perf_counter() - started)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return JobResult(job, True, None, time.perf_counter() - started)
+
+
+def _optimize_file(png_path, encoder_settings):
+    from .encoder import ByteBudgetError, optimize_png
+    from .png import read_png
+
+    try:
+        data = optimize_png(read_png(png_path), encoder_settings).data
+    except ByteBudgetError as e:
+        raise RasterizerError(str(e)) from e
+    with open(png_path, 'wb') as f:
+        f.write(data)
+
+
+async def convert_all(backend, jobs, concurrency, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                      backoff=DEFAULT_BACKOFF, encoder_settings=None, verbose=False):
+    """Convert every job with at most `concurrency` tools running; return JobResults in order"""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    return await asyncio.gather(*(
+        _convert(backend, job, semaphore, timeout, retries, backoff, encoder_settings, verbose)
+        for job in jobs
+    ))
+
+
+def convert_jobs(backend, jobs, concurrency, **options):
+    """Blocking entry point for the scheduler: run convert_all on a fresh event loop"""
+    return asyncio.run(convert_all(backend, jobs, concurrency, **options))
@@ -0,0 +1,828 @@
+#!/usr/bin/env python3
+"""
+Pure NumPy SVG rasterizer for the subset of SVG the BreathEasy icons use
+circle, ellipse, rect (with rx/ry), line/polyline/polygon and path (M/L/H/V/
+C/S/Q/T/Z) filled or stroked with colors and linear/radial gradients, inside
+nested <g> transforms with opacity, and <use> instances of shapes, groups
+and <symbol>s. Every shape is evaluated only inside its
+device bounding box as a signed distance field, and the distance to the edge
+gives analytic anti-aliasing. Filters are skipped; strokes get round caps
+and joins.
+"""
+
+import math
+import re
+
+import numpy as np
+
+from .rasterizers import RasterizerError
+from .svg_document import SvgDocument
+
+IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+# Maximum distance in device pixels between a flattened curve and the true one
+FLATTEN_TOLERANCE = 0.2
+
+# Entries in a gradient's color lookup table
+GRADIENT_STEPS = 1024
+
+# Elements that never paint, and painting elements this rasterizer cannot draw
+_SILENT = {'defs', 'title', 'desc', 'metadata', 'style', 'linearGradient', 'radialGradient', 'stop',
+           'filter', 'clipPath', 'mask', 'pattern', 'marker', 'symbol'}
+_UNSUPPORTED = {'text', 'image', 'foreignObject', 'switch'}
+
+_INHERITED = ('fill', 'fill-opacity', 'fill-rule', 'stroke', 'stroke-width', 'stroke-opacity',
+              'visibility', 'color')
+_INITIAL_STYLE = {'fill': 'black', 'fill-opacity': '1', 'fill-rule': 'nonzero', 'stroke': 'none',
+                  'stroke-width': '1', 'stroke-opacity': '1', 'visibility': 'visible', 'color': 'black'}
+
+_NAMED_COLORS = {
+    'black': (0, 0, 0), 'white': (255, 255, 255), 'red': (255, 0, 0), 'green': (0, 128, 0),
+    'blue': (0, 0, 255), 'yellow': (255, 255, 0), 'gray': (128, 128, 128), 'grey': (128, 128, 128),
+}
+
+_NUMBER_RE = re.compile(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+_TRANSFORM_RE = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)\s*\(([^)]*)\)')
+_PATH_TOKEN_RE = re.compile(r'([MmLlHhVvCcSsQqTtZzAa])|([-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?)')
+_PATH_ARITY = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'Z': 0, 'A': 7}
+
+
+# --- Affine transforms: (a, b, c, d, e, f) maps x, y to a*x + c*y + e, b*x + d*y + f ---
+
+def multiply(m, n):
+    """The transform that applies n first, then m"""
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (a * a2 + c * b2, b * a2 + d * b2, a * c2 + c * d2, b * c2 + d * d2,
+            a * e2 + c * f2 + e, b * e2 + d * f2 + f)
+
+
+def invert(m):
+    a, b, c, d, e, f = m
+    det = a * d - b * c
+    if det == 0:
+        return None
+    return (d / det, -b / det, -c / det, a / det, (c * f - d * e) / det, (b * e - a * f) / det)
+
+
+def parse_transform(text):
+    """Parse an SVG transform attribute into one affine matrix"""
+    matrix = IDENTITY
+    for name, args in _TRANSFORM_RE.findall(text or ''):
+        values = [float(v) for v in _NUMBER_RE.findall(args)]
+        if name == 'matrix':
+            step = tuple(values[:6])
+        elif name == 'translate':
+            step = (1.0, 0.0, 0.0, 1.0, values[0], values[1] if len(values) > 1 else 0.0)
+        elif name == 'scale':
+            sx = values[0]
+            step = (sx, 0.0, 0.0, values[1] if len(values) > 1 else sx, 0.0, 0.0)
+        elif name == 'rotate':
+            angle = math.radians(values[0])
+            step = (math.cos(angle), math.sin(angle), -math.sin(angle), math.cos(angle), 0.0, 0.0)
+            if len(values) == 3:
+                cx, cy = values[1:]
+                step = multiply(multiply((1.0, 0.0, 0.0, 1.0, cx, cy), step), (1.0, 0.0, 0.0, 1.0, -cx, -cy))
+        elif name == 'skewX':
+            step = (1.0, 0.0, math.tan(math.radians(values[0])), 1.0, 0.0, 0.0)
+        else:
+            step = (1.0, math.tan(math.radians(values[0])), 0.0, 1.0, 0.0, 0.0)
+        matrix = multiply(matrix, step)
+    return matrix
+
+
+def _scale(m):
+    """Device pixels per user unit (exact for translate/rotate/uniform scale)"""
+    return math.sqrt(abs(m[0] * m[3] - m[1] * m[2]))
+
+
+def _apply(m, points):
+    a, b, c, d, e, f = m
+    x, y = points[:, 0], points[:, 1]
+    return np.stack([a * x + c * y + e, b * x + d * y + f], axis=1)
+
+
+# --- Attribute values ---
+
+def parse_color(value, current='black'):
+    """Return an (r, g, b) tuple in 0–1, or None for 'none'"""
+    value = value.strip()
+    if value in ('none', 'transparent'):
+        return None
+    if value == 'currentColor':
+        return parse_color(current)
+    if value.startswith('#'):
+        digits = value[1:]
+        if len(digits) == 3:
+            digits = ''.join(ch * 2 for ch in digits)
+        if len(digits) != 6:
+            raise RasterizerError(f"Unsupported color: {value}")
+        return tuple(int(digits[i:i + 2], 16) / 255 for i in (0, 2, 4))
+    if value.startswith('rgb('):
+        parts = value[4:-1].split(',')
+        return tuple(float(p[:-1]) / 100 if p.strip().endswith('%') else float(p) / 255 for p in parts)
+    if value.lower() in _NAMED_COLORS:
+        return tuple(channel / 255 for channel in _NAMED_COLORS[value.lower()])
+    raise RasterizerError(f"Unsupported color: {value}")
+
+
+def _number(value, default=0.0):
+    if value is None:
+        return default
+    match = _NUMBER_RE.match(value.strip())
+    return float(match.group()) if match else default
+
+
+def _length(value, reference, default=0.0):
+    """A length attribute; percentages are relative to reference"""
+    if value is None:
+        return default
+    value = value.strip()
+    if value.endswith('%'):
+        return float(value[:-1]) / 100 * reference
+    return _number(value, default)
+
+
+def _fraction(value, default):
+    """A gradient coordinate or opacity: '50%' and '0.5' are both 0.5"""
+    if value is None:
+        return default
+    value = value.strip()
+    if value.endswith('%'):
+        return float(value[:-1]) / 100
+    return _number(value, default)
+
+
+def _style(element):
+    """Presentation attributes overridden by the style attribute"""
+    properties = dict(element.attrs)
+    for declaration in element.attrs.get('style', '').split(';'):
+        if ':' in declaration:
+            name, value = declaration.split(':', 1)
+            properties[name.strip()] = value.strip()
+    return properties
+
+
+# --- Geometry ---
+
+def _flatten_cubic(p0, p1, p2, p3, tolerance):
+    """Points after p0 along a cubic Bézier, enough that no chord strays past tolerance"""
+    dd = max(math.hypot(p0[0] - 2 * p1[0] + p2[0], p0[1] - 2 * p1[1] + p2[1]),
+             math.hypot(p1[0] - 2 * p2[0] + p3[0], p1[1] - 2 * p2[1] + p3[1]))
+    # Wang's formula for the number of segments
+    n = max(1, min(256, math.ceil(math.sqrt(0.75 * dd / tolerance))))
+    t = np.linspace(0.0, 1.0, n + 1)[1:, None]
+    mt = 1 - t
+    return (mt ** 3 * p0 + 3 * mt ** 2 * t * p1 + 3 * mt * t ** 2 * p2 + t ** 3 * p3).tolist()
+
+
+def _flatten_quadratic(p0, p1, p2, tolerance):
+    dd = math.hypot(p0[0] - 2 * p1[0] + p2[0], p0[1] - 2 * p1[1] + p2[1])
+    n = max(1, min(256, math.ceil(math.sqrt(0.25 * dd / tolerance))))
+    t = np.linspace(0.0, 1.0, n + 1)[1:, None]
+    mt = 1 - t
+    return (mt ** 2 * p0 + 2 * mt * t * p1 + t ** 2 * p2).tolist()
+
+
+def _path_commands(d):
+    """Split path data into (command, arguments) steps, expanding implicit repeats"""
+    command, numbers, steps = None, [], []
+
+    def flush():
+        if command is None:
+            if numbers:
+                raise RasterizerError("Path data must start with a command")
+            return
+        arity = _PATH_ARITY[command.upper()]
+        if arity == 0:
+            steps.append((command, []))
+            return
+        if not numbers or len(numbers) % arity:
+            raise RasterizerError(f"Bad argument count for path command {command}")
+        repeat = command
+        for i in range(0, len(numbers), arity):
+            steps.append((repeat, numbers[i:i + arity]))
+            # Extra coordinate pairs after a moveto are linetos
+            if repeat in 'Mm':
+                repeat = 'L' if repeat == 'M' else 'l'
+
+    for letter, number in _PATH_TOKEN_RE.findall(d):
+        if letter:
+            flush()
+            command, numbers = letter, []
+        else:
+            numbers.append(float(number))
+    flush()
+    return steps
+
+
+def flatten_path(d, tolerance):
+    """Flatten path data into a list of (points (N, 2) array, closed) subpaths"""
+    subpaths = []
+    points = []
+    x = y = start_x = start_y = 0.0
+    control = None
+    previous = None
+
+    def finish(closed):
+        if len(points) > 1:
+            subpaths.append((np.array(points, dtype=np.float64), closed))
+
+    for command, args in _path_commands(d):
+        upper = command.upper()
+        relative = command != upper
+        if upper == 'A':
+            raise RasterizerError("Arc path commands are not supported")
+        if upper in 'MLCSQT' and relative:
+            args = [value + (y if i % 2 else x) for i, value in enumerate(args)]
+        if upper == 'M':
+            finish(False)
+            x, y = start_x, start_y = args
+            points = [[x, y]]
+        elif upper == 'Z':
+            points.append([start_x, start_y])
+            finish(True)
+            x, y = start_x, start_y
+            points = [[x, y]]
+        else:
+            if not points:
+                points = [[x, y]]
+            if upper == 'L':
+                x, y = args
+                points.append([x, y])
+            elif upper == 'H':
+                x = args[0] + (x if relative else 0.0)
+                points.append([x, y])
+            elif upper == 'V':
+                y = args[0] + (y if relative else 0.0)
+                points.append([x, y])
+            elif upper in 'CS':
+                if upper == 'C':
+                    c1 = np.array(args[0:2])
+                elif previous in 'CS':
+                    c1 = 2 * np.array([x, y]) - control
+                else:
+                    c1 = np.array([x, y])
+                c2, end = np.array(args[-4:-2]), np.array(args[-2:])
+                points.extend(_flatten_cubic(np.array([x, y]), c1, c2, end, tolerance))
+                control = c2
+                x, y = args[-2:]
+            elif upper in 'QT':
+                if upper == 'Q':
+                    c1 = np.array(args[0:2])
+                elif previous in 'QT':
+                    c1 = 2 * np.array([x, y]) - control
+                else:
+                    c1 = np.array([x, y])
+                end = np.array(args[-2:])
+                points.extend(_flatten_quadratic(np.array([x, y]), c1, end, tolerance))
+                control = c1
+                x, y = args[-2:]
+        previous = upper
+    finish(False)
+    return subpaths
+
+
+class _Shape:
+    """Signed-distance shape evaluated in user space (negative inside)
+
+    bbox is the user-space bounding box without stroke; extent is the smaller
+    and larger size in user units, used to dim features thinner than a pixel.
+    """
+
+    bbox = None
+    extent = (0.0, 0.0)
+
+    def distance(self, x, y):
+        raise NotImplementedError
+
+    def coverage(self, window, matrix, stroke_width=None):
+        """Coverage of the fill (stroke_width None) or stroke inside a device window"""
+        inverse = invert(matrix)
+        x, y = _user_grid(inverse, window)
+        scale = _scale(matrix)
+        d = self.distance(x, y) * scale
+        if stroke_width is not None:
+            return _band_coverage(np.abs(d), stroke_width * scale)
+        coverage = np.clip(0.5 - d, 0.0, 1.0)
+        # A shape narrower than a pixel covers only part of the pixels near its center
+        thin = min(1.0, self.extent[0] * scale) * min(1.0, self.extent[1] * scale)
+        return coverage * thin if thin < 1 else coverage
+
+
+class _Circle(_Shape):
+    def __init__(self, cx, cy, r):
+        self.cx, self.cy, self.r = cx, cy, r
+        self.bbox = (cx - r, cy - r, cx + r, cy + r)
+        self.extent = (2 * r, 2 * r)
+
+    def distance(self, x, y):
+        return np.hypot(x - self.cx, y - self.cy) - self.r
+
+
+class _Ellipse(_Shape):
+    def __init__(self, cx, cy, rx, ry):
+        self.cx, self.cy, self.rx, self.ry = cx, cy, rx, ry
+        self.bbox = (cx - rx, cy - ry, cx + rx, cy + ry)
+        self.extent = (2 * min(rx, ry), 2 * max(rx, ry))
+
+    def distance(self, x, y):
+        # First-order distance g / |∇g| of the implicit g = |(dx/rx, dy/ry)| - 1, exact at the edge
+        dx = (x - self.cx) / self.rx
+        dy = (y - self.cy) / self.ry
+        g = np.hypot(dx, dy)
+        gradient = np.hypot(dx / self.rx, dy / self.ry)
+        return (g - 1) * g / np.maximum(gradient, 1e-9)
+
+
+class _Rect(_Shape):
+    def __init__(self, x, y, width, height, rx, ry):
+        self.cx, self.cy = x + width / 2, y + height / 2
+        self.half_width, self.half_height = width / 2, height / 2
+        # Elliptical corners are drawn circular with the smaller radius
+        self.radius = min(rx, ry, width / 2, height / 2)
+        self.bbox = (x, y, x + width, y + height)
+        self.extent = (min(width, height), max(width, height))
+
+    def distance(self, x, y):
+        qx = np.abs(x - self.cx) - (self.half_width - self.radius)
+        qy = np.abs(y - self.cy) - (self.half_height - self.radius)
+        outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0))
+        return outside + np.minimum(np.maximum(qx, qy), 0) - self.radius
+
+
+class _Path:
+    """Flattened path; coverage is computed from device-space segments"""
+
+    def __init__(self, subpaths):
+        self.subpaths = subpaths
+        points = np.concatenate([points for points, _ in subpaths])
+        self.bbox = (*points.min(axis=0), *points.max(axis=0))
+
+    def coverage(self, window, matrix, stroke_width=None, fill_rule='nonzero'):
+        top, bottom, left, right = window
+        best = None
+        if stroke_width is not None:
+            half = stroke_width * _scale(matrix) / 2
+            reach = half + 1.0
+            best = np.full((bottom - top, right - left), reach * reach, dtype=np.float32)
+            for points, _ in self.subpaths:
+                _nearest_segment(best, window, _segments(_apply(matrix, points)), reach)
+            return _band_coverage(np.sqrt(best), 2 * half)
+
+        reach = 1.0
+        best = np.full((bottom - top, right - left), reach * reach, dtype=np.float32)
+        winding = np.zeros(best.shape, dtype=np.int16)
+        for points, closed in self.subpaths:
+            device = _apply(matrix, points)
+            if not closed:
+                # Filling closes every subpath implicitly
+                device = np.concatenate([device, device[:1]])
+            segments = _segments(device)
+            _nearest_segment(best, window, segments, reach)
+            _accumulate_winding(winding, window, segments)
+        inside = (winding % 2 != 0) if fill_rule == 'evenodd' else (winding != 0)
+        distance = np.sqrt(best)
+        return np.clip(np.where(inside, 0.5 + distance, 0.5 - distance), 0.0, 1.0)
+
+
+def _segments(points):
+    return np.concatenate([points[:-1], points[1:]], axis=1)
+
+
+def _nearest_segment(best, window, segments, reach):
+    """Lower best (squared device distance) to the segments, each within its own reach box"""
+    top, bottom, left, right = window
+    height, width = best.shape
+    for x0, y0, x1, y1 in segments.tolist():
+        c0 = max(math.floor(min(x0, x1) - reach) - left, 0)
+        c1 = min(math.ceil(max(x0, x1) + reach) - left, width)
+        r0 = max(math.floor(min(y0, y1) - reach) - top, 0)
+        r1 = min(math.ceil(max(y0, y1) + reach) - top, height)
+        if c1 <= c0 or r1 <= r0:
+            continue
+        px = (np.arange(left + c0, left + c1, dtype=np.float32) + (0.5 - x0))[None, :]
+        py = (np.arange(top + r0, top + r1, dtype=np.float32) + (0.5 - y0))[:, None]
+        dx, dy = x1 - x0, y1 - y0
+        length2 = dx * dx + dy * dy
+        if length2 > 0:
+            t = np.clip((px * dx + py * dy) / length2, 0.0, 1.0)
+            px = px - t * dx
+            py = py - t * dy
+        region = best[r0:r1, c0:c1]
+        np.minimum(region, px * px + py * py, out=region)
+
+
+def _accumulate_winding(winding, window, segments):
+    """Add each segment's crossings of the rays running right from the pixel centers"""
+    top, bottom, left, right = window
+    height = winding.shape[0]
+    xs = np.arange(left, right, dtype=np.float32) + 0.5
+    for x0, y0, x1, y1 in segments.tolist():
+        if y0 == y1:
+            continue
+        # Rows whose center lies in [min(y0, y1), max(y0, y1))
+        r0 = max(math.ceil(min(y0, y1) - 0.5 - top), 0)
+        r1 = min(math.ceil(max(y0, y1) - 0.5 - top), height)
+        if r1 <= r0:
+            continue
+        ys = (np.arange(top + r0, top + r1, dtype=np.float32) + 0.5)[:, None]
+        is_left = (x1 - x0) * (ys - y0) - (xs[None, :] - x0) * (y1 - y0)
+        if y1 > y0:
+            winding[r0:r1] += is_left > 0
+        else:
+            winding[r0:r1] -= is_left < 0
+
+
+def _user_grid(inverse, window):
+    """User-space coordinates of the pixel centers of a device window"""
+    top, bottom, left, right = window
+    xs = (np.arange(left, right, dtype=np.float32) + 0.5)[None, :]
+    ys = (np.arange(top, bottom, dtype=np.float32) + 0.5)[:, None]
+    a, b, c, d, e, f = inverse
+    return a * xs + c * ys + e, b * xs + d * ys + f
+
+
+def _band_coverage(distance, width):
+    """Box-filtered coverage of a band `width` device pixels wide centered at distance 0"""
+    half = width / 2
+    return np.clip(np.minimum(distance + half, 0.5) - np.maximum(distance - half, -0.5), 0.0, 1.0)
+
+
+# --- Paint ---
+
+class _Gradient:
+    """A linear or radial gradient resolved through its href chain"""
+
+    def __init__(self, tag, attrs, stops, view_size):
+        self.tag = tag
+        self.attrs = attrs
+        self.user_space = attrs.get('gradientUnits') == 'userSpaceOnUse'
+        self.transform = parse_transform(attrs.get('gradientTransform'))
+        self.spread = attrs.get('spreadMethod', 'pad')
+        self.view_size = view_size
+        self.lut = self._lookup_table(stops)
+
+    @staticmethod
+    def _lookup_table(stops):
+        """Premultiplied RGBA for GRADIENT_STEPS evenly spaced positions"""
+        offsets = []
+        colors = []
+        for offset, rgb, opacity in stops:
+            offsets.append(max(offset, offsets[-1]) if offsets else offset)
+            colors.append((*rgb, opacity))
+        colors = np.array(colors, dtype=np.float32)
+        positions = np.linspace(0.0, 1.0, GRADIENT_STEPS)
+        lut = np.stack([np.interp(positions, offsets, colors[:, k]) for k in range(4)], axis=1)
+        lut[:, :3] *= lut[:, 3:4]
+        return lut.astype(np.float32)
+
+    def _coordinate(self, name, default, axis):
+        value = self.attrs.get(name)
+        if not self.user_space:
+            return _fraction(value, default)
+        width, height = self.view_size
+        reference = {'x': width, 'y': height, 'r': math.hypot(width, height) / math.sqrt(2)}[axis]
+        return _length(value, reference, default * reference)
+
+    def parameter(self, x, y, bbox):
+        """Gradient position t at user-space points; None for an empty bounding box"""
+        if not self.user_space:
+            x0, y0, x1, y1 = bbox
+            if x1 <= x0 or y1 <= y0:
+                return None
+            x = (x - x0) / (x1 - x0)
+            y = (y - y0) / (y1 - y0)
+        if self.transform != IDENTITY:
+            a, b, c, d, e, f = invert(self.transform)
+            x, y = a * x + c * y + e, b * x + d * y + f
+
+        if self.tag == 'linearGradient':
+            gx1 = self._coordinate('x1', 0.0, 'x')
+            gy1 = self._coordinate('y1', 0.0, 'y')
+            gx2 = self._coordinate('x2', 1.0, 'x')
+            gy2 = self._coordinate('y2', 0.0, 'y')
+            dx, dy = gx2 - gx1, gy2 - gy1
+            length2 = dx * dx + dy * dy
+            if length2 == 0:
+                return np.ones(np.broadcast(x, y).shape, dtype=np.float32)
+            t = ((x - gx1) * dx + (y - gy1) * dy) / length2
+        else:
+            # The focal point (fx, fy) is not supported; stops radiate from the center
+            cx = self._coordinate('cx', 0.5, 'x')
+            cy = self._coordinate('cy', 0.5, 'y')
+            r = self._coordinate('r', 0.5, 'r')
+            if r <= 0:
+                return np.ones(np.broadcast(x, y).shape, dtype=np.float32)
+            t = np.hypot(x - cx, y - cy) / r
+
+        if self.spread == 'repeat':
+            t = t - np.floor(t)
+        elif self.spread == 'reflect':
+            t = 1 - np.abs(np.mod(t, 2) - 1)
+        return t
+
+    def colors(self, t, opacity):
+        index = (np.clip(t, 0.0, 1.0) * (GRADIENT_STEPS - 1) + 0.5).astype(np.intp)
+        colors = self.lut[index]
+        return colors * opacity if opacity < 1 else colors
+
+
+# --- Rendering ---
+
+class _Canvas:
+    """Premultiplied RGBA float32 pixels plus the device box drawn to so far"""
+
+    def __init__(self, height, width):
+        self.pixels = np.zeros((height, width, 4), dtype=np.float32)
+        self.dirty = None
+
+    def draw(self, window, coverage, paint):
+        top, bottom, left, right = window
+        region = self.pixels[top:bottom, left:right]
+        source = paint * coverage[..., None]
+        region *= 1 - source[..., 3:4]
+        region += source
+        self._touch(window)
+
+    def composite(self, layer, opacity):
+        """Draw another canvas over this one with a group opacity"""
+        if layer.dirty is None:
+            return
+        top, bottom, left, right = layer.dirty
+        source = layer.pixels[top:bottom, left:right]
+        if opacity < 1:
+            source = source * opacity
+        region = self.pixels[top:bottom, left:right]
+        region *= 1 - source[..., 3:4]
+        region += source
+        self._touch(layer.dirty)
+
+    def _touch(self, window):
+        if self.dirty is None:
+            self.dirty = window
+        else:
+            self.dirty = (min(self.dirty[0], window[0]), max(self.dirty[1], window[1]),
+                          min(self.dirty[2], window[2]), max(self.dirty[3], window[3]))
+
+    def to_rgba(self):
+        """Straight-alpha RGBA uint8"""
+        alpha = self.pixels[..., 3:4]
+        rgb = np.where(alpha > 0, self.pixels[..., :3] / np.maximum(alpha, 1e-12), 0.0)
+        rgba = np.concatenate([rgb, alpha], axis=2)
+        return (np.clip(rgba, 0.0, 1.0) * 255 + 0.5).astype(np.uint8)
+
+
+def viewbox_transform(element, width, height):
+    """(transform, (viewBox width, height)) mapping an element's viewBox onto a width × height viewport
+
+    Without a viewBox the element's own width/height (else the viewport) is
+    the user space. Only xMidYMid meet and none are honored.
+    """
+    view_box = [float(v) for v in _NUMBER_RE.findall(element.get('viewBox', ''))]
+    if len(view_box) == 4:
+        vx, vy, vw, vh = view_box
+    else:
+        vx = vy = 0.0
+        vw = _length(element.get('width'), width, width)
+        vh = _length(element.get('height'), height, height)
+    if vw <= 0 or vh <= 0:
+        raise RasterizerError(f"<{element.tag}> has an empty viewBox")
+    sx, sy = width / vw, height / vh
+    if element.get('preserveAspectRatio', '').strip() != 'none':
+        # xMidYMid meet
+        sx = sy = min(sx, sy)
+    return (sx, 0.0, 0.0, sy, (width - vw * sx) / 2 - vx * sx, (height - vh * sy) / 2 - vy * sy), (vw, vh)
+
+
+class _Renderer:
+    def __init__(self, document, width, height):
+        self.document = document
+        self.width, self.height = width, height
+        self.viewport, self.view_size = viewbox_transform(document.root, width, height)
+        self.gradients = {}
+        # Elements being instanced by <use>, to reject reference cycles
+        self._instancing = set()
+
+    def render(self):
+        canvas = _Canvas(self.height, self.width)
+        self._render_children(self.document.root, canvas, self.viewport, _INITIAL_STYLE)
+        return canvas.to_rgba()
+
+    def _render_children(self, element, canvas, matrix, inherited):
+        for child in element.children:
+            self._render_element(child, canvas, matrix, inherited)
+
+    def _render_element(self, element, canvas, matrix, inherited):
+        tag = element.tag.split(':')[-1]
+        if tag in _SILENT or tag.startswith('fe'):
+            return
+        if tag in _UNSUPPORTED:
+            raise RasterizerError(f"<{tag}> is not supported by the NumPy rasterizer")
+
+        properties = _style(element)
+        if properties.get('display') == 'none':
+            return
+        style = dict(inherited)
+        style.update((name, properties[name]) for name in _INHERITED if name in properties)
+        matrix = multiply(matrix, parse_transform(element.get('transform')))
+        if invert(matrix) is None:
+            return
+        opacity = min(max(_fraction(properties.get('opacity'), 1.0), 0.0), 1.0)
+        if opacity == 0:
+            return
+
+        if tag == 'use':
+            self._render_use(element, canvas, matrix, style, opacity)
+            return
+        if tag in ('g', 'svg', 'a'):
+            if opacity < 1:
+                # Group opacity applies to the children composited together
+                layer = _Canvas(self.height, self.width)
+                self._render_children(element, layer, matrix, style)
+                canvas.composite(layer, opacity)
+            else:
+                self._render_children(element, canvas, matrix, style)
+            return
+
+        if style['visibility'] != 'visible':
+            return
+        shape = self._shape(tag, element, matrix)
+        if shape is None:
+            return
+
+        fill = self._paint_spec(style, 'fill')
+        stroke = self._paint_spec(style, 'stroke')
+        stroke_width = _length(style['stroke-width'], math.hypot(*self.view_size) / math.sqrt(2), 1.0)
+        if stroke_width <= 0:
+            stroke = None
+        if opacity < 1 and fill and stroke:
+            # Fill and stroke overlap; fade them as one
+            layer = _Canvas(self.height, self.width)
+            self._draw(layer, shape, matrix, fill, 1.0, style)
+            self._draw(layer, shape, matrix, stroke, 1.0, style, stroke_width)
+            canvas.composite(layer, opacity)
+            return
+        if fill:
+            self._draw(canvas, shape, matrix, fill, opacity, style)
+        if stroke:
+            self._draw(canvas, shape, matrix, stroke, opacity, style, stroke_width)
+
+    def _render_use(self, element, canvas, matrix, style, opacity):
+        """Draw the referenced element (or symbol contents) as a child of the <use>"""
+        reference = (element.get('href') or element.get('xlink:href') or '').strip()
+        target = self.document.by_id.get(reference[1:]) if reference.startswith('#') else None
+        if target is None:
+            raise RasterizerError(f"<use> references an unknown element: {reference!r}")
+        if target.index in self._instancing:
+            raise RasterizerError(f"<use> reference cycle through {reference}")
+        vw, vh = self.view_size
+        matrix = multiply(matrix, (1.0, 0.0, 0.0, 1.0, _length(element.get('x'), vw), _length(element.get('y'), vh)))
+        layer = _Canvas(self.height, self.width) if opacity < 1 else canvas
+        self._instancing.add(target.index)
+        try:
+            if target.tag == 'symbol':
+                properties = _style(target)
+                if properties.get('display') != 'none':
+                    symbol_style = dict(style)
+                    symbol_style.update((name, properties[name]) for name in _INHERITED if name in properties)
+                    viewport, _ = viewbox_transform(target, _length(element.get('width', '100%'), vw),
+                                                    _length(element.get('height', '100%'), vh))
+                    self._render_children(target, layer, multiply(matrix, viewport), symbol_style)
+            else:
+                self._render_element(target, layer, matrix, style)
+        finally:
+            self._instancing.discard(target.index)
+        if opacity < 1:
+            canvas.composite(layer, opacity)
+
+    def _shape(self, tag, element, matrix):
+        vw, vh = self.view_size
+        diagonal = math.hypot(vw, vh) / math.sqrt(2)
+        if tag == 'circle':
+            r = _length(element.get('r'), diagonal)
+            if r <= 0:
+                return None
+            return _Circle(_length(element.get('cx'), vw), _length(element.get('cy'), vh), r)
+        if tag == 'ellipse':
+            rx = _length(element.get('rx'), vw)
+            ry = _length(element.get('ry'), vh)
+            if rx <= 0 or ry <= 0:
+                return None
+            return _Ellipse(_length(element.get('cx'), vw), _length(element.get('cy'), vh), rx, ry)
+        if tag == 'rect':
+            width = _length(element.get('width'), vw)
+            height = _length(element.get('height'), vh)
+            if width <= 0 or height <= 0:
+                return None
+            rx, ry = element.get('rx'), element.get('ry')
+            rx = _length(rx if rx is not None else ry, vw)
+            ry = _length(ry if ry is not None else element.get('rx'), vh)
+            return _Rect(_length(element.get('x'), vw), _length(element.get('y'), vh), width, height, rx, ry)
+
+        tolerance = FLATTEN_TOLERANCE / _scale(matrix)
+        if tag == 'path':
+            subpaths = flatten_path(element.get('d', ''), tolerance)
+        elif tag == 'line':
+            points = np.array([[_length(element.get('x1'), vw), _length(element.get('y1'), vh)],
+                               [_length(element.get('x2'), vw), _length(element.get('y2'), vh)]])
+            subpaths = [(points, False)]
+        elif tag in ('polyline', 'polygon'):
+            values = [float(v) for v in _NUMBER_RE.findall(element.get('points', ''))]
+            points = np.array(values[:len(values) // 2 * 2], dtype=np.float64).reshape(-1, 2)
+            if tag == 'polygon' and len(points):
+                points = np.concatenate([points, points[:1]])
+            subpaths = [(points, tag == 'polygon')] if len(points) > 1 else []
+        else:
+            raise RasterizerError(f"<{tag}> is not supported by the NumPy rasterizer")
+        return _Path(subpaths) if subpaths else None
+
+    def _paint_spec(self, style, name):
+        """(color or gradient, opacity) for fill/stroke, or None when nothing is painted"""
+        value = style[name].strip()
+        opacity = min(max(_fraction(style[f'{name}-opacity'], 1.0), 0.0), 1.0)
+        if opacity == 0:
+            return None
+        if value.startswith('url('):
+            reference, _, fallback = value[4:].partition(')')
+            gradient = self._gradient(reference.strip().strip('\'"').lstrip('#'))
+            if gradient is not None:
+                return gradient, opacity
+            value = fallback.strip() or 'none'
+        color = parse_color(value, style['color'])
+        if color is None:
+            return None
+        return np.array([*color, 1.0], dtype=np.float32), opacity
+
+    def _gradient(self, reference):
+        if reference in self.gradients:
+            return self.gradients[reference]
+        attrs, stops, tag = {}, None, None
+        element_id = reference
+        element, seen = self.document.by_id.get(element_id), set()
+        while element is not None and element.tag in ('linearGradient', 'radialGradient') \
+                and element_id not in seen:
+            seen.add(element_id)
+            tag = tag or element.tag
+            for name, value in element.attrs.items():
+                attrs.setdefault(name, value)
+            if stops is None:
+                own = [stop for stop in element.children if stop.tag == 'stop']
+                stops = [self._stop(stop) for stop in own] or None
+            element_id = (element.get('href') or element.get('xlink:href') or '').lstrip('#')
+            element = self.document.by_id.get(element_id)
+        gradient = None
+        if tag is not None and stops:
+            gradient = _Gradient(tag, attrs, stops, self.view_size)
+        self.gradients[reference] = gradient
+        return gradient
+
+    @staticmethod
+    def _stop(stop):
+        properties = _style(stop)
+        offset = min(max(_fraction(properties.get('offset'), 0.0), 0.0), 1.0)
+        color = parse_color(properties.get('stop-color', 'black')) or (0.0, 0.0, 0.0)
+        return offset, color, min(max(_fraction(properties.get('stop-opacity'), 1.0), 0.0), 1.0)
+
+    def _draw(self, canvas, shape, matrix, paint, opacity, style, stroke_width=None):
+        window = self._window(shape.bbox, matrix, stroke_width / 2 if stroke_width else 0.0)
+        if window is None:
+            return
+        if isinstance(shape, _Path):
+            coverage = shape.coverage(window, matrix, stroke_width, style['fill-rule'])
+        else:
+            coverage = shape.coverage(window, matrix, stroke_width)
+
+        source, paint_opacity = paint
+        opacity *= paint_opacity
+        if isinstance(source, _Gradient):
+            x, y = _user_grid(invert(matrix), window)
+            t = source.parameter(x, y, shape.bbox)
+            if t is None:
+                return
+            colors = source.colors(t, opacity)
+        else:
+            colors = source * np.float32(opacity)
+        canvas.draw(window, coverage, colors)
+
+    def _window(self, bbox, matrix, pad):
+        """Device pixel box (top, bottom, left, right) covering a user-space box, or None"""
+        x0, y0, x1, y1 = bbox
+        corners = _apply(matrix, np.array([[x0 - pad, y0 - pad], [x1 + pad, y0 - pad],
+                                           [x0 - pad, y1 + pad], [x1 + pad, y1 + pad]]))
+        left = max(math.floor(corners[:, 0].min()) - 1, 0)
+        right = min(math.ceil(corners[:, 0].max()) + 1, self.width)
+        top = max(math.floor(corners[:, 1].min()) - 1, 0)
+        bottom = min(math.ceil(corners[:, 1].max()) + 1, self.height)
+        if right <= left or bottom <= top:
+            return None
+        return top, bottom, left, right
+
+
+def render_svg(svg_data, width, height):
+    """Render SVG text to an (height, width, 4) straight-alpha RGBA uint8 array"""
+    try:
+        document = SvgDocument(svg_data)
+    except ValueError as e:
+        raise RasterizerError(f"Cannot parse SVG: {e}")
+    return _Renderer(document, width, height).render()
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Pluggable SVG → PNG rasterizer backends for the BreathEasy icon generators
+The in-process cairosvg backend parses each SVG once and renders every size from
+that tree; ImageMagick and rsvg-convert stay available as subprocess fallbacks.
+Backend modules (cairosvg, subprocess) are imported on first use only, and
+backends are picked from the cached probe results rather than by trying them.
+"""
+
+import os
+import sys
+
+# Order in which backends are tried when no backend is requested explicitly
+DEFAULT_BACKEND_ORDER = ('cairosvg', 'rsvg', 'imagemagick', 'numpy')
+
+# Seconds before a command line conversion is killed, and how often it is retried
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_RETRIES = 1
+
+
+class RasterizerError(Exception):
+    """Raised when a backend is unavailable or fails to render"""
+
+
+class Rasterizer:
+    """Base class for SVG → PNG backends
+
+    Subclasses implement is_available(), version() and render(). render_many()
+    renders one SVG document to several (png_path, width, height) targets and
+    may be overridden by backends that can reuse a parsed document.
+    """
+
+    name = None
+
+    def is_available(self):
+        """Return True if the backend can be used on this machine"""
+        raise NotImplementedError
+
+    def version(self):
+        """Return the backend version string (used for cache keys and reports)"""
+        raise NotImplementedError
+
+    def render(self, svg_data, png_path, width, height):
+        """Render SVG text to a PNG file of the given size"""
+        raise NotImplementedError
+
+    def render_many(self, svg_data, targets):
+        """Render one SVG document to every (png_path, width, height) target"""
+        for png_path, width, height in targets:
+            self.render(svg_data, png_path, width, height)
+
+    def render_rgba(self, svg_data, width, height):
+        """Render to an (height, width, 4) RGBA uint8 NumPy array"""
+        import tempfile
+
+        from .png import read_png
+
+        fd, tmp_path = tempfile.mkstemp(suffix='.png')
+        os.close(fd)
+        try:
+            self.render(svg_data, tmp_path, width, height)
+            return read_png(tmp_path)
+        finally:
+            os.remove(tmp_path)
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class CairoSVGRasterizer(Rasterizer):
+    """In-process backend: one cairosvg parse, many PNG surfaces"""
+
+    name = 'cairosvg'
+    module = 'cairosvg'
+
+    def __init__(self):
+        self._cairosvg = None
+        self._version = None
+
+    def _module(self):
+        if self._cairosvg is None:
+            try:
+                import cairosvg
+            except (ImportError, OSError) as e:
+                # cairosvg raises OSError when the cairo shared library is missing
+                raise RasterizerError(f"cairosvg not available: {e}")
+            self._cairosvg = cairosvg
+        return self._cairosvg
+
+    def is_available(self):
+        try:
+            self._module()
+        except RasterizerError:
+            return False
+        return True
+
+    def version(self):
+        if self._version is None:
+            self._version = getattr(self._module(), '__version__', 'unknown')
+        return self._version
+
+    def parse(self, svg_data):
+        """Parse SVG text into a cairosvg tree that can be rendered repeatedly"""
+        cairosvg = self._module()
+        if isinstance(svg_data, str):
+            svg_data = svg_data.encode('utf-8')
+        return cairosvg.parser.Tree(bytestring=svg_data)
+
+    def render_tree(self, tree, png_path, width, height):
+        """Render an already parsed tree to a PNG file"""
+        cairosvg = self._module()
+        with open(png_path, 'wb') as output:
+            surface = cairosvg.surface.PNGSurface(
+                tree, output, 96, output_width=width, output_height=height
+            )
+            surface.finish()
+
+    def render(self, svg_data, png_path, width, height):
+        self.render_many(svg_data, [(png_path, width, height)])
+
+    def render_rgba(self, svg_data, width, height):
+        """Render straight from the cairo surface buffer, skipping PNG encode/decode"""
+        import numpy as np
+
+        cairosvg = self._module()
+        try:
+            surface = cairosvg.surface.PNGSurface(
+                self.parse(svg_data), None, 96, output_width=width, output_height=height
+            )
+            surface.cairo.flush()
+            stride = surface.cairo.get_stride()
+            buffer = np.frombuffer(surface.cairo.get_data(), dtype=np.uint8)
+            argb = buffer.reshape(height, stride)[:, :width * 4].reshape(height, width, 4).copy()
+            surface.finish()
+        except RasterizerError:
+            raise
+        except Exception as e:
+            raise RasterizerError(f"cairosvg failed: {e}")
+
+        # cairo ARGB32 is premultiplied and native-endian (BGRA bytes on little-endian)
+        order = [2, 1, 0, 3] if sys.byteorder == 'little' else [1, 2, 3, 0]
+        rgba = argb[..., order].astype(np.uint16)
+        alpha = rgba[..., 3:4]
+        unpremultiplied = (rgba[..., :3] * 255 + alpha // 2) // np.maximum(alpha, 1)
+        rgba[..., :3] = np.where(alpha > 0, np.minimum(unpremultiplied, 255), 0)
+        return rgba.astype(np.uint8)
+
+    def render_many(self, svg_data, targets):
+        try:
+            tree = self.parse(svg_data)
+            for png_path, width, height in targets:
+                self.render_tree(tree, png_path, width, height)
+        except RasterizerError:
+            raise
+        except Exception as e:
+            raise RasterizerError(f"cairosvg failed: {e}")
+
+
+class SubprocessRasterizer(Rasterizer):
+    """Base class for backends that drive an external command line tool
+
+    The SVG is piped through stdin, so no intermediate SVG file is needed.
+    A render that runs longer than `timeout` seconds is killed; batches go
+    through the asyncio driver in processes instead of render().
+    """
+
+    executable = None
+    version_args = ('--version',)
+    timeout = DEFAULT_TIMEOUT
+
+    def __init__(self):
+        self._version = None
+
+    def command(self, png_path, width, height):
+        """Return the argv that reads SVG on stdin and writes png_path"""
+        raise NotImplementedError
+
+    def is_available(self):
+        try:
+            self.version()
+        except RasterizerError:
+            return False
+        return True
+
+    def version(self):
+        if self._version is None:
+            import subprocess
+
+            try:
+                result = subprocess.run(
+                    [self.executable, *self.version_args],
+                    capture_output=True, text=True, timeout=self.timeout
+                )
+            except FileNotFoundError:
+                raise RasterizerError(f"{self.executable} not found")
+            except subprocess.TimeoutExpired:
+                raise RasterizerError(f"{self.executable} did not report its version")
+            if result.returncode != 0:
+                raise RasterizerError(f"{self.executable} is not usable")
+            lines = (result.stdout or result.stderr).strip().splitlines()
+            self._version = lines[0] if lines else 'unknown'
+        return self._version
+
+    def render(self, svg_data, png_path, width, height):
+        if isinstance(svg_data, str):
+            svg_data = svg_data.encode('utf-8')
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                self.command(png_path, width, height),
+                input=svg_data, capture_output=True, timeout=self.timeout
+            )
+        except FileNotFoundError:
+            raise RasterizerError(f"{self.executable} not found")
+        except subprocess.TimeoutExpired:
+            raise RasterizerError(f"{self.name} timed out after {self.timeout:g}s for {png_path}")
+        if result.returncode != 0:
+            stderr = result.stderr.decode('utf-8', 'replace').strip()
+            raise RasterizerError(f"{self.name} failed for {png_path}: {stderr}")
+
+
+class ImageMagickRasterizer(SubprocessRasterizer):
+    """ImageMagick `convert` fallback"""
+
+    name = 'imagemagick'
+    executable = 'convert'
+    version_args = ('-version',)
+
+    def command(self, png_path, width, height):
+        return ['convert', 'svg:-', '-resize', f'{width}x{height}', f'png:{png_path}']
+
+
+class RsvgRasterizer(SubprocessRasterizer):
+    """librsvg `rsvg-convert` fallback"""
+
+    name = 'rsvg'
+    executable = 'rsvg-convert'
+
+    def command(self, png_path, width, height):
+        return ['rsvg-convert', '-w', str(width), '-h', str(height), '-o', png_path]
+
+
+class NumpyRasterizer(Rasterizer):
+    """Pure NumPy fallback (raster) for the SVG subset the icons use; no native dependencies"""
+
+    name = 'numpy'
+    module = 'numpy'
+    # Bump when raster's output changes, so cached renders are not reused
+    revision = 1
+
+    def __init__(self):
+        self._version = None
+
+    def is_available(self):
+        try:
+            self.version()
+        except RasterizerError:
+            return False
+        return True
+
+    def version(self):
+        if self._version is None:
+            from importlib import metadata
+
+            try:
+                numpy_version = metadata.version('numpy')
+            except metadata.PackageNotFoundError:
+                raise RasterizerError("numpy not installed")
+            self._version = f"raster {self.revision} (numpy {numpy_version})"
+        return self._version
+
+    def render_rgba(self, svg_data, width, height):
+        from .raster import render_svg
+
+        return render_svg(svg_data, width, height)
+
+    def render(self, svg_data, png_path, width, height):
+        from .png import write_png
+
+        write_png(png_path, self.render_rgba(svg_data, width, height), level=6)
+
+
+BACKENDS = {
+    CairoSVGRasterizer.name: CairoSVGRasterizer,
+    RsvgRasterizer.name: RsvgRasterizer,
+    ImageMagickRasterizer.name: ImageMagickRasterizer,
+    NumpyRasterizer.name: NumpyRasterizer,
+}
+
+
+def _probed(name, info):
+    """A backend instance seeded with its probed version, so nothing is spawned or imported yet"""
+    backend = BACKENDS[name]()
+    backend._version = info['version']
+    return backend
+
+
+def get_rasterizer(name=None, order=None):
+    """Return a ready backend instance
+
+    With a name, that backend is returned or RasterizerError is raised.
+    Without one, the first available backend in `order` is used; the default
+    order puts the backend calibrated as fastest (breatheasy-assets backends --calibrate) first.
+    Availability comes from the cached probe, so no tool runs to decide it.
+    """
+    from .probe import preferred_order, probe_backends
+
+    probed = probe_backends()['backends']
+    if name is not None:
+        if name not in BACKENDS:
+            raise RasterizerError(f"Unknown rasterizer backend: {name}")
+        info = probed.get(name, {})
+        if not info.get('available'):
+            raise RasterizerError(f"Rasterizer backend not available: {name}")
+        return _probed(name, info)
+
+    order = order or preferred_order()
+    for candidate in order:
+        info = probed.get(candidate, {})
+        if info.get('available'):
+            return _probed(candidate, info)
+    raise RasterizerError("No SVG rasterizer available (tried: " + ", ".join(order) + ")")
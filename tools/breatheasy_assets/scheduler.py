@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Parallel render scheduler for the BreathEasy icon generators
+Spreads independent (variant, size) render jobs across a process pool and
+collects a result for every job instead of stopping at the first failure
+"""
+
+import os
+import time
+from collections import namedtuple
+
+from .build import replace_if_changed
+from .cache import render_key
+from .rasterizers import RasterizerError, SubprocessRasterizer, get_rasterizer
+from .tracing import count
+
+RenderJob = namedtuple('RenderJob', 'label svg_data png_path width height')
+JobResult = namedtuple('JobResult', 'job ok error seconds cached', defaults=(False,))
+
+# One backend instance per worker process, created on first use
+_worker_backends = {}
+
+
+def default_jobs():
+    """Default pool size: one worker per CPU"""
+    return os.cpu_count() or 1
+
+
+def _backend(name):
+    backend = _worker_backends.get(name)
+    if backend is None:
+        backend = get_rasterizer(name)
+        _worker_backends[name] = backend
+    return backend
+
+
+def temporary_path(png_path):
+    """Scratch file next to png_path that a render is written to before being swapped in
+
+    Swapping replaces a file hardlinked from the render cache instead of
+    overwriting the cached copy in place.
+    """
+    directory, filename = os.path.split(os.path.abspath(png_path))
+    return os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+
+
+def _run_job(backend_name, job, encoder_settings=None):
+    started = time.perf_counter()
+    tmp_path = temporary_path(job.png_path)
+    try:
+        backend = _backend(backend_name)
+        if encoder_settings is None:
+            backend.render(job.svg_data, tmp_path, job.width, job.height)
+        else:
+            from .encoder import ByteBudgetError, optimize_png
+
+            rgba = backend.render_rgba(job.svg_data, job.width, job.height)
+            try:
+                data = optimize_png(rgba, encoder_settings).data
+            except ByteBudgetError as e:
+                raise RasterizerError(str(e)) from e
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+        replace_if_changed(tmp_path, job.png_path)
+    except (RasterizerError, OSError) as e:
+        return JobResult(job, False, str(e), time.perf_counter() - started)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return JobResult(job, True, None, time.perf_counter() - started)
+
+
+class RenderReport:
+    """Outcome of one scheduler run"""
+
+    def __init__(self, backend_name, results, wall_time, workers):
+        self.backend_name = backend_name
+        self.results = results
+        self.wall_time = wall_time
+        self.workers = workers
+
+    @property
+    def succeeded(self):
+        return [r for r in self.results if r.ok]
+
+    @property
+    def failed(self):
+        return [r for r in self.results if not r.ok]
+
+    @property
+    def ok(self):
+        return bool(self.results) and not self.failed
+
+    @property
+    def cached(self):
+        return [r for r in self.results if r.cached]
+
+    @property
+    def slowest(self):
+        return max((r.seconds for r in self.results), default=0.0)
+
+    def print_summary(self):
+        """Print one line per job plus the overall timing"""
+        for result in self.results:
+            job = result.job
+            if result.cached:
+                print(f"♻️  Reused {job.label} → {job.png_path} from render cache")
+            elif result.ok:
+                print(f"✅ Rendered {job.label} → {job.png_path} ({job.width}×{job.height}, {result.seconds:.2f}s)")
+            else:
+                print(f"❌ {job.label} failed: {result.error}")
+        print(f"⏱️  {len(self.succeeded)}/{len(self.results)} renders with {self.backend_name} "
+              f"on {self.workers} worker(s) in {self.wall_time:.2f}s "
+              f"({len(self.cached)} from cache, slowest single render {self.slowest:.2f}s)")
+
+
+def render_jobs(jobs, backend_name=None, max_workers=None, cache=None, encoder_settings=None,
+                timeout=None, retries=None, verbose=False, tile_size=None):
+    """Render every job and return a RenderReport
+
+    The backend is resolved once in the calling process (auto-selected when
+    backend_name is None) and re-created lazily inside each worker.
+    With a RenderCache, hits are copied (or reflinked) into place and only
+    misses are rendered. With max_workers=1 the jobs run inline without a pool.
+    encoder_settings (encoder.EncoderSettings) runs the size-optimizing
+    encode stage on every render; its settings are part of the cache key.
+
+    Command line backends skip the pool: processes overlaps up to
+    max_workers tool processes from one event loop, killing any that run
+    past timeout seconds and retrying transient failures `retries` times;
+    verbose streams their stderr as it arrives.
+
+    With tile_size, renders larger than one tile are split by icon_tiles:
+    they run one after another, each spread across the whole pool.
+    """
+    jobs = list(jobs)
+    started = time.perf_counter()
+    backend = get_rasterizer(backend_name)
+    backend_name = backend.name
+
+    results_by_index = {}
+    keys = {}
+    if cache is not None:
+        backend_version = backend.version()
+        for index, job in enumerate(jobs):
+            key = render_key(job.svg_data, job.width, job.height, backend_name, backend_version,
+                             encoder_settings and encoder_settings._asdict())
+            if cache.fetch(key, job.png_path):
+                results_by_index[index] = JobResult(job, True, None, 0.0, cached=True)
+            else:
+                keys[index] = key
+    pending = [index for index in range(len(jobs)) if index not in results_by_index]
+    if cache is not None:
+        count('cache_hits', len(jobs) - len(pending))
+        count('cache_misses', len(pending))
+
+    if tile_size:
+        from .tiles import render_tiled_job, wants_tiles
+
+        for index in [index for index in pending if wants_tiles(jobs[index].width, jobs[index].height, tile_size)]:
+            results_by_index[index] = render_tiled_job(jobs[index], backend_name, tile_size,
+                                                       max_workers, encoder_settings)
+    untiled = [index for index in pending if index not in results_by_index]
+
+    workers = max(1, min(max_workers or default_jobs(), len(untiled) or 1))
+    if isinstance(backend, SubprocessRasterizer) and untiled:
+        from . import processes
+
+        options = {'encoder_settings': encoder_settings, 'verbose': verbose}
+        if timeout is not None:
+            options['timeout'] = timeout
+        if retries is not None:
+            options['retries'] = retries
+        converted = processes.convert_jobs(backend, [jobs[index] for index in untiled], workers, **options)
+        results_by_index.update(zip(untiled, converted))
+    elif workers == 1:
+        for index in untiled:
+            results_by_index[index] = _run_job(backend_name, jobs[index], encoder_settings)
+    else:
+        # Imported lazily: the process pool machinery is not needed for no-op runs
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_run_job, backend_name, jobs[index], encoder_settings): index
+                for index in untiled
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results_by_index[index] = future.result()
+                except Exception as e:
+                    # A crashed worker fails only its own job
+                    results_by_index[index] = JobResult(jobs[index], False, str(e), 0.0)
+
+    if cache is not None:
+        stored = [index for index in pending if results_by_index[index].ok]
+        for index in stored:
+            cache.store(keys[index], jobs[index].png_path)
+        if stored:
+            cache.evict()
+
+    results = [results_by_index[index] for index in range(len(jobs))]
+    count('renders', len(pending))
+    count('render_failures', sum(not result.ok for result in results))
+    return RenderReport(backend_name, results, time.perf_counter() - started, workers)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Apple app icon size matrix for BreathEasy
+One table drives both the PNG files produced from a single high-res render
+and the AppIcon.appiconset Contents.json that references them
+"""
+
+from collections import namedtuple
+
+APPICON_PATH = "BreathEasy/Assets.xcassets/AppIcon.appiconset"
+
+
+class IconSize(namedtuple('IconSize', 'idiom size scale role subtype')):
+    """One Contents.json image slot: idiom, point size, scale and optional watch role/subtype"""
+
+    __slots__ = ()
+
+    def __new__(cls, idiom, size, scale, role=None, subtype=None):
+        return super().__new__(cls, idiom, size, scale, role, subtype)
+
+    @property
+    def points(self):
+        """Point size as written in Contents.json ('20', '83.5')"""
+        return f"{self.size:g}"
+
+    @property
+    def pixels(self):
+        return int(round(self.size * self.scale))
+
+    @property
+    def marketing(self):
+        """App Store marketing images must be opaque"""
+        return self.idiom.endswith('-marketing')
+
+    @property
+    def filename(self):
+        return f"app-icon-{self.idiom}-{self.points}@{self.scale}x.png"
+
+    def contents_entry(self):
+        entry = {
+            "filename": self.filename,
+            "idiom": self.idiom,
+        }
+        if self.role:
+            entry["role"] = self.role
+        entry["scale"] = f"{self.scale}x"
+        entry["size"] = f"{self.points}x{self.points}"
+        if self.subtype:
+            entry["subtype"] = self.subtype
+        return entry
+
+
+APPLE_ICON_SIZES = [
+    # iPhone
+    IconSize('iphone', 20, 2), IconSize('iphone', 20, 3),
+    IconSize('iphone', 29, 2), IconSize('iphone', 29, 3),
+    IconSize('iphone', 40, 2), IconSize('iphone', 40, 3),
+    IconSize('iphone', 60, 2), IconSize('iphone', 60, 3),
+    # iPad
+    IconSize('ipad', 20, 1), IconSize('ipad', 20, 2),
+    IconSize('ipad', 29, 1), IconSize('ipad', 29, 2),
+    IconSize('ipad', 40, 1), IconSize('ipad', 40, 2),
+    IconSize('ipad', 76, 1), IconSize('ipad', 76, 2),
+    IconSize('ipad', 83.5, 2),
+    # Mac
+    IconSize('mac', 16, 1), IconSize('mac', 16, 2),
+    IconSize('mac', 32, 1), IconSize('mac', 32, 2),
+    IconSize('mac', 128, 1), IconSize('mac', 128, 2),
+    IconSize('mac', 256, 1), IconSize('mac', 256, 2),
+    IconSize('mac', 512, 1), IconSize('mac', 512, 2),
+    # Apple Watch
+    IconSize('watch', 24, 2, 'notificationCenter', '38mm'),
+    IconSize('watch', 27.5, 2, 'notificationCenter', '42mm'),
+    IconSize('watch', 29, 2, 'companionSettings'),
+    IconSize('watch', 29, 3, 'companionSettings'),
+    IconSize('watch', 33, 2, 'notificationCenter', '45mm'),
+    IconSize('watch', 40, 2, 'appLauncher', '38mm'),
+    IconSize('watch', 44, 2, 'appLauncher', '40mm'),
+    IconSize('watch', 46, 2, 'appLauncher', '41mm'),
+    IconSize('watch', 50, 2, 'appLauncher', '44mm'),
+    IconSize('watch', 51, 2, 'appLauncher', '45mm'),
+    IconSize('watch', 54, 2, 'appLauncher', '49mm'),
+    IconSize('watch', 86, 2, 'quickLook', '38mm'),
+    IconSize('watch', 98, 2, 'quickLook', '42mm'),
+    IconSize('watch', 108, 2, 'quickLook', '44mm'),
+    IconSize('watch', 117, 2, 'quickLook', '45mm'),
+    IconSize('watch', 129, 2, 'quickLook', '49mm'),
+    IconSize('watch-marketing', 1024, 1),
+]
+
+# Single-size 1024 marketing icons with their luminosity appearance (None = standard)
+APPEARANCE_ICONS = [
+    ('app-icon-1024.png', None),
+    ('app-icon-1024-dark.png', 'dark'),
+    ('app-icon-1024-tinted.png', 'tinted'),
+]
+
+
+def select_sizes(idioms=None, sizes=APPLE_ICON_SIZES):
+    """Return the table rows for the given idiom families (iphone, ipad, mac, watch)"""
+    if idioms is None:
+        return list(sizes)
+    return [s for s in sizes if s.idiom.split('-')[0] in idioms]
+
+
+def build_contents(sizes=APPLE_ICON_SIZES, appearance_icons=APPEARANCE_ICONS):
+    """Build the AppIcon.appiconset Contents.json dictionary"""
+    images = []
+    for filename, appearance in appearance_icons:
+        entry = {}
+        if appearance:
+            entry["appearances"] = [{"appearance": "luminosity", "value": appearance}]
+        entry.update({
+            "filename": filename,
+            "idiom": "universal",
+            "platform": "ios",
+            "size": "1024x1024",
+        })
+        images.append(entry)
+    images.extend(size.contents_entry() for size in sizes)
+    return {
+        "images": images,
+        "info": {
+            "author": "xcode",
+            "version": 1
+        }
+    }
+
+
+def area_weights(source, target):
+    """(target, source) matrix of exact box-filter coverage for one axis"""
+    import numpy as np
+
+    step = source / target
+    edges = np.arange(target + 1, dtype=np.float64) * step
+    pixels = np.arange(source, dtype=np.float64)[None, :]
+    overlap = np.minimum(edges[1:, None], pixels + 1) - np.maximum(edges[:-1, None], pixels)
+    return (np.clip(overlap, 0.0, None) / step).astype(np.float32)
+
+
+def area_downscale(pixels, size):
+    """Area-average a (n, n, 4) float image down to (size, size, 4)"""
+    import numpy as np
+
+    source = pixels.shape[0]
+    if source == size:
+        return pixels
+    if source % size == 0:
+        factor = source // size
+        return pixels.reshape(size, factor, size, factor, 4).mean(axis=(1, 3))
+    rows = area_weights(source, size)
+    cols = area_weights(pixels.shape[1], size)
+    scaled = np.tensordot(rows, pixels, axes=(1, 0))
+    return np.tensordot(scaled, cols, axes=(1, 1)).transpose(0, 2, 1)
+
+
+def downscale_chain(master, pixel_sizes):
+    """Build every requested square size from one RGBA uint8 master render
+
+    Resampling happens on premultiplied linear light so gradients and
+    anti-aliased edges keep their brightness. Each size is derived from the
+    smallest already-built image it divides evenly (falling back to the
+    master), so most steps are cheap integer-factor reductions.
+    """
+    from .color import from_linear_premultiplied, to_linear_premultiplied
+
+    master_size = master.shape[0]
+    if master.shape[1] != master_size:
+        raise ValueError("Master render must be square")
+    built = {master_size: to_linear_premultiplied(master)}
+    for size in sorted(set(pixel_sizes), reverse=True):
+        if size > master_size:
+            raise ValueError(f"Cannot build {size}px from a {master_size}px master")
+        if size in built:
+            continue
+        source = min((s for s in built if s % size == 0), default=master_size)
+        built[size] = area_downscale(built[source], size)
+    return {size: from_linear_premultiplied(built[size]) for size in pixel_sizes}
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Programmatic SVG builder for the BreathEasy icon designs
+Designs are written as Python (shapes, groups, gradients, loops) instead of
+hand-unrolled markup. Geometry repeated with only a different placement is
+defined once in <defs> and instanced with <use>, so the documents are
+smaller and every backend parses and tessellates each shape once.
+"""
+
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+SVG_NS = 'http://www.w3.org/2000/svg'
+
+INDENT = '  '
+
+
+def _name(keyword):
+    """Python keyword → SVG attribute name: stroke_width → stroke-width, class_ → class"""
+    return keyword.rstrip('_').replace('_', '-')
+
+
+def _value(value):
+    if isinstance(value, float):
+        return f'{value:g}'
+    return str(value).replace('&', '&amp;').replace('"', '&quot;').replace('<', '&lt;')
+
+
+class Element:
+    """One SVG element: tag, attributes in the order given, and children"""
+
+    def __init__(self, tag, *children, **attrs):
+        self.tag = tag
+        self.attrs = {_name(name): value for name, value in attrs.items() if value is not None}
+        self.children = list(children)
+
+    def add(self, *children):
+        self.children.extend(children)
+        return self
+
+    def markup(self, depth=0):
+        attrs = ''.join(f' {name}="{_value(value)}"' for name, value in self.attrs.items())
+        indent = INDENT * depth
+        if not self.children:
+            return f'{indent}<{self.tag}{attrs}/>\n'
+        inner = ''.join(child.markup(depth + 1) for child in self.children)
+        return f'{indent}<{self.tag}{attrs}>\n{inner}{indent}</{self.tag}>\n'
+
+    def key(self):
+        """Markup without the id, so identical definitions can be shared"""
+        element_id = self.attrs.pop('id', None)
+        try:
+            return self.markup()
+        finally:
+            if element_id is not None:
+                self.attrs['id'] = element_id
+
+
+def circle(cx, cy, r, **attrs):
+    return Element('circle', cx=cx, cy=cy, r=r, **attrs)
+
+
+def ellipse(cx, cy, rx, ry, **attrs):
+    return Element('ellipse', cx=cx, cy=cy, rx=rx, ry=ry, **attrs)
+
+
+def rect(x, y, width, height, **attrs):
+    return Element('rect', x=x, y=y, width=width, height=height, **attrs)
+
+
+def path(d, **attrs):
+    return Element('path', d=d, **attrs)
+
+
+def group(*children, **attrs):
+    return Element('g', *children, **attrs)
+
+
+def use(element_id, **attrs):
+    """Instance of a defined element (xlink:href, which every backend understands)"""
+    return Element('use', **{'xlink:href': f'#{element_id}'}, **attrs)
+
+
+def stop(offset, color, opacity=1):
+    """Gradient stop; color and opacity go in style, where the palettes look for them"""
+    return Element('stop', offset=offset, style=f'stop-color:{color};stop-opacity:{_value(opacity)}')
+
+
+def linear_gradient(element_id, stops, **attrs):
+    return Element('linearGradient', *stops, id=element_id, **attrs)
+
+
+def radial_gradient(element_id, stops, **attrs):
+    return Element('radialGradient', *stops, id=element_id, **attrs)
+
+
+def polyline_path(points):
+    """Path data through (x, y) points: M x,y L x,y ..."""
+    return ' '.join(f"{'M' if index == 0 else 'L'} {_value(float(x))},{_value(float(y))}"
+                    for index, (x, y) in enumerate(points))
+
+
+def rotations(count, start=0):
+    """rotate() transforms spacing count copies evenly around the origin"""
+    return [f'rotate({start + 360 * index / count:g})' for index in range(count)]
+
+
+class SvgBuilder:
+    """An icon document under construction: shared <defs> plus the drawing
+
+    define() adds a definition once (an identical one is shared under its
+    first id) and repeat() instances one shape at many placements.
+    """
+
+    def __init__(self, width=1024, height=1024, view_box=None):
+        self.width = width
+        self.height = height
+        self.view_box = view_box or f'0 0 {width} {height}'
+        self.defs = []
+        self.body = []
+        self._defined = {}
+
+    def define(self, element, element_id=None):
+        """Add element to <defs> unless an identical definition exists; return its id"""
+        key = element.key()
+        if key in self._defined:
+            return self._defined[key]
+        element_id = element_id or element.attrs.get('id') or f'shape{len(self.defs)}'
+        element.attrs = {'id': element_id, **{k: v for k, v in element.attrs.items() if k != 'id'}}
+        self._defined[key] = element_id
+        self.defs.append(element)
+        return element_id
+
+    def add(self, *elements):
+        self.body.extend(elements)
+        return elements[0] if len(elements) == 1 else elements
+
+    def repeat(self, element, placements, element_id=None):
+        """<use> instances of element, one per placement (a transform string or a dict of use attributes)"""
+        shape_id = self.define(element, element_id)
+        return [use(shape_id, **(placement if isinstance(placement, dict) else {'transform': placement}))
+                for placement in placements]
+
+    def markup(self):
+        root = Element('svg', xmlns=SVG_NS, **{'xmlns:xlink': XLINK_NS}, width=self.width, height=self.height,
+                       viewBox=self.view_box)
+        if self.defs:
+            root.add(Element('defs', *self.defs))
+        root.add(*self.body)
+        return root.markup()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Parse-once SVG document model for the BreathEasy icon generators
+The base design is tokenized a single time; variants (dark, tinted, seasonal,
+A/B candidates) are overlays of attribute changes on that shared tree and
+serialize by splicing only the changed values into the original text
+"""
+
+import re
+
+_TOKEN_RE = re.compile(
+    r'<!--.*?-->'                                   # comment
+    r'|<\?.*?\?>'                                   # XML declaration / PI
+    r'|<!\[CDATA\[.*?\]\]>'                         # CDATA section
+    r'|<(?P<close>/)?(?P<tag>[\w:.-]+)(?P<attrs>(?:\s+[\w:.-]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*)\s*(?P<empty>/)?>',
+    re.DOTALL
+)
+_ATTR_RE = re.compile(r'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+
+class SvgElement:
+    """One element of the shared tree with its attribute values and source spans"""
+
+    __slots__ = ('index', 'tag', 'attrs', 'spans', 'end', 'parent', 'children')
+
+    def __init__(self, index, tag, parent):
+        self.index = index
+        self.tag = tag
+        self.attrs = {}
+        # name → (start, end, quote, attr_start) where start/end delimit the value
+        # and attr_start is the whitespace before the name (used for removal)
+        self.spans = {}
+        # Offset where new attributes are inserted (just before '>' or '/>')
+        self.end = None
+        self.parent = parent
+        self.children = []
+
+    def get(self, name, default=None):
+        return self.attrs.get(name, default)
+
+    def iter(self, tag=None):
+        """Yield this element and its descendants in document order"""
+        if tag is None or self.tag == tag:
+            yield self
+        for child in self.children:
+            yield from child.iter(tag)
+
+    def __repr__(self):
+        element_id = self.attrs.get('id')
+        return f"<SvgElement {self.tag}{'#' + element_id if element_id else ''} [{self.index}]>"
+
+
+class SvgDocument:
+    """A base SVG parsed once and shared by every variant derived from it"""
+
+    def __init__(self, svg_data):
+        if isinstance(svg_data, bytes):
+            svg_data = svg_data.decode('utf-8')
+        self.source = svg_data
+        self.elements = []
+        self.root = None
+        self.by_id = {}
+        self._parse()
+
+    def _parse(self):
+        stack = []
+        for token in _TOKEN_RE.finditer(self.source):
+            tag = token.group('tag')
+            if tag is None:
+                continue
+            if token.group('close'):
+                if not stack or stack[-1].tag != tag:
+                    raise ValueError(f"Mismatched </{tag}> at offset {token.start()}")
+                stack.pop()
+                continue
+
+            element = SvgElement(len(self.elements), tag, stack[-1] if stack else None)
+            attrs_start = previous_end = token.start('attrs')
+            for attr in _ATTR_RE.finditer(token.group('attrs')):
+                name = attr.group(1)
+                group = 2 if attr.group(2) is not None else 3
+                element.attrs[name] = attr.group(group)
+                element.spans[name] = (
+                    attrs_start + attr.start(group),
+                    attrs_start + attr.end(group),
+                    '"' if group == 2 else "'",
+                    previous_end,
+                )
+                previous_end = attrs_start + attr.end()
+            element.end = token.end('attrs')
+            self.elements.append(element)
+            if element.parent is not None:
+                element.parent.children.append(element)
+            elif self.root is None:
+                self.root = element
+            if 'id' in element.attrs:
+                self.by_id[element.attrs['id']] = element
+            if not token.group('empty'):
+                stack.append(element)
+
+        if stack:
+            raise ValueError(f"Unclosed <{stack[-1].tag}> element")
+        if self.root is None or self.root.tag != 'svg':
+            raise ValueError("Document has no <svg> root element")
+
+    def iter(self, tag=None):
+        """Yield every element (optionally only one tag) in document order"""
+        return self.root.iter(tag)
+
+    def variant(self, name, palette=None, overrides=None):
+        """Create a variant overlay, optionally pre-filled from a PaletteMap"""
+        variant = SvgVariant(self, name)
+        if palette is not None:
+            variant.apply_palette(palette)
+        for (element, attr), value in (overrides or {}).items():
+            variant.set(element, attr, value)
+        return variant
+
+    def serialize(self):
+        return self.source
+
+
+class SvgVariant:
+    """Attribute overlay on a shared SvgDocument
+
+    Only changed attributes are stored, keyed on (element index, name); a value
+    of None removes the attribute. Values are written verbatim into the markup
+    apart from escaping the quote character.
+    """
+
+    def __init__(self, document, name):
+        self.document = document
+        self.name = name
+        self.overrides = {}
+
+    def _element(self, element):
+        if isinstance(element, SvgElement):
+            return element
+        if isinstance(element, int):
+            return self.document.elements[element]
+        return self.document.by_id[element]
+
+    def get(self, element, attr, default=None):
+        element = self._element(element)
+        return self.overrides.get((element.index, attr), element.attrs.get(attr, default))
+
+    def set(self, element, attr, value):
+        """Override (or with None, remove) one attribute; element is an SvgElement, index or id"""
+        element = self._element(element)
+        if value == element.attrs.get(attr) and attr in element.attrs:
+            self.overrides.pop((element.index, attr), None)
+        else:
+            self.overrides[(element.index, attr)] = value
+
+    def apply_palette(self, palette):
+        """Record palette remaps of every paint attribute and style declaration"""
+        for element in self.document.elements:
+            for attr, value in element.attrs.items():
+                current = self.overrides.get((element.index, attr), value)
+                if current is None:
+                    continue
+                remapped = palette.remap_attribute(attr, current)
+                if remapped != current:
+                    self.set(element, attr, remapped)
+        return self
+
+    def serialize(self):
+        """Return the variant markup by splicing overrides into the base text"""
+        source = self.document.source
+        edits = []
+        for (index, attr), value in self.overrides.items():
+            element = self.document.elements[index]
+            if attr in element.spans:
+                start, end, quote, attr_start = element.spans[attr]
+                if value is None:
+                    edits.append((attr_start, end + 1, ''))
+                else:
+                    edits.append((start, end, value.replace(quote, '&quot;' if quote == '"' else '&apos;')))
+            elif value is not None:
+                edits.append((element.end, element.end, f' {attr}="{value.replace(chr(34), "&quot;")}"'))
+
+        pieces = []
+        position = 0
+        for start, end, text in sorted(edits, key=lambda edit: edit[:2]):
+            pieces.append(source[position:start])
+            pieces.append(text)
+            position = end
+        pieces.append(source[position:])
+        return ''.join(pieces)
+
+    def render(self, backend, png_path, width, height):
+        """Render this variant with a rasterizer backend"""
+        backend.render(self.serialize(), png_path, width, height)
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+SVG optimization pass for the BreathEasy icon designs
+Runs on every generated variant before it is rendered or written: comments,
+the XML declaration and formatting whitespace go, style declarations become
+presentation attributes, identical gradients are merged, attributes equal to
+their default (or inherited) value are dropped and coordinates are rounded
+to a fixed number of decimals. The markup is the same drawing, only smaller
+and quicker for every backend to parse.
+"""
+
+import re
+import sys
+
+from .svg_document import _ATTR_RE, _TOKEN_RE
+
+# Decimals kept in coordinates, lengths and opacities (1/100 of a 1024-unit viewBox is invisible)
+DEFAULT_PRECISION = 2
+
+# Style properties that may be written as presentation attributes instead
+PRESENTATION_ATTRIBUTES = {
+    'clip-path', 'clip-rule', 'color', 'display', 'fill', 'fill-opacity', 'fill-rule', 'filter',
+    'flood-color', 'flood-opacity', 'mask', 'opacity', 'stop-color', 'stop-opacity', 'stroke',
+    'stroke-dasharray', 'stroke-dashoffset', 'stroke-linecap', 'stroke-linejoin', 'stroke-miterlimit',
+    'stroke-opacity', 'stroke-width', 'visibility',
+}
+
+# Inherited properties and their initial values; dropped when equal to the inherited value
+INHERITED_DEFAULTS = {
+    'fill-opacity': '1', 'fill-rule': 'nonzero', 'stroke': 'none', 'stroke-opacity': '1',
+    'stroke-width': '1', 'stroke-linecap': 'butt', 'stroke-linejoin': 'miter', 'stroke-miterlimit': '4',
+    'visibility': 'visible',
+}
+
+# Non-inherited properties, dropped wherever they equal their initial value
+DEFAULTS = {'opacity': '1', 'stop-opacity': '1', 'flood-opacity': '1'}
+
+# Per-element attribute defaults (gradients only when they inherit nothing through href)
+ELEMENT_DEFAULTS = {
+    'circle': {'cx': '0', 'cy': '0'},
+    'ellipse': {'cx': '0', 'cy': '0'},
+    'rect': {'x': '0', 'y': '0'},
+    'use': {'x': '0', 'y': '0'},
+    'stop': {'offset': '0'},
+    'linearGradient': {'x1': '0%', 'y1': '0%', 'x2': '100%', 'y2': '0%',
+                       'gradientUnits': 'objectBoundingBox', 'spreadMethod': 'pad'},
+    'radialGradient': {'cx': '50%', 'cy': '50%', 'r': '50%',
+                       'gradientUnits': 'objectBoundingBox', 'spreadMethod': 'pad'},
+}
+
+# Attributes holding numbers (or lists of them) that are rounded
+NUMERIC_ATTRIBUTES = {
+    'cx', 'cy', 'd', 'dx', 'dy', 'fill-opacity', 'flood-opacity', 'fx', 'fy', 'height', 'offset',
+    'opacity', 'points', 'r', 'rx', 'ry', 'stdDeviation', 'stop-opacity', 'stroke-dasharray',
+    'stroke-dashoffset', 'stroke-miterlimit', 'stroke-opacity', 'stroke-width', 'transform',
+    'viewBox', 'width', 'x', 'x1', 'x2', 'y', 'y1', 'y2',
+}
+
+# Content of these is instanced elsewhere, so it inherits from the use site, not its parent
+_DETACHED = {'defs', 'symbol', 'pattern', 'marker', 'clipPath', 'mask'}
+_GRADIENTS = ('linearGradient', 'radialGradient')
+
+_NUMBER_RE = re.compile(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+_PATH_COMMAND_SPACE_RE = re.compile(r'\s*([MmZzLlHhVvCcSsQqTtAa])\s*')
+_PATH_COMMAND_RE = re.compile(r'[MmZzLlHhVvCcSsQqTtAa]')
+_ARC_FLAG_RE = re.compile(r'[01]')
+_SEPARATOR_RE = re.compile(r'[\s,]*')
+_COMMA_RE = re.compile(r'\s*,\s*')
+_URL_RE = re.compile(r'url\(\s*#([^)\s]+)\s*\)')
+
+
+class _Node:
+    __slots__ = ('tag', 'attrs', 'children')
+
+    def __init__(self, tag, attrs):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+
+    def iter(self):
+        yield self
+        for child in self.children:
+            if isinstance(child, _Node):
+                yield from child.iter()
+
+    def markup(self):
+        attrs = ''.join(f' {name}="{value}"' for name, value in self.attrs.items())
+        if not self.children:
+            return f'<{self.tag}{attrs}/>'
+        inner = ''.join(child.markup() if isinstance(child, _Node) else child for child in self.children)
+        return f'<{self.tag}{attrs}>{inner}</{self.tag}>'
+
+
+def _parse(svg_data):
+    """Element tree without comments, declarations or whitespace-only text"""
+    root = None
+    stack = []
+    position = 0
+    for token in _TOKEN_RE.finditer(svg_data):
+        text = svg_data[position:token.start()]
+        position = token.end()
+        if stack and text.strip():
+            stack[-1].children.append(text)
+        markup = token.group(0)
+        if markup.startswith('<![CDATA['):
+            if stack:
+                stack[-1].children.append(markup)
+            continue
+        tag = token.group('tag')
+        if tag is None:
+            continue
+        if token.group('close'):
+            if not stack or stack[-1].tag != tag:
+                raise ValueError(f"Mismatched </{tag}> at offset {token.start()}")
+            stack.pop()
+            continue
+        attrs = {}
+        for attr in _ATTR_RE.finditer(token.group('attrs')):
+            value = attr.group(2) if attr.group(2) is not None else attr.group(3).replace('"', '&quot;')
+            attrs[attr.group(1)] = value
+        node = _Node(tag, attrs)
+        if stack:
+            stack[-1].children.append(node)
+        elif root is None:
+            root = node
+        if not token.group('empty'):
+            stack.append(node)
+    if stack:
+        raise ValueError(f"Unclosed <{stack[-1].tag}> element")
+    if root is None or root.tag != 'svg':
+        raise ValueError("Document has no <svg> root element")
+    return root
+
+
+def format_number(value, precision=DEFAULT_PRECISION):
+    """Shortest spelling of value rounded to precision decimals: 0.50 → .5, -0.0 → 0"""
+    rounded = round(float(value), precision)
+    if rounded == int(rounded):
+        return str(int(rounded))
+    text = f'{rounded:.{precision}f}'.rstrip('0')
+    return text.replace('0.', '.', 1) if text.startswith(('0.', '-0.')) else text
+
+
+def _round_number(match, precision):
+    text = match.group(0)
+    # Plain integers (most icon coordinates) are already as short as they get
+    if text.isdigit() and (text[0] != '0' or text == '0'):
+        return text
+    return format_number(text, precision)
+
+
+def _separator(previous, number):
+    """'' where number can follow previous directly without the two reading as one number"""
+    if number.startswith(('-', '+')) or (number.startswith('.') and '.' in previous):
+        return ''
+    return ' '
+
+
+def _path_tokens(value, precision):
+    """Commands and rounded numbers of path (or points) data, None if it does not parse
+
+    Arc flags are read as single digits, since compact data may write them
+    without separators (a25 25 0 0150 50).
+    """
+    tokens = []
+    command = None
+    index = 0
+    position = _SEPARATOR_RE.match(value).end()
+    while position < len(value):
+        match = _PATH_COMMAND_RE.match(value, position)
+        if match:
+            command, index = match.group(0), 0
+            tokens.append((command, False))
+        else:
+            flag = command in ('A', 'a') and index % 7 in (3, 4)
+            match = (_ARC_FLAG_RE if flag else _NUMBER_RE).match(value, position)
+            if not match:
+                return None
+            tokens.append((match.group(0) if flag else _round_number(match, precision), True))
+            index += 1
+        position = _SEPARATOR_RE.match(value, match.end()).end()
+    return tokens
+
+
+def _round_numbers(name, value, precision):
+    if name in ('d', 'points'):
+        tokens = _path_tokens(value, precision)
+        if tokens is not None:
+            parts = []
+            previous = None
+            for token, number in tokens:
+                if number and previous is not None:
+                    parts.append(_separator(previous, token))
+                parts.append(token)
+                previous = token if number else None
+            return ''.join(parts)
+    # Numbers written back to back (1.5.5) are kept apart if rounding would merge them
+    parts = []
+    position = 0
+    previous = None
+    for match in _NUMBER_RE.finditer(value):
+        number = _round_number(match, precision)
+        between = value[position:match.start()]
+        parts.append(_separator(previous, number) if previous is not None and not between else between)
+        parts.append(number)
+        position = match.end()
+        previous = number
+    parts.append(value[position:])
+    value = ' '.join(''.join(parts).split())
+    if name == 'd':
+        value = _PATH_COMMAND_SPACE_RE.sub(r'\1', value)
+    return _COMMA_RE.sub(',', value)
+
+
+def _style_to_attributes(node):
+    """Move presentation properties out of style (style wins over an existing attribute)"""
+    style = node.attrs.pop('style', None)
+    if style is None:
+        return
+    kept = []
+    for declaration in style.split(';'):
+        name, colon, value = declaration.partition(':')
+        name, value = name.strip(), value.strip()
+        if not colon or not name:
+            continue
+        if name in PRESENTATION_ATTRIBUTES and '!important' not in value:
+            node.attrs[name] = value
+        else:
+            kept.append(f'{name}:{value}')
+    if kept:
+        node.attrs['style'] = ';'.join(kept)
+
+
+def _drop_defaults(node, inherited):
+    """Remove attributes equal to their default; inherited is None inside instanced content"""
+    defaults = dict(DEFAULTS)
+    if node.tag not in _GRADIENTS or not (node.attrs.get('href') or node.attrs.get('xlink:href')):
+        defaults.update(ELEMENT_DEFAULTS.get(node.tag, {}))
+    for name in list(node.attrs):
+        value = node.attrs[name]
+        if name in INHERITED_DEFAULTS:
+            if inherited is not None and inherited.get(name, INHERITED_DEFAULTS[name]) == value:
+                del node.attrs[name]
+        elif defaults.get(name) == value or (defaults.get(name) in ('0', '0%') and value in ('0', '0%')):
+            del node.attrs[name]
+
+
+def _optimize_tree(node, inherited, precision, styles):
+    if not styles:
+        _style_to_attributes(node)
+    for name, value in node.attrs.items():
+        if name in NUMERIC_ATTRIBUTES:
+            node.attrs[name] = _round_numbers(name, value, precision)
+    _drop_defaults(node, inherited)
+    if node.tag in _DETACHED:
+        inherited = None
+    elif inherited is not None:
+        inherited = dict(inherited, **{name: node.attrs[name] for name in INHERITED_DEFAULTS
+                                       if name in node.attrs})
+    for child in node.children:
+        if isinstance(child, _Node):
+            _optimize_tree(child, inherited, precision, styles)
+
+
+def _merge_gradients(root):
+    """Keep the first of identical gradients and point references at it; return how many went"""
+    kept = {}
+    mapping = {}
+    for parent in list(root.iter()):
+        for child in list(parent.children):
+            if not isinstance(child, _Node) or child.tag not in _GRADIENTS or 'id' not in child.attrs:
+                continue
+            element_id = child.attrs.pop('id')
+            key = child.markup()
+            child.attrs = {'id': element_id, **child.attrs}
+            if key in kept:
+                mapping[element_id] = kept[key]
+                parent.children.remove(child)
+            else:
+                kept[key] = element_id
+    if not mapping:
+        return 0
+
+    def replace(match):
+        return f'url(#{mapping.get(match.group(1), match.group(1))})'
+
+    for node in root.iter():
+        for name, value in node.attrs.items():
+            if name in ('href', 'xlink:href') and value[1:] in mapping:
+                node.attrs[name] = '#' + mapping[value[1:]]
+            elif 'url(' in value:
+                node.attrs[name] = _URL_RE.sub(replace, value)
+    for node in list(root.iter()):
+        node.children = [child for child in node.children
+                         if not (isinstance(child, _Node) and child.tag == 'defs' and not child.children)]
+    return len(mapping)
+
+
+def optimize_svg(svg_data, precision=DEFAULT_PRECISION):
+    """Return the optimized markup of one SVG document (str or bytes in, str out)"""
+    if isinstance(svg_data, bytes):
+        svg_data = svg_data.decode('utf-8')
+    root = _parse(svg_data)
+    # A <style> sheet sits between presentation attributes and style="" in the cascade
+    styles = any(node.tag == 'style' for node in root.iter())
+    _optimize_tree(root, {}, precision, styles)
+    _merge_gradients(root)
+    if not any(name.startswith('xlink:') for node in root.iter() for name in node.attrs):
+        root.attrs.pop('xmlns:xlink', None)
+    return root.markup() + '\n'
+
+
+def parse_time(svg_data, repeats=300):
+    """Best-of-7 time in milliseconds for an XML parser (as the backends use) to read svg_data"""
+    import timeit
+    import xml.etree.ElementTree as ET
+
+    if isinstance(svg_data, str):
+        svg_data = svg_data.encode('utf-8')
+    return min(timeit.repeat(lambda: ET.fromstring(svg_data), number=repeats, repeat=7)) / repeats * 1000
+
+
+def savings(before, after):
+    """(bytes before, bytes after, parse ms before, parse ms after) of one document"""
+    before = before.encode('utf-8') if isinstance(before, str) else before
+    after = after.encode('utf-8') if isinstance(after, str) else after
+    return len(before), len(after), parse_time(before), parse_time(after)
+
+
+def _percent(before, after):
+    return f"{(after - before) / before * 100:+.0f}%" if before else "n/a"
+
+
+def print_report(rows):
+    """Print one line per (name, savings) row and a total"""
+    totals = [0, 0, 0.0, 0.0]
+    for name, row in rows:
+        size, optimized_size, parse_ms, optimized_parse_ms = row
+        print(f"📉 {name}: {size} → {optimized_size} bytes ({_percent(size, optimized_size)}), "
+              f"parse {parse_ms:.3f} → {optimized_parse_ms:.3f} ms ({_percent(parse_ms, optimized_parse_ms)})")
+        totals = [total + value for total, value in zip(totals, row)]
+    if len(rows) > 1:
+        size, optimized_size, parse_ms, optimized_parse_ms = totals
+        print(f"✅ {len(rows)} files: {size - optimized_size} bytes saved ({_percent(size, optimized_size)}), "
+              f"parse {_percent(parse_ms, optimized_parse_ms)}")
+
+
+def optimize_files(paths, precision=DEFAULT_PRECISION, write=False):
+    """Report (and with write, apply) the optimization of SVG files; False on an unreadable file"""
+    from .build import write_text
+
+    rows = []
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                svg_data = f.read()
+            optimized = optimize_svg(svg_data, precision)
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            print(f"❌ {path}: {e}")
+            return False
+        rows.append((path, savings(svg_data, optimized)))
+        if write:
+            write_text(path, optimized)
+    print_report(rows)
+    return True
+
+
+def add_optimize_arguments(parser):
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION,
+                        help=f"decimals kept in coordinates and opacities (default: {DEFAULT_PRECISION})")
+    parser.add_argument('--write', action='store_true',
+                        help="replace the files with their optimized markup")
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Optimize SVG files and report the byte and parse-time savings")
+    parser.add_argument('files', nargs='+', help="SVG files to optimize")
+    add_optimize_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return optimize_files(args.files, args.precision, args.write)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Design parameter sweeps for the BreathEasy icon designs
+Each design module lists the parameters it can vary (petal count, ring radii,
+heart scale, pulse amplitude; every design also gets its appearance palette).
+A sweep takes value ranges, builds the full Cartesian set of candidates,
+renders every candidate at several sizes on the render scheduler's process
+pool (through the render cache) and composites them into one contact-sheet
+PNG with NumPy, plus a JSON index of which cell holds which parameters.
+
+Structural parameters (ones that change which elements exist) are arguments
+of the design's SWEEP_TEMPLATE and get one parsed document per value;
+all others are SvgVariant overlays on that shared document.
+"""
+
+import itertools
+import json
+import os
+
+DEFAULT_SIZES = (128, 32)
+
+# Contact sheet layout in pixels
+PADDING = 12
+GAP = 6
+BACKGROUND = (0xE8, 0xEC, 0xF1, 0xFF)
+FAILED = (0xF2, 0xB8, 0xB8, 0xFF)
+
+# More candidates than this needs --force: each one is len(sizes) renders
+MAX_CANDIDATES = 2000
+
+PALETTES = ('standard', 'dark', 'tinted')
+
+
+class SweepError(Exception):
+    """Raised for unknown parameters, malformed values or oversized sweeps"""
+
+
+class Parameter:
+    """One sweepable design parameter
+
+    parse turns one command line value into a parameter value; apply(variant,
+    value) records it as overlays on an SvgVariant. A parameter without apply
+    is structural: its value is passed to the design's SWEEP_TEMPLATE.
+    """
+
+    def __init__(self, name, default, parse=float, apply=None, help=''):
+        self.name = name
+        self.default = default
+        self.parse = parse
+        self.apply = apply
+        self.help = help
+
+    @property
+    def structural(self):
+        return self.apply is None
+
+    def values(self, texts):
+        """Parse command line values; START..STOP:COUNT spans COUNT evenly spaced numbers"""
+        values = []
+        for text in texts:
+            try:
+                if '..' in text and self.parse in (int, float):
+                    span, _, steps = text.partition(':')
+                    start, stop = (float(bound) for bound in span.split('..'))
+                    steps = int(steps or (abs(stop - start) + 1 if self.parse is int else 5))
+                    if steps < 2:
+                        values.append(self.parse(start))
+                        continue
+                    values.extend(self.parse(round(start + (stop - start) * i / (steps - 1), 6))
+                                  for i in range(steps))
+                else:
+                    values.append(self.parse(text))
+            except ValueError as e:
+                raise SweepError(f"Bad value {text!r} for {self.name}: {e}")
+        # Keep the first occurrence of each value (int ranges can repeat after rounding)
+        return list(dict.fromkeys(values))
+
+
+def radii(text):
+    """'120,150,180' → (120.0, 150.0, 180.0)"""
+    values = tuple(float(value) for value in text.split(','))
+    if any(value <= 0 for value in values):
+        raise ValueError("radii must be positive")
+    return values
+
+
+def palette_parameter(design):
+    """The appearance palette every design can be swept over"""
+    palettes = {'standard': None, 'dark': design.dark_palette, 'tinted': design.tinted_palette}
+
+    def parse(text):
+        if text not in palettes:
+            raise ValueError(f"choose from {', '.join(PALETTES)}")
+        return text
+
+    def apply(variant, name):
+        if palettes[name] is not None:
+            variant.apply_palette(palettes[name])
+
+    return Parameter('palette', 'standard', parse, apply, help=f"appearance palette ({', '.join(PALETTES)})")
+
+
+def design_parameters(module):
+    """The sweepable parameters of a generator module, palette last (it recolors the other overlays)"""
+    parameters = list(getattr(module, 'sweep_parameters', lambda: [])())
+    return parameters + [palette_parameter(module.DESIGN)]
+
+
+def candidates(parameters, ranges):
+    """Every combination of the swept values as {name: value}, later parameters varying fastest"""
+    by_name = {parameter.name: parameter for parameter in parameters}
+    unknown = sorted(set(ranges) - set(by_name))
+    if unknown:
+        raise SweepError(f"Unknown parameter(s): {', '.join(unknown)} (have: {', '.join(by_name)})")
+    axes = [parameter.values(ranges[parameter.name]) if parameter.name in ranges else [parameter.default]
+            for parameter in parameters]
+    return [dict(zip(by_name, combination)) for combination in itertools.product(*axes)]
+
+
+def candidate_svgs(module, parameters, combinations):
+    """SVG text of each candidate; one parsed document per structural combination"""
+    from .svg_document import SvgDocument
+    from .svg_optimize import optimize_svg
+
+    structural = [parameter for parameter in parameters if parameter.structural]
+    overlays = [parameter for parameter in parameters if not parameter.structural]
+    documents = {}
+    svgs = []
+    for values in combinations:
+        key = tuple(values[parameter.name] for parameter in structural)
+        if key not in documents:
+            template = getattr(module, 'SWEEP_TEMPLATE', None)
+            base_svg = (template(**{parameter.name: values[parameter.name] for parameter in structural})
+                        if structural else module.DESIGN.base_svg)
+            documents[key] = SvgDocument(base_svg)
+        variant = documents[key].variant('candidate')
+        for parameter in overlays:
+            parameter.apply(variant, values[parameter.name])
+        svgs.append(optimize_svg(variant.serialize()))
+    return svgs
+
+
+def render_candidates(svgs, sizes, backend_name=None, max_workers=None, cache=None):
+    """[{size: RGBA array or None}] per candidate, rendered on the scheduler's pool
+
+    Returns (renders, RenderReport).
+    """
+    import tempfile
+
+    from .png import read_png
+    from .scheduler import RenderJob, render_jobs
+
+    with tempfile.TemporaryDirectory(prefix='icon-sweep-') as scratch:
+        jobs = [RenderJob(f"candidate {index} {size}px", svg, os.path.join(scratch, f'{index}-{size}.png'),
+                          size, size)
+                for index, svg in enumerate(svgs) for size in sizes]
+        report = render_jobs(jobs, backend_name, max_workers, cache)
+        renders = [{} for _ in svgs]
+        for result in report.results:
+            index, size = (int(part) for part in os.path.basename(result.job.png_path)[:-4].split('-'))
+            renders[index][size] = read_png(result.job.png_path) if result.ok else None
+    return renders, report
+
+
+def cell_size(sizes):
+    """(width, height) of one contact-sheet cell: the largest render above the smaller ones"""
+    large, small = sizes[0], sizes[1:]
+    width = max(large, sum(small) + GAP * (len(small) - 1)) + 2 * PADDING
+    height = large + (max(small) + GAP if small else 0) + 2 * PADDING
+    return width, height
+
+
+def _composite(sheet, rgba, x, y):
+    """Alpha-blend an RGBA render onto the sheet at (x, y)"""
+    import numpy as np
+
+    height, width = rgba.shape[:2]
+    region = sheet[y:y + height, x:x + width]
+    alpha = rgba[..., 3:4].astype(np.float32) / 255
+    region[..., :3] = (rgba[..., :3] * alpha + region[..., :3] * (1 - alpha) + 0.5).astype(np.uint8)
+
+
+def contact_sheet(renders, sizes, columns):
+    """Composite every candidate's renders into one RGBA sheet; return (sheet, [(x, y)] per cell)"""
+    import numpy as np
+
+    cell_width, cell_height = cell_size(sizes)
+    rows = -(-len(renders) // columns)
+    sheet = np.empty((rows * cell_height, columns * cell_width, 4), dtype=np.uint8)
+    sheet[...] = BACKGROUND
+    origins = []
+    for index, candidate in enumerate(renders):
+        left, top = (index % columns) * cell_width, (index // columns) * cell_height
+        origins.append((left, top))
+        if any(candidate.get(size) is None for size in sizes):
+            sheet[top + PADDING // 2:top + cell_height - PADDING // 2,
+                  left + PADDING // 2:left + cell_width - PADDING // 2] = FAILED
+            continue
+        x, y = left + PADDING, top + PADDING
+        _composite(sheet, candidate[sizes[0]], x + (cell_width - 2 * PADDING - sizes[0]) // 2, y)
+        y += sizes[0] + GAP
+        for size in sizes[1:]:
+            _composite(sheet, candidate[size], x, y)
+            x += size + GAP
+    return sheet, origins
+
+
+def write_index(path, design_name, sizes, columns, combinations, origins, renders):
+    """JSON index: sheet geometry plus the parameters and pixel box of every cell"""
+    from .build import write_text
+
+    cell_width, cell_height = cell_size(sizes)
+    cells = []
+    for index, (values, (x, y), candidate) in enumerate(zip(combinations, origins, renders)):
+        cells.append({
+            'index': index,
+            'row': index // columns,
+            'column': index % columns,
+            'box': [x, y, cell_width, cell_height],
+            'parameters': {name: list(value) if isinstance(value, tuple) else value
+                           for name, value in values.items()},
+            'ok': all(candidate.get(size) is not None for size in sizes),
+        })
+    write_text(path, json.dumps({'design': design_name, 'sizes': list(sizes), 'columns': columns,
+                                 'cells': cells}, indent=2) + '\n')
+
+
+def sweep(module, design_name, ranges, sizes=DEFAULT_SIZES, output=None, columns=None,
+          backend_name=None, max_workers=None, cache=None, force=False):
+    """Render the Cartesian set of a design's parameter ranges into a contact sheet
+
+    ranges maps parameter names to lists of command line values. Writes
+    <output>.png and <output>.json; returns True when every candidate rendered.
+    """
+    import math
+    import time
+
+    from .png import write_png
+    from .rasterizers import RasterizerError
+
+    sizes = sorted(set(sizes), reverse=True)
+    output = output or f'sweep-{design_name}.png'
+    parameters = design_parameters(module)
+    try:
+        combinations = candidates(parameters, ranges)
+        if len(combinations) > MAX_CANDIDATES and not force:
+            raise SweepError(f"{len(combinations)} candidates is more than {MAX_CANDIDATES}; "
+                             f"narrow the ranges or pass --force")
+        started = time.perf_counter()
+        svgs = candidate_svgs(module, parameters, combinations)
+        print(f"🎛️  {len(combinations)} {design_name} candidates × {len(sizes)} sizes "
+              f"({time.perf_counter() - started:.2f}s to build the SVGs)")
+        renders, report = render_candidates(svgs, sizes, backend_name, max_workers, cache)
+    except (SweepError, RasterizerError) as e:
+        print(f"❌ {e}")
+        return False
+    for result in report.failed:
+        print(f"❌ {result.job.label} failed: {result.error}")
+    print(f"⏱️  {len(report.succeeded)}/{len(report.results)} renders with {report.backend_name} on "
+          f"{report.workers} worker(s) in {report.wall_time:.2f}s ({len(report.cached)} from cache)")
+
+    columns = columns or math.ceil(math.sqrt(len(combinations)))
+    sheet, origins = contact_sheet(renders, sizes, columns)
+    write_png(output, sheet, level=6)
+    index_path = os.path.splitext(output)[0] + '.json'
+    write_index(index_path, design_name, sizes, columns, combinations, origins, renders)
+    print(f"🖼️  Contact sheet {output} ({sheet.shape[1]}×{sheet.shape[0]}) and index {index_path}")
+    return report.ok
+
+
+def list_parameters(module):
+    for parameter in design_parameters(module):
+        default = ','.join(f'{value:g}' for value in parameter.default) \
+            if isinstance(parameter.default, tuple) else parameter.default
+        kind = "structural" if parameter.structural else "overlay"
+        print(f"🎛️  {parameter.name:<16} default {default!s:<14} {parameter.help} ({kind})")
+
+
+def add_sweep_arguments(parser):
+    from .cache import DEFAULT_CACHE_DIR
+    from .rasterizers import DEFAULT_BACKEND_ORDER
+
+    parser.add_argument('--vary', nargs='+', action='append', default=[], metavar=('NAME', 'VALUE'),
+                        help="sweep a parameter over values; numbers also take START..STOP:COUNT "
+                             "(e.g. --vary petals 5..10 --vary pulse_amplitude 0.5..1.5:5)")
+    parser.add_argument('--list', action='store_true', help="list the design's parameters and defaults")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help=f"pixel sizes per candidate, largest on top "
+                             f"(default: {' '.join(map(str, DEFAULT_SIZES))})")
+    parser.add_argument('--columns', type=int, help="contact sheet columns (default: square-ish)")
+    parser.add_argument('--output', '-o', help="contact sheet PNG; the index goes next to it as .json "
+                                               "(default: sweep-DESIGN.png)")
+    parser.add_argument('--jobs', '-j', type=int, help="parallel render processes (default: CPU count)")
+    parser.add_argument('--backend', choices=sorted(DEFAULT_BACKEND_ORDER),
+                        help="rasterizer backend (default: fastest available)")
+    parser.add_argument('--cache-dir', default=DEFAULT_CACHE_DIR,
+                        help=f"render cache location (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument('--no-cache', action='store_true', help="always re-render every candidate")
+    parser.add_argument('--force', action='store_true', help=f"allow more than {MAX_CANDIDATES} candidates")
+
+
+def sweep_from_args(module, design_name, args):
+    """Run the sweep (or --list) described by add_sweep_arguments() flags"""
+    from .cache import RenderCache
+
+    if args.list:
+        list_parameters(module)
+        return True
+    ranges = {}
+    for name, *values in args.vary:
+        if not values:
+            print(f"❌ --vary {name} needs at least one value")
+            return False
+        ranges.setdefault(name, []).extend(values)
+    cache = None if args.no_cache else RenderCache(args.cache_dir)
+    return sweep(module, design_name, ranges, args.sizes, args.output, args.columns,
+                 args.backend, args.jobs, cache, args.force)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tile-parallel rendering of large icons into a shared-memory canvas
+The output is split into tiles; each pool worker renders its tiles with any
+rasterizer backend by cropping the SVG viewBox to the tile, then writes the
+pixels straight into a multiprocessing.shared_memory RGBA buffer, so no pixel
+data is pickled. The assembled canvas is encoded once by the caller.
+"""
+
+import math
+import os
+import re
+import time
+
+from .rasterizers import RasterizerError
+
+DEFAULT_TILE_SIZE = 512
+
+# Extra pixels rendered around each tile and then discarded, so effects that
+# reach across tile edges (blur filters in cairosvg/rsvg) do not leave seams
+DEFAULT_OVERLAP = 8
+
+_NUMBER_RE = re.compile(r'[-+]?(?:\d*\.\d+|\d+\.?)(?:[eE][-+]?\d+)?')
+
+# Per-worker state set by _init_worker
+_worker = {}
+
+
+def viewport(svg_data, width, height):
+    """(document, scale x, scale y, offset x, offset y) mapping user space to output pixels
+
+    Mirrors the renderers' default xMidYMid meet placement of the viewBox.
+    """
+    from .svg_document import SvgDocument
+
+    document = SvgDocument(svg_data)
+    root = document.root
+    view_box = [float(v) for v in _NUMBER_RE.findall(root.get('viewBox', ''))]
+    if len(view_box) != 4:
+        vw = float(_NUMBER_RE.match(root.get('width', str(width))).group())
+        vh = float(_NUMBER_RE.match(root.get('height', str(height))).group())
+        view_box = [0.0, 0.0, vw, vh]
+    vx, vy, vw, vh = view_box
+    sx, sy = width / vw, height / vh
+    if root.get('preserveAspectRatio', '').strip() != 'none':
+        sx = sy = min(sx, sy)
+    return document, sx, sy, (width - vw * sx) / 2 - vx * sx, (height - vh * sy) / 2 - vy * sy
+
+
+def crop_svg(document, sx, sy, ox, oy, left, top, right, bottom):
+    """SVG text whose viewport shows exactly output pixels [left, right) × [top, bottom)"""
+    variant = document.variant('tile')
+    x0, y0 = (left - ox) / sx, (top - oy) / sy
+    width, height = right - left, bottom - top
+    variant.set(document.root, 'viewBox', f"{x0!r} {y0!r} {width / sx!r} {height / sy!r}")
+    variant.set(document.root, 'width', str(width))
+    variant.set(document.root, 'height', str(height))
+    variant.set(document.root, 'preserveAspectRatio', 'none')
+    return variant.serialize()
+
+
+def tiles(width, height, tile_size=DEFAULT_TILE_SIZE):
+    """(left, top, right, bottom) of every tile, row by row"""
+    return [(left, top, min(left + tile_size, width), min(top + tile_size, height))
+            for top in range(0, height, tile_size)
+            for left in range(0, width, tile_size)]
+
+
+def _init_worker(svg_data, width, height, backend_name, shm_name, overlap):
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    from .rasterizers import get_rasterizer
+
+    document, sx, sy, ox, oy = viewport(svg_data, width, height)
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker.update(
+        document=document, mapping=(sx, sy, ox, oy), size=(width, height), overlap=overlap,
+        backend=get_rasterizer(backend_name), shm=shm,
+        canvas=np.ndarray((height, width, 4), dtype=np.uint8, buffer=shm.buf),
+    )
+
+
+def _render_tile(tile):
+    """Render one tile (plus its overlap) and copy its interior into the shared canvas"""
+    left, top, right, bottom = tile
+    width, height = _worker['size']
+    overlap = _worker['overlap']
+    # The padded box may extend past the canvas; the renderer simply draws what is there
+    padded = (left - overlap, top - overlap, right + overlap, bottom + overlap)
+    svg = crop_svg(_worker['document'], *_worker['mapping'], *padded)
+    rgba = _worker['backend'].render_rgba(svg, padded[2] - padded[0], padded[3] - padded[1])
+    _worker['canvas'][top:bottom, left:right] = rgba[overlap:overlap + bottom - top,
+                                                     overlap:overlap + right - left]
+    return tile
+
+
+def render_tiled(svg_data, width, height, backend_name=None, tile_size=DEFAULT_TILE_SIZE,
+                 max_workers=None, overlap=DEFAULT_OVERLAP):
+    """Render SVG text to an (height, width, 4) RGBA array, one pool task per tile
+
+    Percent lengths in userSpaceOnUse gradients and stroke widths refer to the
+    viewport and would change per tile; the icon designs do not use them.
+    """
+    from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+    from multiprocessing import shared_memory
+
+    import numpy as np
+
+    from .scheduler import default_jobs
+
+    if isinstance(svg_data, bytes):
+        svg_data = svg_data.decode('utf-8')
+    try:
+        viewport(svg_data, width, height)
+    except ValueError as e:
+        raise RasterizerError(f"Cannot parse SVG: {e}")
+    boxes = tiles(width, height, tile_size)
+    workers = max(1, min(max_workers or default_jobs(), len(boxes)))
+    shm = shared_memory.SharedMemory(create=True, size=width * height * 4)
+    canvas = None
+    try:
+        canvas = np.ndarray((height, width, 4), dtype=np.uint8, buffer=shm.buf)
+        canvas[:] = 0
+        initargs = (svg_data, width, height, backend_name, shm.name, overlap)
+        if workers == 1:
+            _init_worker(*initargs)
+            try:
+                for box in boxes:
+                    _render_tile(box)
+            finally:
+                _release_worker()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+                # Tiles only report their box back; the pixels are already in shared memory
+                for _ in pool.map(_render_tile, boxes):
+                    pass
+        return canvas.copy()
+    except BrokenExecutor as e:
+        raise RasterizerError(f"Tile worker crashed: {e}")
+    finally:
+        # The view must go before the mapping can be closed
+        canvas = None
+        shm.close()
+        shm.unlink()
+
+
+def _release_worker():
+    shm = _worker.get('shm')
+    _worker.clear()
+    if shm is not None:
+        shm.close()
+
+
+def tile_count(width, height, tile_size=DEFAULT_TILE_SIZE):
+    return math.ceil(width / tile_size) * math.ceil(height / tile_size)
+
+
+def wants_tiles(width, height, tile_size):
+    """True when a render is big enough to split (more than one tile)"""
+    return bool(tile_size) and tile_count(width, height, tile_size) > 1
+
+
+def render_tiled_job(job, backend_name, tile_size, max_workers, encoder_settings=None):
+    """Render a scheduler RenderJob tile by tile, encode it once and swap it into place"""
+    from .build import replace_if_changed
+    from .png import encode_png
+    from .scheduler import JobResult, temporary_path
+
+    started = time.perf_counter()
+    tmp_path = temporary_path(job.png_path)
+    try:
+        rgba = render_tiled(job.svg_data, job.width, job.height, backend_name, tile_size, max_workers)
+        if encoder_settings is None:
+            data = encode_png(rgba, level=6)
+        else:
+            from .encoder import ByteBudgetError, optimize_png
+
+            try:
+                data = optimize_png(rgba, encoder_settings).data
+            except ByteBudgetError as e:
+                raise RasterizerError(str(e)) from e
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        replace_if_changed(tmp_path, job.png_path)
+    except (RasterizerError, OSError) as e:
+        return JobResult(job, False, str(e), time.perf_counter() - started)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return JobResult(job, True, None, time.perf_counter() - started)
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Design-system color tokens for the BreathEasy icon generators
+Scans the SwiftUI design-system sources for `static let name = Color(hex: "…")`
+definitions and builds a name → color index, so the SVG templates and palette
+tables can say $softSkyBlue instead of a hand-copied hex value. The index is
+cached per file keyed on mtime and content hash: unchanged files are never
+re-parsed and a touched-but-identical file is only hashed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import string
+import sys
+
+from .cache import DEFAULT_CACHE_DIR
+from .palette import PaletteMap
+
+# Swift sources (files or directories) holding the design-system colors
+DESIGN_SOURCES = (os.path.join('BreathEasy', 'Views', 'Design'),)
+
+DEFAULT_TOKEN_CACHE = os.path.join(DEFAULT_CACHE_DIR, 'tokens.json')
+
+# Bump when the parser changes, so cached entries are re-parsed
+PARSER_REVISION = 1
+
+_COLOR_RE = re.compile(
+    r'\b(?:static\s+)?(?:let|var)\s+(?P<name>[A-Za-z_]\w*)\s*(?::\s*Color\s*)?=\s*'
+    r'Color\(\s*hex:\s*"(?P<hex>#?[0-9A-Fa-f]{3}(?:[0-9A-Fa-f]{3})?)"\s*\)'
+)
+
+_index = None
+
+
+class TokenError(Exception):
+    """Raised for unknown, conflicting or unreadable design tokens"""
+
+
+def parse_swift(text):
+    """Return [(name, '#RRGGBB', line)] for every Color(hex:) definition in Swift source
+
+    Colors keep the spelling of the Swift source (minus a missing '#'), so
+    templates that switch to tokens serialize byte for byte as before.
+    """
+    tokens = []
+    for match in _COLOR_RE.finditer(text):
+        color = match.group('hex')
+        if not color.startswith('#'):
+            color = '#' + color
+        tokens.append((match.group('name'), color, text.count('\n', 0, match.start()) + 1))
+    return tokens
+
+
+def swift_files(sources=DESIGN_SOURCES):
+    """Every .swift file under the given files and directories, sorted
+
+    A missing source is an error rather than an empty index, so a wrong path
+    is reported as such instead of as unknown tokens.
+    """
+    files = []
+    for source in sources:
+        if os.path.isfile(source):
+            files.append(source)
+            continue
+        if not os.path.isdir(source):
+            raise TokenError(f"Design token source not found: {source} "
+                             f"(run from the checkout root or pass breatheasy-assets --repo)")
+        for directory, _, names in os.walk(source):
+            files.extend(os.path.join(directory, name) for name in names if name.endswith('.swift'))
+    return sorted(files)
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    if cached.get('revision') != PARSER_REVISION:
+        return {}
+    return cached.get('files', {})
+
+
+def scan(sources=DESIGN_SOURCES, cache_path=DEFAULT_TOKEN_CACHE):
+    """Return ({path: [(name, color, line)]}, number of files parsed) using the cache
+
+    A file is reused as-is when its mtime and size match the cache, re-hashed
+    when they do not, and parsed only when the hash changed too.
+    """
+    cached = _load_cache(cache_path)
+    files = {}
+    parsed = 0
+    dirty = False
+    for path in swift_files(sources):
+        stat = os.stat(path)
+        entry = cached.get(path)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            files[path] = entry
+            continue
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is None or entry['sha256'] != digest:
+            entry = {'sha256': digest, 'tokens': parse_swift(data.decode('utf-8'))}
+            parsed += 1
+        files[path] = dict(entry, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        dirty = True
+    if dirty or set(files) != set(cached):
+        _save(cache_path, files)
+    return {path: [tuple(token) for token in entry['tokens']] for path, entry in files.items()}, parsed
+
+
+def _save(cache_path, files):
+    from .build import write_text
+
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    write_text(cache_path, json.dumps({'revision': PARSER_REVISION, 'files': files}, indent=2, sort_keys=True))
+
+
+def build_index(files):
+    """{name: color} from scan() results; a name defined with two colors is an error"""
+    index = {}
+    where = {}
+    for path, tokens in files.items():
+        for name, color, line in tokens:
+            if name in index and index[name].lower() != color.lower():
+                raise TokenError(f"Token {name} is {index[name]} at {where[name]} but {color} at {path}:{line}")
+            index.setdefault(name, color)
+            where.setdefault(name, f"{path}:{line}")
+    return index
+
+
+def token_index(sources=DESIGN_SOURCES, cache_path=DEFAULT_TOKEN_CACHE):
+    """The design-system name → color index, memoized per process"""
+    global _index
+    key = (tuple(sources), cache_path)
+    if _index is None or _index[0] != key:
+        try:
+            files, _ = scan(sources, cache_path)
+        except OSError as e:
+            raise TokenError(f"Cannot read design tokens: {e}")
+        _index = (key, build_index(files))
+    return _index[1]
+
+
+def forget_index():
+    """Drop the memoized index, so the next token_index() re-scans (after a Swift edit)"""
+    global _index
+    _index = None
+
+
+def resolve(text, tokens=None):
+    """Replace $name / ${name} token references in text with their colors"""
+    tokens = token_index() if tokens is None else tokens
+    try:
+        return string.Template(text).substitute(tokens)
+    except KeyError as e:
+        raise TokenError(f"Unknown design token: {e.args[0]}")
+    except ValueError as e:
+        raise TokenError(f"Bad token reference: {e}")
+
+
+class TokenPalette(PaletteMap):
+    """A PaletteMap whose source and target colors may be token references
+
+    The references are resolved on first use, so module-level palettes do not
+    scan the Swift sources (or write the token cache) when they are imported.
+    """
+
+    def __init__(self, table, tokens=None):
+        self.references = dict(table)
+        self.tokens = tokens
+
+    def __getattr__(self, name):
+        # Only reached while table, _any and _scoped are still unset
+        if name.startswith('__') or 'table' in self.__dict__:
+            raise AttributeError(name)
+        tokens = token_index() if self.tokens is None else self.tokens
+        PaletteMap.__init__(self, {resolve(source, tokens): resolve(target, tokens)
+                                   for source, target in self.references.items()})
+        return getattr(self, name)
+
+
+def palette(table, tokens=None):
+    """A PaletteMap whose source and target colors may be token references"""
+    return TokenPalette(table, tokens)
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="List the design-system color tokens")
+    parser.add_argument('sources', nargs='*', default=list(DESIGN_SOURCES),
+                        help=f"Swift files or directories to scan (default: {' '.join(DESIGN_SOURCES)})")
+    parser.add_argument('--cache', default=DEFAULT_TOKEN_CACHE,
+                        help=f"token index cache (default: {DEFAULT_TOKEN_CACHE})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        files, parsed = scan(args.sources, args.cache)
+        index = build_index(files)
+    except (OSError, TokenError) as e:
+        print(f"❌ {e}")
+        return False
+    for path, tokens in files.items():
+        for name, color, line in tokens:
+            print(f"🎨 {name:<16} {color}  {path}:{line}")
+    print(f"✅ {len(index)} tokens from {len(files)} file(s), {parsed} parsed, "
+          f"{len(files) - parsed} from cache")
+    return bool(index)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
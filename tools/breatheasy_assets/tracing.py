@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Per-stage tracing for the BreathEasy icon generators
+Stages record wall and CPU time, peak RSS, bytes read/written and counters
+such as render cache hits; a run can write a JSON report and a Chrome trace
+(chrome://tracing, Perfetto) and optionally profile with cProfile/tracemalloc
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+
+def _io_bytes():
+    """(read, written) bytes of this process so far; (None, None) where /proc is missing"""
+    try:
+        with open('/proc/self/io') as f:
+            fields = dict(line.split(':', 1) for line in f)
+    except OSError:
+        return None, None
+    return int(fields['rchar']), int(fields['wchar'])
+
+
+def _peak_rss():
+    """Peak resident set size in bytes of this process or any reaped child"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return scale * max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                       resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+def _cpu_seconds():
+    """User + system CPU time of this process and its reaped children"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class Span:
+    """One traced stage; counters collect cache hits, renders and the like"""
+
+    __slots__ = ('name', 'category', 'args', 'depth', 'start', 'wall', 'cpu',
+                 'peak_rss', 'rss_growth', 'read_bytes', 'write_bytes', 'py_peak', 'counters')
+
+    def __init__(self, name, category, args, depth):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.depth = depth
+        self.start = self.wall = self.cpu = 0.0
+        self.peak_rss = self.rss_growth = self.read_bytes = self.write_bytes = self.py_peak = None
+        self.counters = {}
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def as_dict(self):
+        return {
+            'name': self.name,
+            'category': self.category,
+            'depth': self.depth,
+            'start': self.start,
+            'wall': self.wall,
+            'cpu': self.cpu,
+            'peak_rss': self.peak_rss,
+            'rss_growth': self.rss_growth,
+            'read_bytes': self.read_bytes,
+            'write_bytes': self.write_bytes,
+            'python_peak': self.py_peak,
+            'counters': self.counters,
+            'args': self.args,
+        }
+
+
+class Tracer:
+    """Collects spans for one run; does nothing until enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.spans = []
+        self._stack = []
+        self.origin = time.perf_counter()
+
+    def enable(self, trace_memory=False):
+        self.enabled = True
+        self.spans = []
+        self._stack = []
+        self.origin = time.perf_counter()
+        self.trace_memory = trace_memory
+        if trace_memory:
+            import tracemalloc
+
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def stage(self, name, category='stage', **args):
+        """Trace the enclosed block as one span (a no-op while disabled)"""
+        if not self.enabled:
+            yield None
+            return
+        parent = self._stack[-1] if self._stack else None
+        span = Span(name, category, args, len(self._stack))
+        self.spans.append(span)
+        self._stack.append(span)
+        if self.trace_memory:
+            import tracemalloc
+
+            # The peak is process-wide: bank the parent's peak so far, then
+            # restart it so this stage measures only its own high-water mark
+            if parent is not None:
+                parent.py_peak = max(parent.py_peak or 0, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        read_before, written_before = _io_bytes()
+        rss_before = _peak_rss()
+        cpu_before = _cpu_seconds()
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.wall = time.perf_counter() - started
+            span.start = started - self.origin
+            span.cpu = _cpu_seconds() - cpu_before
+            span.peak_rss = _peak_rss()
+            if rss_before is not None:
+                span.rss_growth = span.peak_rss - rss_before
+            read_after, written_after = _io_bytes()
+            if read_before is not None:
+                span.read_bytes = read_after - read_before
+                span.write_bytes = written_after - written_before
+            if self.trace_memory:
+                import tracemalloc
+
+                span.py_peak = max(span.py_peak or 0, tracemalloc.get_traced_memory()[1])
+            self._stack.pop()
+            # Counters roll up one level at a time as each span closes
+            if parent is not None:
+                for counter, n in span.counters.items():
+                    parent.count(counter, n)
+
+    def count(self, name, n=1):
+        """Add n to a counter of the innermost open span"""
+        if self.enabled and self._stack:
+            self._stack[-1].count(name, n)
+
+    def report(self):
+        return {
+            'argv': sys.argv,
+            'pid': os.getpid(),
+            'stages': [span.as_dict() for span in self.spans],
+        }
+
+    def chrome_trace(self):
+        """Spans as Chrome trace-event JSON ("X" complete events, microseconds)"""
+        pid = os.getpid()
+        events = []
+        for span in self.spans:
+            args = dict(span.args, cpu_ms=round(span.cpu * 1000, 3), **span.counters)
+            for key, value in (('peak_rss', span.peak_rss), ('read_bytes', span.read_bytes),
+                               ('write_bytes', span.write_bytes), ('python_peak', span.py_peak)):
+                if value is not None:
+                    args[key] = value
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round(span.start * 1e6, 1),
+                'dur': round(span.wall * 1e6, 1),
+                'pid': pid,
+                'tid': 0,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def print_summary(self):
+        """One line per span, indented by nesting"""
+        for span in self.spans:
+            details = [f"{span.wall * 1000:.1f} ms wall", f"{span.cpu * 1000:.1f} ms cpu"]
+            if span.peak_rss is not None:
+                details.append(f"peak {span.peak_rss / 2 ** 20:.0f} MB")
+            if span.read_bytes is not None:
+                details.append(f"{_format_bytes(span.read_bytes)} read, "
+                               f"{_format_bytes(span.write_bytes)} written")
+            if span.py_peak is not None:
+                details.append(f"python peak {_format_bytes(span.py_peak)}")
+            details.extend(f"{counter} {n}" for counter, n in sorted(span.counters.items()))
+            print(f"{'   ' * span.depth}⏱️  {span.name}: {', '.join(details)}")
+
+
+def _format_bytes(n):
+    for unit in ('B', 'KB', 'MB'):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+
+# Process-wide tracer used by the build graph, the scheduler and the generators
+TRACER = Tracer()
+stage = TRACER.stage
+count = TRACER.count
+
+
+def add_trace_arguments(parser):
+    """Register the tracing and profiling flags on a generator's argument parser"""
+    group = parser.add_argument_group('tracing')
+    group.add_argument('--timings', action='store_true',
+                       help="print wall/CPU time, memory and I/O for every stage")
+    group.add_argument('--trace-json', metavar='PATH',
+                       help="write the per-stage timing report as JSON")
+    group.add_argument('--chrome-trace', metavar='PATH',
+                       help="write a Chrome trace (open in chrome://tracing or Perfetto)")
+    group.add_argument('--profile', metavar='PATH',
+                       help="run under cProfile and write pstats data to PATH")
+    group.add_argument('--tracemalloc', action='store_true',
+                       help="record the peak Python heap of every stage (slow)")
+
+
+def _write_json(path, data):
+    import json
+
+    from .build import write_text
+
+    write_text(path, json.dumps(data, indent=2))
+
+
+@contextlib.contextmanager
+def tracing(args, name):
+    """Enable tracing for a generator run when any tracing flag is set"""
+    if not (args.timings or args.trace_json or args.chrome_trace or args.profile or args.tracemalloc):
+        yield
+        return
+
+    TRACER.enable(trace_memory=args.tracemalloc)
+    profiler = None
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+    try:
+        with TRACER.stage(name, category='run'):
+            if profiler:
+                profiler.enable()
+            try:
+                yield
+            finally:
+                if profiler:
+                    profiler.disable()
+    finally:
+        print()
+        if args.timings or args.tracemalloc:
+            TRACER.print_summary()
+        if args.trace_json:
+            _write_json(args.trace_json, dict(TRACER.report(), run=name))
+            print(f"📈 Timing report written to {args.trace_json}")
+        if args.chrome_trace:
+            _write_json(args.chrome_trace, TRACER.chrome_trace())
+            print(f"📈 Chrome trace written to {args.chrome_trace}")
+        if profiler:
+            import pstats
+
+            profiler.dump_stats(args.profile)
+            print(f"📈 Profile written to {args.profile}; top functions by cumulative time:")
+            pstats.Stats(profiler, stream=sys.stdout).sort_stats('cumulative').print_stats(10)
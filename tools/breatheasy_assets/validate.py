@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Asset catalog validator for BreathEasy/Assets.xcassets
+Checks that every image a Contents.json references exists, is a PNG of the
+declared pixel size and follows the App Store icon rules (no alpha on the
+1024 marketing icon). PNGs are read through mmap up to the chunk headers
+only; no pixel data is decompressed, so a full catalog validates in
+milliseconds and the check is cheap enough for a pre-commit hook.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+ASSET_CATALOG = "BreathEasy/Assets.xcassets"
+
+# Same as png's, which is not imported: it loads NumPy, far slower than the whole check
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color types that carry an alpha channel
+_ALPHA_COLOR_TYPES = (4, 6)
+
+# Idioms whose 1024px icon is the App Store marketing image
+_MARKETING_IDIOMS = ('ios-marketing', 'watch-marketing', 'universal')
+
+PRE_COMMIT_HOOK = '''#!/bin/sh
+# Installed by breatheasy-assets validate: validate the asset catalog when it changes
+if git diff --cached --name-only | grep -qF {prefix}; then
+    exec ./breatheasy-assets validate --quiet {catalog}
+fi
+'''
+
+
+class PNGHeader:
+    """What the chunk headers of a PNG say, without decoding any pixels"""
+
+    def __init__(self, width, height, bit_depth, color_type, interlace, chunks):
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+        self.color_type = color_type
+        self.interlace = interlace
+        self.chunks = chunks
+
+    @property
+    def has_alpha(self):
+        """True for an alpha channel or a tRNS transparency chunk"""
+        return self.color_type in _ALPHA_COLOR_TYPES or b'tRNS' in self.chunks
+
+
+def read_png_header(path):
+    """Return the PNGHeader of a file; raise ValueError if it is not a complete PNG
+
+    Walks the chunk list through mmap, touching only the 8-byte chunk headers
+    and the IHDR payload.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < len(PNG_SIGNATURE) + 25:
+            raise ValueError("too short to be a PNG")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:8] != PNG_SIGNATURE:
+                raise ValueError("not a PNG file")
+            length, chunk_type = struct.unpack_from('>I4s', data, 8)
+            if chunk_type != b'IHDR' or length != 13:
+                raise ValueError("first chunk is not IHDR")
+            width, height, bit_depth, color_type, _, _, interlace = struct.unpack_from('>IIBBBBB', data, 16)
+
+            chunks = set()
+            offset = 8
+            while True:
+                if offset + 8 > size:
+                    raise ValueError("truncated (no IEND chunk)")
+                length, chunk_type = struct.unpack_from('>I4s', data, offset)
+                offset += 12 + length
+                if offset > size:
+                    raise ValueError(f"truncated inside {chunk_type.decode('latin-1')} chunk")
+                chunks.add(chunk_type)
+                if chunk_type == b'IEND':
+                    break
+    return PNGHeader(width, height, bit_depth, color_type, interlace, chunks)
+
+
+def expected_pixels(image):
+    """Pixel size a Contents.json image entry declares, or None if it has no size"""
+    size = image.get('size')
+    if not size:
+        return None
+    points = float(size.split('x')[0])
+    scale = float(image.get('scale', '1x').rstrip('x'))
+    return int(round(points * scale))
+
+
+def is_marketing_icon(image):
+    """The standard-appearance 1024pt icon the App Store shows, which must be opaque"""
+    return (image.get('idiom') in _MARKETING_IDIOMS and image.get('size') == '1024x1024'
+            and not image.get('appearances'))
+
+
+def validate_set(directory):
+    """Return (errors, warnings, images checked) for one .appiconset/.imageset folder"""
+    errors, warnings = [], []
+    contents_path = os.path.join(directory, 'Contents.json')
+    try:
+        with open(contents_path) as f:
+            contents = json.load(f)
+    except FileNotFoundError:
+        return [f"{directory}: missing Contents.json"], warnings, 0
+    except ValueError as e:
+        return [f"{contents_path}: invalid JSON ({e})"], warnings, 0
+
+    checked = 0
+    referenced = set()
+    icon_set = directory.endswith('.appiconset')
+    for image in contents.get('images', []):
+        filename = image.get('filename')
+        if not filename:
+            continue
+        referenced.add(filename)
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            errors.append(f"{path}: referenced by Contents.json but missing")
+            continue
+        if not filename.lower().endswith('.png'):
+            if icon_set:
+                errors.append(f"{path}: app icons must be PNG files")
+            continue
+
+        checked += 1
+        try:
+            header = read_png_header(path)
+        except (OSError, ValueError) as e:
+            errors.append(f"{path}: {e}")
+            continue
+        expected = expected_pixels(image)
+        if icon_set and expected and (header.width, header.height) != (expected, expected):
+            errors.append(f"{path}: {header.width}×{header.height} px, Contents.json declares "
+                          f"{image['size']} @{image.get('scale', '1x')} = {expected}×{expected} px")
+        if icon_set and is_marketing_icon(image) and header.has_alpha:
+            errors.append(f"{path}: the App Store icon must not have an alpha channel "
+                          f"(PNG color type {header.color_type}"
+                          f"{', tRNS chunk' if b'tRNS' in header.chunks else ''})")
+        if header.interlace:
+            warnings.append(f"{path}: interlaced PNG (larger and slower to decode)")
+
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith('.png') and name not in referenced:
+            warnings.append(f"{os.path.join(directory, name)}: not referenced by Contents.json")
+    return errors, warnings, checked
+
+
+def validate_catalog(catalog=ASSET_CATALOG):
+    """Validate every image set in an asset catalog; return (errors, warnings, images checked)"""
+    if not os.path.isdir(catalog):
+        return [f"{catalog}: asset catalog not found"], [], 0
+    errors, warnings = [], []
+    checked = 0
+    for directory, subdirectories, _ in os.walk(catalog):
+        subdirectories.sort()
+        if directory.endswith(('.appiconset', '.imageset')):
+            set_errors, set_warnings, set_checked = validate_set(directory)
+            errors += set_errors
+            warnings += set_warnings
+            checked += set_checked
+        elif directory.endswith('.colorset') or directory == catalog:
+            path = os.path.join(directory, 'Contents.json')
+            try:
+                with open(path) as f:
+                    json.load(f)
+            except FileNotFoundError:
+                pass
+            except ValueError as e:
+                errors.append(f"{path}: invalid JSON ({e})")
+    return errors, warnings, checked
+
+
+def git_hooks_dir():
+    """The repository's hooks directory, wherever git keeps it (worktrees, core.hooksPath)"""
+    import subprocess
+
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--git-path', 'hooks'],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def install_hook(catalog=ASSET_CATALOG, hooks_dir=None):
+    """Write a pre-commit hook that validates the catalog when files in it are staged"""
+    import shlex
+
+    hooks_dir = hooks_dir or git_hooks_dir()
+    if not hooks_dir:
+        print("❌ Not inside a git repository; cannot install a pre-commit hook")
+        return False
+    command = f"./breatheasy-assets validate --quiet {shlex.quote(catalog)}"
+    hook_path = os.path.join(hooks_dir, 'pre-commit')
+    if os.path.exists(hook_path):
+        with open(hook_path) as f:
+            if 'breatheasy-assets validate' not in f.read():
+                print(f"❌ {hook_path} already exists; add `{command}` to it")
+                return False
+    os.makedirs(hooks_dir, exist_ok=True)
+    with open(hook_path, 'w') as f:
+        f.write(PRE_COMMIT_HOOK.format(prefix=shlex.quote(catalog.rstrip('/') + '/'),
+                                       catalog=shlex.quote(catalog)))
+    os.chmod(hook_path, 0o755)
+    print(f"✅ Installed pre-commit hook: {hook_path}")
+    return True
+
+
+def parse_args(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Validate the asset catalog's images against its Contents.json files")
+    add_validate_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def add_validate_arguments(parser):
+    parser.add_argument('catalog', nargs='?', default=ASSET_CATALOG,
+                        help=f"asset catalog to validate (default: {ASSET_CATALOG})")
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help="print only problems (for use in a pre-commit hook)")
+    parser.add_argument('--strict', action='store_true', help="treat warnings as errors")
+    parser.add_argument('--install-hook', action='store_true',
+                        help="install a git pre-commit hook that runs this check")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.install_hook:
+        return install_hook(args.catalog)
+
+    started = time.perf_counter()
+    errors, warnings, checked = validate_catalog(args.catalog)
+    elapsed = (time.perf_counter() - started) * 1000
+    for error in errors:
+        print(f"❌ {error}")
+    for warning in warnings:
+        print(f"⚠️  {warning}")
+    failed = bool(errors) or (args.strict and bool(warnings))
+    if not args.quiet or failed:
+        status = "❌" if failed else "✅"
+        print(f"{status} {args.catalog}: {checked} images checked in {elapsed:.1f} ms, "
+              f"{len(errors)} error(s), {len(warnings)} warning(s)")
+    return not failed
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
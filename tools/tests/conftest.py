@@ -0,0 +1,22 @@
+"""Shared fixtures: a scratch checkout root holding a copy of the design-system sources"""
+
+import os
+import shutil
+
+import pytest
+
+from breatheasy_assets import tokens
+
+# The checkout these tests live in
+CHECKOUT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def checkout(tmp_path, monkeypatch):
+    """A scratch checkout root, made the current directory, so caches and outputs stay in tmp_path"""
+    for source in tokens.DESIGN_SOURCES:
+        shutil.copytree(os.path.join(CHECKOUT, source), tmp_path / source)
+    monkeypatch.chdir(tmp_path)
+    tokens.forget_index()
+    yield tmp_path
+    tokens.forget_index()
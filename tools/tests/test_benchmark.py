@@ -0,0 +1,20 @@
+"""Benchmark regression checks: best-time comparison and environment matching"""
+
+from breatheasy_assets.benchmark import compare, environment_differences
+
+
+def _stats(best, median):
+    return {'min': best, 'median': median, 'description': 'case'}
+
+
+def test_regressions_are_judged_on_the_best_time():
+    baseline = {'noisy': _stats(0.010, 0.010), 'slower': _stats(0.010, 0.010)}
+    results = {'noisy': _stats(0.0105, 0.020), 'slower': _stats(0.020, 0.020)}
+    assert compare(results, baseline, verbose=False) == ['slower']
+
+
+def test_only_compared_environment_fields_must_match():
+    recorded = {'python': '3.11.9', 'machine': 'x86_64', 'cpu_count': 1, 'backends': {'numpy': '1.26'},
+                'platform': 'Linux-6.1'}
+    assert environment_differences(recorded, dict(recorded, platform='Linux-6.8')) == []
+    assert environment_differences(recorded, dict(recorded, cpu_count=8)) == ['cpu_count']
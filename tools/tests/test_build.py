@@ -0,0 +1,75 @@
+"""Build graph staleness: new, changed inputs, missing outputs and rebuilt dependencies"""
+
+from breatheasy_assets.build import BuildGraph
+
+
+def _graph(tmp_path, inputs, built):
+    graph = BuildGraph('test', manifest_path=str(tmp_path / 'manifest.json'))
+    source = tmp_path / 'source.txt'
+    target = tmp_path / 'target.txt'
+
+    def make_source():
+        built.append('source')
+        source.write_text(inputs['source'])
+
+    def make_target():
+        built.append('target')
+        target.write_text(source.read_text().upper())
+
+    graph.add('source', [str(source)], {'text': inputs['source']}, action=make_source)
+    graph.add('target', [str(target)], {}, action=make_target, deps=['source'])
+    return graph
+
+
+def _reasons(graph):
+    return {node.name: node.reason for node in graph.plan()}
+
+
+def test_new_nodes_build_once(tmp_path):
+    built = []
+    assert _reasons(_graph(tmp_path, {'source': 'a'}, built)) == {'source': 'new', 'target': 'new'}
+    assert _graph(tmp_path, {'source': 'a'}, built).run()
+    assert built == ['source', 'target']
+    assert _reasons(_graph(tmp_path, {'source': 'a'}, built)) == {}
+    assert _graph(tmp_path, {'source': 'a'}, built).run()
+    assert built == ['source', 'target']
+
+
+def test_changed_inputs_rebuild_the_node_and_its_dependents(tmp_path):
+    built = []
+    _graph(tmp_path, {'source': 'a'}, built).run()
+    assert _reasons(_graph(tmp_path, {'source': 'b'}, built)) == {
+        'source': 'inputs changed', 'target': 'inputs changed'}
+    _graph(tmp_path, {'source': 'b'}, built).run()
+    assert (tmp_path / 'target.txt').read_text() == 'B'
+
+
+def test_missing_output_rebuilds_only_that_node(tmp_path):
+    built = []
+    _graph(tmp_path, {'source': 'a'}, built).run()
+    (tmp_path / 'target.txt').unlink()
+    assert _reasons(_graph(tmp_path, {'source': 'a'}, built)) == {'target': 'missing output'}
+
+
+def test_dependency_rebuilt_for_a_missing_output_marks_dependents_stale(tmp_path):
+    built = []
+    _graph(tmp_path, {'source': 'a'}, built).run()
+    (tmp_path / 'source.txt').unlink()
+    assert _reasons(_graph(tmp_path, {'source': 'a'}, built)) == {
+        'source': 'missing output', 'target': 'dependency rebuilt'}
+
+
+def test_failed_nodes_are_not_recorded(tmp_path):
+    graph = BuildGraph('test', manifest_path=str(tmp_path / 'manifest.json'))
+    graph.add('broken', [str(tmp_path / 'never.txt')], {}, action=lambda: False)
+    graph.add('after', [], {}, action=lambda: None, deps=['broken'])
+    assert not graph.run()
+    graph = BuildGraph('test', manifest_path=str(tmp_path / 'manifest.json'))
+    graph.add('broken', [str(tmp_path / 'never.txt')], {}, action=lambda: False)
+    assert _reasons(graph) == {'broken': 'new'}
+
+
+def test_dry_run_builds_nothing(tmp_path):
+    built = []
+    assert _graph(tmp_path, {'source': 'a'}, built).run(dry_run=True)
+    assert built == [] and not (tmp_path / 'manifest.json').exists()
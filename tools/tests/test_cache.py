@@ -0,0 +1,45 @@
+"""Render cache: fetched outputs are isolated from the entries, eviction is LRU by size"""
+
+import os
+
+from breatheasy_assets.cache import RenderCache, render_key
+
+
+def _store(cache, tmp_path, key, data):
+    src = tmp_path / f'{key}.src'
+    src.write_bytes(data)
+    cache.store(key, str(src))
+    return src
+
+
+def test_fetch_miss_and_hit(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache'))
+    key = render_key('<svg/>', 64, 64, 'numpy', '1')
+    assert not cache.fetch(key, str(tmp_path / 'out.png'))
+    _store(cache, tmp_path, key, b'rendered')
+    assert cache.fetch(key, str(tmp_path / 'out.png'))
+    assert (tmp_path / 'out.png').read_bytes() == b'rendered'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_editing_a_fetched_output_leaves_the_entry_intact(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache'))
+    src = _store(cache, tmp_path, 'ab' * 32, b'rendered')
+    src.write_bytes(b'edited source')
+    output = tmp_path / 'out.png'
+    cache.fetch('ab' * 32, str(output))
+    assert not os.path.samefile(output, cache.path_for('ab' * 32))
+    with open(output, 'r+b') as f:
+        f.write(b'EDITED')
+    assert open(cache.path_for('ab' * 32), 'rb').read() == b'rendered'
+
+
+def test_evict_drops_least_recently_used_entries(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache'), max_bytes=20)
+    for age, key in enumerate(['aa' * 32, 'bb' * 32, 'cc' * 32]):
+        _store(cache, tmp_path, key, b'x' * 10)
+        os.utime(cache.path_for(key), (1000 + age, 1000 + age))
+    assert len(cache.entries()) == 3
+    assert cache.evict() == 1
+    assert not os.path.exists(cache.path_for('aa' * 32))
+    assert os.path.exists(cache.path_for('cc' * 32))
@@ -0,0 +1,52 @@
+"""Command line parsing and the cold-start budget of --help and no-op runs"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from breatheasy_assets.cli import COLD_START_BUDGET_MS, COLD_START_COMMANDS, COMMANDS, cold_start_times, parse_args
+
+# Modules whose import alone would blow the cold-start budget
+HEAVY_MODULES = ['asyncio', 'cairosvg', 'concurrent.futures', 'multiprocessing', 'numpy']
+
+# Runs the CLI like the console script and prints the imported modules on the way out
+_IMPORTED_MODULES = """
+import atexit, json, sys
+atexit.register(lambda: print(json.dumps(sorted(sys.modules)), file=sys.stderr))
+from breatheasy_assets.cli import run
+sys.argv[0] = 'breatheasy-assets'
+run()
+"""
+
+
+def test_every_subcommand_builds_its_parser():
+    for name in COMMANDS:
+        with pytest.raises(SystemExit) as exit_info:
+            parse_args([name, '--help'])
+        assert exit_info.value.code == 0
+
+
+def test_subcommand_flags_are_parsed_after_the_command():
+    args = parse_args(['render', '--design', 'orb', '--sizes', '64', '128', '--dry-run'])
+    assert (args.design, args.sizes, args.dry_run) == ('orb', [64, 128], True)
+
+
+@pytest.mark.parametrize('label, argv', COLD_START_COMMANDS)
+def test_help_and_no_op_runs_import_no_heavy_modules(label, argv, checkout):
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    environment = dict(os.environ, PYTHONPATH=package_parent)
+    result = subprocess.run([sys.executable, '-c', _IMPORTED_MODULES, *argv], cwd=checkout, env=environment,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout
+    imported = json.loads(result.stderr.splitlines()[-1])
+    assert not [name for name in HEAVY_MODULES if name in imported]
+
+
+@pytest.mark.startup
+def test_help_and_no_op_runs_stay_within_the_cold_start_budget(checkout):
+    interpreter, times = cold_start_times(runs=5, cwd=checkout)
+    overheads = {label: round(total - interpreter) for label, total in times}
+    assert all(overhead <= COLD_START_BUDGET_MS for overhead in overheads.values()), overheads
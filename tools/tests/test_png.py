@@ -0,0 +1,54 @@
+"""PNG encoder and decoder round-trips"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from breatheasy_assets.encoder import EncoderSettings, optimize_png  # noqa: E402
+from breatheasy_assets.png import (FILTER_NONE, FILTER_PAETH, FILTER_SUB, decode_png, encode_png,  # noqa: E402
+                                   flatten)
+from breatheasy_assets.validate import PNG_SIGNATURE  # noqa: E402
+
+
+def _random_rgba(seed=0, shape=(17, 23)):
+    return np.random.default_rng(seed).integers(0, 256, shape + (4,), dtype=np.uint8)
+
+
+@pytest.mark.parametrize('filter_type', [FILTER_NONE, FILTER_SUB, FILTER_PAETH])
+def test_encode_decode_round_trip(filter_type):
+    rgba = _random_rgba()
+    data = encode_png(rgba, filter_type=filter_type)
+    assert data.startswith(PNG_SIGNATURE)
+    assert (decode_png(data) == rgba).all()
+
+
+def test_opaque_images_are_written_without_alpha():
+    rgba = _random_rgba(1)
+    rgba[..., 3] = 255
+    data = encode_png(rgba)
+    assert data[25] == 2  # IHDR color type: truecolor
+    assert (decode_png(data) == rgba).all()
+
+
+def test_optimized_truecolor_is_lossless():
+    rgba = _random_rgba(2)
+    result = optimize_png(rgba, EncoderSettings(quantize=False))
+    assert (decode_png(result.data) == rgba).all()
+
+
+def test_few_colors_are_indexed_losslessly():
+    rng = np.random.default_rng(3)
+    palette = rng.integers(0, 256, (4, 4), dtype=np.uint8)
+    rgba = palette[rng.integers(0, 4, (16, 16))]
+    result = optimize_png(rgba)
+    assert result.layout == 'indexed'
+    assert (decode_png(result.data) == rgba).all()
+
+
+def test_flatten_composites_onto_the_background():
+    rgba = np.array([[[255, 255, 255, 255], [255, 0, 0, 0], [200, 100, 50, 128]]], dtype=np.uint8)
+    flat = flatten(rgba, background=(0, 0, 0))
+    assert flat[..., 3].tolist() == [[255, 255, 255]]
+    assert flat[0, :2, :3].tolist() == [[255, 255, 255], [0, 0, 0]]
+    assert flat[0, 2, :3].tolist() == [100, 50, 25]
+    assert encode_png(flat)[25] == 2
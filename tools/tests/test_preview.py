@@ -0,0 +1,14 @@
+"""Preview page nodes: rebuilt when the SVGs they draw or the helpers behind them change"""
+
+from breatheasy_assets import app_icon, heart
+from breatheasy_assets.build import BuildGraph
+from breatheasy_assets.design import SVG_HELPERS
+
+
+def test_preview_nodes_depend_on_their_svgs_and_helpers(checkout):
+    for add_nodes in (heart.add_preview_node, app_icon.add_document_nodes):
+        graph = BuildGraph('test', manifest_path=str(checkout / 'manifest.json'))
+        add_nodes(graph)
+        inputs = graph.nodes['preview'].inputs
+        assert inputs['svgs'] and all(svg.lstrip().startswith('<svg') for svg in inputs['svgs'])
+        assert set(SVG_HELPERS) <= set(inputs['helpers'])
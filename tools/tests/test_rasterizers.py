@@ -0,0 +1,25 @@
+"""Rasterizer backends: selection by name and in-process rendering of many outputs"""
+
+import pytest
+
+from breatheasy_assets.rasterizers import NumpyRasterizer, RasterizerError, get_rasterizer
+
+SVG = '''<svg viewBox="0 0 10 10" xmlns="http://www.w3.org/2000/svg">
+<rect width="10" height="10" fill="#1E3A5F" /></svg>'''
+
+
+def test_unknown_backend_is_an_error(checkout):
+    with pytest.raises(RasterizerError, match='Unknown'):
+        get_rasterizer('inkscape')
+
+
+def test_one_document_renders_every_target(tmp_path):
+    pytest.importorskip('numpy')
+    from breatheasy_assets.png import read_png
+
+    targets = [(str(tmp_path / f'icon-{size}.png'), size, size) for size in (16, 29, 58)]
+    NumpyRasterizer().render_many(SVG, targets)
+    for png_path, width, height in targets:
+        rgba = read_png(png_path)
+        assert rgba.shape == (height, width, 4)
+        assert rgba[..., :3].reshape(-1, 3).tolist()[0] == [0x1E, 0x3A, 0x5F]
@@ -0,0 +1,40 @@
+"""SVG optimizer: number rounding in compact path data and render-preserving round-trips"""
+
+import pytest
+
+from breatheasy_assets.svg_optimize import _round_numbers, optimize_svg
+
+
+@pytest.mark.parametrize('name, value, rounded', [
+    ('d', 'M1.004.5L10-0.001Z', 'M1 .5L10 0Z'),
+    ('d', 'M 10 20 L 30.25 -40 A25 25 0 0150 50 z', 'M10 20L30.25-40A25 25 0 0 1 50 50z'),
+    ('d', 'M1.5.5h.333333', 'M1.5.5h.33'),
+    ('points', '1.004.5 2,3', '1 .5 2 3'),
+    ('transform', 'translate(1.004.5)', 'translate(1 .5)'),
+    ('transform', 'translate(512, 512)', 'translate(512,512)'),
+])
+def test_rounding_keeps_compact_numbers_apart(name, value, rounded):
+    assert _round_numbers(name, value, 2) == rounded
+
+
+def test_optimizing_twice_changes_nothing(checkout):
+    from breatheasy_assets.heart import DESIGN
+
+    optimized = optimize_svg(DESIGN.base_svg)
+    assert len(optimized) < len(DESIGN.base_svg)
+    assert optimize_svg(optimized) == optimized
+
+
+@pytest.mark.parametrize('design', ['heart', 'orb'])
+def test_optimized_variants_render_like_the_originals(design, checkout):
+    np = pytest.importorskip('numpy')
+    from importlib import import_module
+
+    from breatheasy_assets.rasterizers import NumpyRasterizer
+
+    backend = NumpyRasterizer()
+    module = import_module(f'breatheasy_assets.{design}')
+    for raw, optimized in zip(module.DESIGN.variations(optimize=False), module.DESIGN.variations()):
+        before = backend.render_rgba(raw, 64, 64).astype(np.int16)
+        after = backend.render_rgba(optimized, 64, 64).astype(np.int16)
+        assert np.abs(before - after).max() <= 2
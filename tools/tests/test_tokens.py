@@ -0,0 +1,53 @@
+"""Design tokens: checkout-relative sources and palettes resolved on first use"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from breatheasy_assets import tokens
+
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(tokens.__file__)))
+
+
+def _run(argv, cwd):
+    environment = dict(os.environ, PYTHONPATH=PACKAGE_PARENT)
+    return subprocess.run([sys.executable, *argv], cwd=cwd, env=environment, capture_output=True, text=True)
+
+
+def test_sources_and_token_cache_share_the_checkout_root(checkout):
+    assert tokens.resolve('$oceanTeal').startswith('#')
+    assert (checkout / '.icon-cache' / 'tokens.json').exists()
+
+
+def test_importing_a_design_resolves_no_tokens(checkout):
+    result = _run(['-c', 'from breatheasy_assets import heart, orb'], checkout)
+    assert result.returncode == 0, result.stderr
+    assert not (checkout / '.icon-cache').exists()
+
+
+def test_outside_a_checkout_render_fails_with_one_line(tmp_path):
+    result = _run(['-m', 'breatheasy_assets', 'render', '--dry-run'], tmp_path)
+    assert result.returncode == 1
+    assert 'Design token source not found' in result.stdout
+    assert 'Traceback' not in result.stderr
+
+
+def test_repo_option_selects_the_checkout_root(checkout, tmp_path_factory):
+    elsewhere = tmp_path_factory.mktemp('elsewhere')
+    result = _run(['-m', 'breatheasy_assets', '--repo', str(checkout), 'render', '--dry-run'], elsewhere)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert (checkout / '.icon-cache' / 'tokens.json').exists()
+    assert os.listdir(elsewhere) == []
+
+
+def test_missing_source_is_an_error(tmp_path):
+    with pytest.raises(tokens.TokenError, match='not found'):
+        tokens.swift_files([str(tmp_path / 'missing')])
+
+
+def test_palette_resolves_references_on_first_use():
+    palette = tokens.palette({'$teal': '#000000'}, tokens={'teal': '#1E3A5F'})
+    assert 'table' not in vars(palette)
+    assert palette.apply('<stop stop-color="#1e3a5f"/>') == '<stop stop-color="#000000"/>'
@@ -0,0 +1,104 @@
+"""Asset catalog validator: sizes, the opaque App Store icon, Contents.json references and the pre-commit hook"""
+
+import json
+import struct
+import subprocess
+import zlib
+
+from breatheasy_assets.validate import PNG_SIGNATURE, install_hook, read_png_header, validate_set
+
+
+def _chunk(chunk_type, payload):
+    return (struct.pack('>I', len(payload)) + chunk_type + payload
+            + struct.pack('>I', zlib.crc32(chunk_type + payload) & 0xffffffff))
+
+
+def _png(size, color_type=2):
+    channels = {2: 3, 6: 4}[color_type]
+    raw = b''.join(b'\0' + b'\x80' * (size * channels) for _ in range(size))
+    return (PNG_SIGNATURE + _chunk(b'IHDR', struct.pack('>IIBBBBB', size, size, 8, color_type, 0, 0, 0))
+            + _chunk(b'IDAT', zlib.compress(raw)) + _chunk(b'IEND', b''))
+
+
+def _icon_set(tmp_path, images, files):
+    directory = tmp_path / 'AppIcon.appiconset'
+    directory.mkdir()
+    (directory / 'Contents.json').write_text(json.dumps({'images': images}))
+    for name, data in files.items():
+        (directory / name).write_bytes(data)
+    return str(directory)
+
+
+MARKETING = {'filename': 'icon-1024.png', 'idiom': 'universal', 'platform': 'ios', 'size': '1024x1024'}
+IPHONE = {'filename': 'icon-60@2x.png', 'idiom': 'iphone', 'scale': '2x', 'size': '60x60'}
+
+
+def test_header_reports_size_and_alpha(tmp_path):
+    path = tmp_path / 'icon.png'
+    path.write_bytes(_png(29, color_type=6))
+    header = read_png_header(str(path))
+    assert (header.width, header.height, header.color_type, header.has_alpha) == (29, 29, 6, True)
+
+
+def test_valid_icon_set(tmp_path):
+    directory = _icon_set(tmp_path, [MARKETING, IPHONE],
+                          {'icon-1024.png': _png(1024), 'icon-60@2x.png': _png(120, color_type=6)})
+    assert validate_set(directory) == ([], [], 2)
+
+
+def test_marketing_icon_with_alpha_is_an_error(tmp_path):
+    directory = _icon_set(tmp_path, [MARKETING], {'icon-1024.png': _png(1024, color_type=6)})
+    errors, _, _ = validate_set(directory)
+    assert len(errors) == 1 and 'alpha channel' in errors[0]
+
+
+def test_dark_appearance_may_have_alpha(tmp_path):
+    dark = dict(MARKETING, appearances=[{'appearance': 'luminosity', 'value': 'dark'}])
+    directory = _icon_set(tmp_path, [dark], {'icon-1024.png': _png(1024, color_type=6)})
+    assert validate_set(directory)[0] == []
+
+
+def test_wrong_pixel_size_is_an_error(tmp_path):
+    directory = _icon_set(tmp_path, [IPHONE], {'icon-60@2x.png': _png(180)})
+    errors, _, _ = validate_set(directory)
+    assert len(errors) == 1 and '180×180 px' in errors[0]
+
+
+def test_missing_and_unreferenced_files(tmp_path):
+    directory = _icon_set(tmp_path, [MARKETING], {'stray.png': _png(16)})
+    errors, warnings, checked = validate_set(directory)
+    assert 'missing' in errors[0] and 'not referenced' in warnings[0] and checked == 0
+
+
+def test_truncated_png_is_an_error(tmp_path):
+    directory = _icon_set(tmp_path, [IPHONE], {'icon-60@2x.png': _png(120)[:-12]})
+    errors, _, _ = validate_set(directory)
+    assert 'truncated' in errors[0]
+
+
+def _git(cwd, *argv):
+    subprocess.run(['git', *argv], cwd=cwd, check=True, capture_output=True)
+
+
+def test_hook_validates_the_catalog_it_was_installed_for(tmp_path, monkeypatch):
+    catalog = 'Art [v2].xcassets'
+    _git(tmp_path, 'init', '-q')
+    _git(tmp_path, 'config', 'core.hooksPath', 'githooks')
+    launcher = tmp_path / 'breatheasy-assets'
+    launcher.write_text('#!/bin/sh\necho "$@" > validated.txt\n')
+    launcher.chmod(0o755)
+    monkeypatch.chdir(tmp_path)
+    assert install_hook(catalog)
+
+    hook = tmp_path / 'githooks' / 'pre-commit'
+    (tmp_path / 'Art v.xcassets').mkdir()
+    (tmp_path / 'Art v.xcassets' / 'Contents.json').write_text('{}')
+    _git(tmp_path, 'add', 'Art v.xcassets')
+    subprocess.run([str(hook)], cwd=tmp_path, check=True)
+    assert not (tmp_path / 'validated.txt').exists()
+
+    (tmp_path / catalog).mkdir()
+    (tmp_path / catalog / 'Contents.json').write_text('{}')
+    _git(tmp_path, 'add', catalog)
+    subprocess.run([str(hook)], cwd=tmp_path, check=True)
+    assert (tmp_path / 'validated.txt').read_text() == f'validate --quiet {catalog}\n'